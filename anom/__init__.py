@@ -1,9 +1,13 @@
 # flake8: noqa
 from . import conditions, properties, properties as props
-from .adapter import Adapter, get_adapter, set_adapter
-from .model import Key, Model, Property, delete_multi, get_multi, put_multi, lookup_model_by_kind
+from .adapter import Adapter, AsyncAdapter, get_adapter, get_async_adapter, set_adapter, set_async_adapter
+from .context import IdentityMap, bind_context, get_identity_map, identity_map, submit_with_context
+from .model import (
+    Key, Model, Property, adelete_multi, aget_multi, aput_multi, delete_multi, get_multi, put_multi,
+    lookup_model_by_kind,
+)
 from .namespaces import get_namespace, namespace, set_default_namespace, set_namespace
 from .query import Query, Resultset, Page, Pages
-from .transaction import Transaction, TransactionError, RetriesExceeded, transactional
+from .transaction import AsyncTransaction, Transaction, TransactionError, RetriesExceeded, transactional
 
 __version__ = "0.7.0"
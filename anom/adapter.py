@@ -1,8 +1,17 @@
 from collections import namedtuple
 
+from .query import QueryOptions
+
 #: The global adapter instance.
 _adapter = None
 
+#: The global async adapter instance.
+_async_adapter = None
+
+#: The async adapter that wraps the global adapter when no async
+#: adapter has been set, along with the adapter it wraps.
+_wrapped_adapter = (None, None)
+
 
 def get_adapter():
     """Get the current global Adapter instance.
@@ -33,6 +42,44 @@ def set_adapter(adapter):
     return _adapter
 
 
+def get_async_adapter():
+    """Get the current global AsyncAdapter instance.
+
+    Returns:
+      AsyncAdapter: The global async adapter.  If no global async
+      adapter was set, this returns a
+      :class:`adapters.ThreadedAsyncAdapter` that wraps the current
+      global adapter.
+    """
+    global _wrapped_adapter
+    if _async_adapter is not None:
+        return _async_adapter
+
+    adapter, async_adapter = _wrapped_adapter
+    if adapter is not get_adapter():
+        from .adapters import ThreadedAsyncAdapter
+        adapter = get_adapter()
+        async_adapter = ThreadedAsyncAdapter(adapter)
+        _wrapped_adapter = adapter, async_adapter
+    return async_adapter
+
+
+def set_async_adapter(adapter):
+    """Set the global AsyncAdapter instance.
+
+    Parameters:
+      adapter(AsyncAdapter): The instance to set as the global async
+        adapter.  Pass ``None`` to go back to wrapping the global
+        adapter.
+
+    Returns:
+      AsyncAdapter: The input adapter.
+    """
+    global _async_adapter
+    _async_adapter = adapter
+    return _async_adapter
+
+
 class PutRequest(namedtuple("PutRequest", ("key", "unindexed", "properties"))):
     """Represents requests to persist individual Models.
 
@@ -48,7 +95,10 @@ class QueryResponse(namedtuple("QueryResponse", ("entities", "cursor"))):
     """Represents query responses from Datastore.
 
     Parameters:
-      entities(list[tuple[anom.Key, dict]]): The list of results.
+      entities(Sized iterable[tuple[anom.Key, dict]]): The results.
+        This may be a lazy sequence that can only be iterated over
+        once.  Each dict is handed over to the entity that is loaded
+        from it so adapters mustn't hold on to or reuse them.
       cursor(str): The cursor that points to the next page of results.
         This value must be url-safe.
     """
@@ -59,6 +109,37 @@ class Adapter:  # pragma: no cover
     how your :class:`Models<Model>` interact with the Datastore.
     """
 
+    def count(self, query, options):
+        """Count the number of entities that match a query.
+
+        The default implementation pages through the keys of all the
+        matching entities.  Adapters that can count entities more
+        efficiently should override this.
+
+        Parameters:
+          query(Query): The query to run.
+          options(QueryOptions): Options that determine how the data
+            should be fetched.
+
+        Returns:
+          int: The number of matching entities.
+        """
+        options = QueryOptions(query, **options).replace(keys_only=True)
+        count, limit = 0, options.limit
+        while True:
+            entities, options.cursor = self.query(query, options)
+            count += len(entities)
+
+            # Adapters may return pages that are shorter than the
+            # batch size before they run out of results so only empty
+            # pages mark the end of a query.
+            if not entities or not options.cursor or limit is not None and count >= limit:
+                break
+
+        if limit is not None:
+            return min(count, limit)
+        return count
+
     def delete_multi(self, keys):
         """Delete a list of entities from the Datastore by their
         respective keys.
@@ -130,3 +211,95 @@ class Adapter:  # pragma: no cover
     def current_transaction(self):
         "Transaction: The current Transaction or None."
         raise NotImplementedError
+
+
+class AsyncAdapter:  # pragma: no cover
+    """Abstract base class for asyncio Datastore adapters.  Async
+    adapters mirror the :class:`Adapter` interface, except that their
+    operations are coroutines.
+    """
+
+    async def count(self, query, options):
+        """Count the number of entities that match a query.
+
+        Parameters:
+          query(Query): The query to run.
+          options(QueryOptions): Options that determine how the data
+            should be fetched.
+
+        Returns:
+          int: The number of matching entities.
+        """
+        raise NotImplementedError
+
+    async def delete_multi(self, keys):
+        """Delete a list of entities from the Datastore by their
+        respective keys.
+
+        Parameters:
+          keys(list[anom.Key]): A list of datastore Keys to delete.
+        """
+        raise NotImplementedError
+
+    async def get_multi(self, keys):
+        """Get multiple entities from the Datastore by their
+        respective keys.
+
+        Parameters:
+          keys(list[anom.Key]): A list of datastore Keys to get.
+
+        Returns:
+          list[dict]: A list of dictionaries of data that can be loaded
+          into individual Models.  Entries for Keys that cannot be
+          found are going to be ``None``.
+        """
+        raise NotImplementedError
+
+    async def put_multi(self, requests):
+        """Store multiple entities into the Datastore.
+
+        Parameters:
+          requests(list[PutRequest]): A list of datastore requets to
+            persist a set of entities.
+
+        Returns:
+          list[anom.Key]: The list of full keys for each stored
+          entity.
+        """
+        raise NotImplementedError
+
+    async def query(self, query, options):
+        """Run a query against the datastore.
+
+        Parameters:
+          query(Query): The query to run.
+          options(QueryOptions): Options that determine how the data
+            should be fetched.
+
+        Returns:
+          QueryResponse: The query response from Datastore.
+        """
+        raise NotImplementedError
+
+    def transaction(self, propagation):
+        """Create a new AsyncTransaction object.
+
+        Parameters:
+          propagation(Transaction.Propagation): How the new
+            transaction should be propagated with regards to any
+            previously-created transactions.
+
+        Returns:
+          AsyncTransaction: The transaction.
+        """
+        raise NotImplementedError
+
+    @property
+    def in_transaction(self):
+        "bool: True if the current task is in an AsyncTransaction."
+        raise NotImplementedError
+
+    @property
+    def current_transaction(self):
+        "AsyncTransaction: The current task's AsyncTransaction or None."
+        raise NotImplementedError
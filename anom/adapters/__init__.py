@@ -1,6 +1,10 @@
 import warnings
 
+from .chunking_adapter import ChunkError, ChunkingAdapter  # noqa
 from .datastore_adapter import DatastoreAdapter  # noqa
+from .local_cache_adapter import LocalCacheAdapter  # noqa
+from .memory_adapter import InMemoryAdapter  # noqa
+from .threaded_async_adapter import ThreadedAsyncAdapter  # noqa
 
 try:
     from .memcache_adapter import MemcacheAdapter  # noqa
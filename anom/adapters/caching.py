@@ -0,0 +1,102 @@
+from .. import Adapter, Transaction
+
+
+class _CachingOuterTransaction(Transaction):
+    def __init__(self, adapter, ds_transaction):
+        self.adapter = adapter
+        self.ds_transaction = ds_transaction
+
+        self.batch = []
+        self.begin = self.ds_transaction.begin
+        self.rollback = self.ds_transaction.rollback
+
+    def _push_keys(self, keys):
+        self.batch.extend(keys)
+
+    def commit(self):
+        with self.adapter._bust(self.batch):
+            self.ds_transaction.commit()
+
+    def end(self):
+        self.ds_transaction.end()
+        self.adapter._transactions.remove(self)
+
+
+class _CachingInnerTransaction(Transaction):
+    def __init__(self, parent, ds_transaction):
+        self.parent = parent
+        self.ds_transaction = ds_transaction
+
+        self.begin = ds_transaction.begin
+        self.commit = ds_transaction.commit
+        self.rollback = ds_transaction.rollback
+
+    def end(self):
+        self.ds_transaction.end()
+        self.adapter._transactions.remove(self)
+
+    def __getattr__(self, name):
+        return getattr(self.parent, name)
+
+
+class _CachingAdapter(Adapter):
+    """Base class for adapters that cache entities on top of another
+    adapter.  Writes bust the cache as they're made and writes made
+    inside transactions bust it when the outermost transaction
+    commits.
+
+    Subclasses must set ``adapter`` and ``_transactions`` and
+    implement ``_bust``, a context manager that clears the given keys
+    from the cache around a write.
+    """
+
+    def delete_multi(self, keys):
+        if self.in_transaction:
+            self.current_transaction._push_keys(keys)
+            return self.adapter.delete_multi(keys)
+
+        with self._bust(keys):
+            return self.adapter.delete_multi(keys)
+
+    def put_multi(self, requests):
+        # Partial keys' cache doesn't need to be cleared since they
+        # can't have been already set so we have to collect the full
+        # keys and pass them to the transaction.
+        full_keys = [request.key for request in requests if not request.key.is_partial]
+        if self.in_transaction:
+            self.current_transaction._push_keys(full_keys)
+            return self.adapter.put_multi(requests)
+
+        with self._bust(full_keys):
+            return self.adapter.put_multi(requests)
+
+    def transaction(self, propagation):
+        ds_transaction = self.adapter.transaction(propagation)
+
+        if propagation == Transaction.Propagation.Independent:
+            transaction = _CachingOuterTransaction(self, ds_transaction)
+            self._transactions.append(transaction)
+            return transaction
+
+        elif propagation == Transaction.Propagation.Nested:
+            if self._transactions:
+                transaction = _CachingInnerTransaction(self.current_transaction, ds_transaction)
+            else:
+                transaction = _CachingOuterTransaction(self, ds_transaction)
+
+            self._transactions.append(transaction)
+            return transaction
+
+        else:  # pragma: no cover
+            raise ValueError(f"Invalid propagation option {propagation!r}.")
+
+    @property
+    def in_transaction(self):
+        return bool(self._transactions)
+
+    @property
+    def current_transaction(self):
+        return self._transactions[-1]
+
+    def _bust(self, keys):  # pragma: no cover
+        raise NotImplementedError
@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import Adapter
+from ..context import submit_with_context
+
+
+class ChunkError(Exception):
+    """Raised by :class:`ChunkingAdapter` when one or more chunks of
+    a batch operation fail.  Chunks that succeeded are not rolled
+    back.
+
+    Parameters:
+      errors(list[tuple[int, Exception]]): The offset of the first
+        item in each failed chunk along with the exception it raised.
+      results(list): The merged results of the operation.  Entries
+        belonging to failed chunks are ``None``.
+    """
+
+    def __init__(self, errors, results):
+        self.errors = errors
+        self.results = results
+
+    def __str__(self):  # pragma: no cover
+        return "; ".join(f"chunk at offset {offset} failed: {error!r}" for offset, error in self.errors)
+
+
+class ChunkingAdapter(Adapter):
+    """Splits large delete, get and put operations into chunks and
+    runs them concurrently on top of another adapter.  Results are
+    merged back in input order.
+
+    Note:
+      Chunks of operations that run inside a transaction are part of
+      that transaction.
+
+    Chunks run on a thread pool that belongs to the adapter.  Call
+    :meth:`close` or use the adapter as a context manager to shut it
+    down once the adapter is no longer needed.
+
+    Parameters:
+      adapter(Adapter): The adapter to wrap.
+      chunk_size(int, optional): The maximum number of keys or
+        entities to pass to the wrapped adapter per call.  Defaults
+        to ``500``, Datastore's limit for mutations.
+      max_workers(int, optional): The maximum number of chunks to
+        run concurrently.  Defaults to ``8``.
+    """
+
+    def __init__(self, adapter, *, chunk_size=500, max_workers=8):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        self.adapter = adapter
+        self.chunk_size = chunk_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        self.count = self.adapter.count
+        self.query = self.adapter.query
+        self.transaction = self.adapter.transaction
+
+    def close(self):
+        "Shut down the thread pool that chunks run on."
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def delete_multi(self, keys):
+        self._run(self.adapter.delete_multi, keys)
+
+    def get_multi(self, keys):
+        return self._run(self.adapter.get_multi, keys)
+
+    def put_multi(self, requests):
+        return self._run(self.adapter.put_multi, requests)
+
+    @property
+    def in_transaction(self):
+        return self.adapter.in_transaction
+
+    @property
+    def current_transaction(self):
+        return self.adapter.current_transaction
+
+    def _run(self, fn, items):
+        offsets = range(0, len(items), self.chunk_size)
+        if len(offsets) <= 1:
+            return fn(items)
+
+        # Chunks run with a copy of the caller's context so that they
+        # join the caller's transaction, if any.
+        futures = [
+            (offset, submit_with_context(self.executor, fn, items[offset:offset + self.chunk_size]))
+            for offset in offsets
+        ]
+        results, errors = [None] * len(items), []
+        for offset, future in futures:
+            try:
+                chunk_results = future.result()
+            except Exception as e:
+                errors.append((offset, e))
+                continue
+
+            if chunk_results is not None:
+                results[offset:offset + len(chunk_results)] = chunk_results
+
+        if errors:
+            raise ChunkError(errors, results)
+
+        return results
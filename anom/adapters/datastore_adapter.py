@@ -1,12 +1,13 @@
 import logging
 
-from functools import partial
+from collections import defaultdict
+from functools import lru_cache, partial
 from gcloud_requests import DatastoreRequestsProxy, enter_transaction, exit_transaction
 from google.cloud import datastore
-from threading import local
 
-from .. import Adapter, Key
+from .. import Adapter, Key, get_namespace
 from ..adapter import QueryResponse
+from ..context import TransactionStack
 from ..model import KeyLike
 from ..transaction import Transaction, TransactionFailed
 
@@ -14,14 +15,15 @@ _logger = logging.getLogger(__name__)
 
 
 class _DeferredKey(KeyLike):
-    def __init__(self, ds_entity):
+    def __init__(self, adapter, ds_entity):
+        self.adapter = adapter
         self.ds_entity = ds_entity
         self._value = None
 
     @property
     def _anom_key(self):
         if self._value is None or self._value.is_partial:
-            self._value = DatastoreAdapter._convert_key_from_datastore(self.ds_entity.key)
+            self._value = self.adapter._convert_key_from_datastore(self.ds_entity.key)
         return self._value
 
     def __getattr__(self, name):
@@ -31,6 +33,31 @@ class _DeferredKey(KeyLike):
         return repr(self._anom_key)
 
 
+class _QueryEntities:
+    # A sized iterable over the entities in a set of result pages.
+    # Pages keep the raw protobufs around and entities are only
+    # converted as they're iterated over so a batch of results is
+    # never fully materialized.
+
+    def __init__(self, adapter, pages, keys_only):
+        self.adapter = adapter
+        self.pages = pages
+        self.keys_only = keys_only
+        self.num_items = sum(page.num_items for page in pages)
+
+    def __len__(self):
+        return self.num_items
+
+    def __iter__(self):
+        convert_key, prepare_to_load = self.adapter._convert_key_from_datastore, self.adapter._prepare_to_load
+        for page in self.pages:
+            for entity in page:
+                if self.keys_only:
+                    yield convert_key(entity.key), None
+                else:
+                    yield convert_key(entity.key), prepare_to_load(entity)
+
+
 class _DatastoreOuterTransaction(Transaction):
     def __init__(self, adapter):
         self.adapter = adapter
@@ -92,11 +119,15 @@ class DatastoreAdapter(Adapter):
       credentials(datastore.Credentials): The OAuth2 Credentials to
         use for this client.  If not passed, falls back to the default
         inferred from the environment.
+      key_cache_size(int, optional): The maximum number of key
+        conversions to memoize in each direction.  Set this to ``0``
+        to disable memoization.  Defaults to ``4096``.
     """
 
-    _state = local()
+    #: The current stack of Transactions.
+    _transactions = TransactionStack("anom.datastore_transactions")
 
-    def __init__(self, *, project=None, credentials=None):
+    def __init__(self, *, project=None, credentials=None, key_cache_size=4096):
         self.project = project
         self.credentials = credentials
         self.proxy = DatastoreRequestsProxy(credentials=credentials)
@@ -107,16 +138,34 @@ class DatastoreAdapter(Adapter):
             _use_grpc=False,
         )
 
-    @property
-    def _transactions(self):
-        "list[Transaction]: The current stack of Transactions."
-        transactions = getattr(self._state, "transactions", None)
-        if transactions is None:
-            transactions = self._state.transactions = []
-        return transactions
+        # The same keys, and especially the same parents, tend to be
+        # converted over and over again so conversions are memoized.
+        self._cached_key_to_datastore = lru_cache(maxsize=key_cache_size)(self._key_to_datastore)
+        self._key_from_path = lru_cache(maxsize=key_cache_size)(self._key_from_path)
+
+    def count(self, query, options):
+        # Pages expose their item counts, so entities can be counted
+        # without converting any of the keys in the response.
+        result_iterator = self._convert_query_to_datastore(query, keys_only=True).fetch(
+            limit=options.limit,
+            offset=options.offset,
+            start_cursor=options.cursor,
+        )
+
+        return sum(page.num_items for page in result_iterator.pages)
 
     def delete_multi(self, keys):
-        self.client.delete_multi(self._convert_key_to_datastore(key) for key in keys)
+        datastore_keys = [self._convert_key_to_datastore(key) for key in keys]
+        if self.in_transaction:
+            # The client keeps track of its current transaction
+            # per-thread so mutations are added to the transaction
+            # directly in case this is running on another thread.
+            ds_transaction = self.current_transaction.ds_transaction
+            for datastore_key in datastore_keys:
+                ds_transaction.delete(datastore_key)
+            return
+
+        self.client.delete_multi(datastore_keys)
 
     def get_multi(self, keys):
         get_multi = self.client.get_multi
@@ -138,52 +187,46 @@ class DatastoreAdapter(Adapter):
             for key in missing:  # pragma: no cover
                 request_keys.remove(key)
 
+        # Map each key to every position it was requested at so that
+        # results can be reassembled in a single pass.
+        positions = defaultdict(list)
+        for index, datastore_key in enumerate(datastore_keys):
+            positions[datastore_key].append(index)
+
         results = [None] * len(keys)
         for entity in found:
-            index = datastore_keys.index(entity.key)
-            results[index] = self._prepare_to_load(entity)
+            data = self._prepare_to_load(entity)
+            for index in positions[entity.key]:
+                results[index] = data
 
         return results
 
     def put_multi(self, requests):
         entities = [self._prepare_to_store(*request) for request in requests]
-        self.client.put_multi(entities)
         if self.in_transaction:
-            return [_DeferredKey(entity) for entity in entities]
+            ds_transaction = self.current_transaction.ds_transaction
+            for entity in entities:
+                ds_transaction.put(entity)
+            return [_DeferredKey(self, entity) for entity in entities]
+
+        self.client.put_multi(entities)
         return [self._convert_key_from_datastore(entity.key) for entity in entities]
 
     def query(self, query, options):
-        ancestor = None
-        if query.ancestor:
-            ancestor = self._convert_key_to_datastore(query.ancestor)
-
-        filters = self._convert_filters_to_datastore(query.filters)
-        query = self.client.query(
-            kind=query.kind,
-            ancestor=ancestor,
-            namespace=query.namespace,
-            projection=query.projection,
-            order=query.orders,
-            filters=filters,
-        )
-        if options.keys_only:
-            query.keys_only()
-
+        query = self._convert_query_to_datastore(query, keys_only=options.keys_only)
         result_iterator = query.fetch(
             limit=options.batch_size,
             offset=options.offset,
             start_cursor=options.cursor,
         )
 
-        entities = []
-        for entity in result_iterator:
-            key, data = self._convert_key_from_datastore(entity.key), None
-            if not options.keys_only:
-                data = self._prepare_to_load(entity)
-
-            entities.append((key, data))
-
-        return QueryResponse(entities=entities, cursor=result_iterator.next_page_token)
+        # All of the pages in the batch are fetched up front so that
+        # the cursor is known, but their entities are converted lazily.
+        pages = list(result_iterator.pages)
+        return QueryResponse(
+            entities=_QueryEntities(self, pages, options.keys_only),
+            cursor=result_iterator.next_page_token,
+        )
 
     def transaction(self, propagation):
         if propagation == Transaction.Propagation.Independent:
@@ -211,6 +254,25 @@ class DatastoreAdapter(Adapter):
     def current_transaction(self):
         return self._transactions[-1]
 
+    def _convert_query_to_datastore(self, query, *, keys_only=False):
+        ancestor = None
+        if query.ancestor:
+            ancestor = self._convert_key_to_datastore(query.ancestor)
+
+        filters = self._convert_filters_to_datastore(query.filters)
+        datastore_query = self.client.query(
+            kind=query.kind,
+            ancestor=ancestor,
+            namespace=query.namespace,
+            projection=query.projection,
+            order=query.orders,
+            filters=filters,
+        )
+        if keys_only:
+            datastore_query.keys_only()
+
+        return datastore_query
+
     def _convert_filters_to_datastore(self, filters):
         for property_filter in filters:
             prop, op, value = property_filter
@@ -220,11 +282,32 @@ class DatastoreAdapter(Adapter):
             yield prop, op, value
 
     def _convert_key_to_datastore(self, anom_key):
+        # Only real keys are memoized since deferred keys change
+        # once their transaction is committed.
+        if isinstance(anom_key, Key):
+            return self._cached_key_to_datastore(anom_key)
+        return self._key_to_datastore(anom_key)
+
+    def _key_to_datastore(self, anom_key):
         return self.client.key(*anom_key.path, namespace=anom_key.namespace or None)
 
-    @staticmethod
-    def _convert_key_from_datastore(datastore_key):
-        return Key.from_path(*datastore_key.flat_path, namespace=datastore_key.namespace)
+    def _convert_key_from_datastore(self, datastore_key):
+        namespace = datastore_key.namespace
+        if namespace is None:
+            namespace = get_namespace()
+
+        return self._key_from_path(datastore_key.flat_path, namespace)
+
+    def _key_from_path(self, flat_path, namespace):
+        # Paths that come from Datastore are always valid so keys are
+        # built without validation, reusing memoized parents.
+        if len(flat_path) % 2:
+            parent_path, kind, id_or_name = flat_path[:-1], flat_path[-1], None
+        else:
+            parent_path, kind, id_or_name = flat_path[:-2], flat_path[-2], flat_path[-1]
+
+        parent = self._key_from_path(parent_path, namespace) if parent_path else None
+        return Key._make(kind, id_or_name, parent, namespace)
 
     def _prepare_to_store(self, key, unindexed, data):
         datastore_key = self._convert_key_to_datastore(key)
@@ -0,0 +1,141 @@
+import sys
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+
+from ..context import TransactionStack
+from .caching import _CachingAdapter
+from .memory_adapter import _copy_data
+
+
+class LocalCacheAdapter(_CachingAdapter):
+    """Caches entities in process memory on top of another adapter for
+    delete, get and put operations.  Entities are evicted in least
+    recently used order once the cache grows past its size budget.
+
+    This can be layered on top of a :class:`MemcacheAdapter` to form
+    a two-tier cache.
+
+    Note:
+      Writes only invalidate the cache of the process that made them.
+      Use short TTLs for kinds that are written to by other processes.
+
+    Parameters:
+      adapter(Adapter): The adapter to wrap.
+      max_size(int, optional): The approximate maximum number of bytes
+        that cached entities may take up.  Defaults to 64MiB.
+      ttl(float, optional): The number of seconds entities are cached
+        for.  Defaults to ``60``.
+      ttls(dict, optional): A mapping from kinds or models to the
+        number of seconds entities of that kind are cached for.  Kinds
+        whose TTL is ``0`` aren't cached.
+    """
+
+    #: The current stack of Transactions.
+    _transactions = TransactionStack("anom.local_cache_transactions")
+
+    def __init__(self, adapter, *, max_size=64 * 1024 * 1024, ttl=60, ttls=None):
+        self.adapter = adapter
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = {getattr(kind, "_kind", kind): ttl for kind, ttl in (ttls or {}).items()}
+
+        self.count = self.adapter.count
+        self.query = self.adapter.query
+
+        self._lock = Lock()
+        self._entities = OrderedDict()
+        self._size = 0
+        self._generation = 0
+
+    def clear(self):
+        "Remove all the entities from the cache."
+        with self._lock:
+            self._entities.clear()
+            self._size = 0
+            self._generation += 1
+
+    def get_multi(self, keys):
+        if self.in_transaction:
+            return self.adapter.get_multi(keys)
+
+        found, missing, now = [None] * len(keys), {}, time.monotonic()
+        with self._lock:
+            generation = self._generation
+            for index, key in enumerate(keys):
+                item = self._entities.get(key)
+                if item is None or item[0] <= now:
+                    missing.setdefault(key, []).append(index)
+                    continue
+
+                self._entities.move_to_end(key)
+                found[index] = _copy_data(item[2])
+
+        if not missing:
+            return found
+
+        missing_keys = list(missing)
+        datas = self.adapter.get_multi(missing_keys)
+        for key, data in zip(missing_keys, datas):
+            if data is not None:
+                for index in missing[key]:
+                    found[index] = _copy_data(data)
+
+        self._fill(generation, missing_keys, datas, now)
+        return found
+
+    @contextmanager
+    def _bust(self, keys):
+        # Bumping the generation both before and after the write
+        # prevents concurrent reads from filling the cache with data
+        # from before the write.
+        self._evict(keys)
+        try:
+            yield
+        finally:
+            self._evict(keys)
+
+    def _evict(self, keys):
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                item = self._entities.pop(key, None)
+                if item is not None:
+                    self._size -= item[1]
+
+    def _fill(self, generation, keys, datas, now):
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            for key, data in zip(keys, datas):
+                ttl = self.ttls.get(key.kind, self.ttl)
+                if data is None or not ttl:
+                    continue
+
+                size = _estimate_size(data)
+                if size > self.max_size:
+                    continue
+
+                item = self._entities.pop(key, None)
+                if item is not None:
+                    self._size -= item[1]
+
+                self._entities[key] = (now + ttl, size, data)
+                self._size += size
+
+            while self._size > self.max_size:
+                _, (_, size, _) = self._entities.popitem(last=False)
+                self._size -= size
+
+
+def _estimate_size(data):
+    size = sys.getsizeof(data)
+    for name, value in data.items():
+        size += sys.getsizeof(name) + sys.getsizeof(value)
+        if isinstance(value, list):
+            size += sum(sys.getsizeof(item) for item in value)
+
+    return size
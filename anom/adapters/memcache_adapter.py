@@ -1,53 +1,17 @@
 import pylibmc
+import time
 import uuid
 
+from collections import defaultdict
 from contextlib import contextmanager
 from hashlib import md5
-from threading import local
 
-from .. import Adapter, Transaction
+from ..context import TransactionStack
 from ..properties import Msgpack
+from .caching import _CachingAdapter
 
 
-class _MemcacheOuterTransaction(Transaction):
-    def __init__(self, adapter, ds_transaction):
-        self.adapter = adapter
-        self.ds_transaction = ds_transaction
-
-        self.batch = []
-        self.begin = self.ds_transaction.begin
-        self.rollback = self.ds_transaction.rollback
-
-    def _push_keys(self, keys):
-        self.batch.extend(keys)
-
-    def commit(self):
-        with self.adapter._bust(self.batch):
-            self.ds_transaction.commit()
-
-    def end(self):
-        self.ds_transaction.end()
-        self.adapter._transactions.remove(self)
-
-
-class _MemcacheInnerTransaction(Transaction):
-    def __init__(self, parent, ds_transaction):
-        self.parent = parent
-        self.ds_transaction = ds_transaction
-
-        self.begin = ds_transaction.begin
-        self.commit = ds_transaction.commit
-        self.rollback = ds_transaction.rollback
-
-    def end(self):
-        self.ds_transaction.end()
-        self.adapter._transactions.remove(self)
-
-    def __getattr__(self, name):
-        return getattr(self.parent, name)
-
-
-class MemcacheAdapter(Adapter):
+class MemcacheAdapter(_CachingAdapter):
     """Transparently adds memcached-based strongly-consistent caching
     on top of another adapter for delete, get and put operations.
 
@@ -59,10 +23,17 @@ class MemcacheAdapter(Adapter):
         with.  Defaults to ``anom``.
     """
 
-    _state = local()
+    #: The current stack of Transactions.
+    _transactions = TransactionStack("anom.memcache_transactions")
 
     _lock_prefix = b"LOCK@"
     _lock_timeout = 60  # seconds
+    _fill_timeout = 2  # seconds
+
+    #: Busts keep their keys locked for this long after writing.  It
+    #: must be comfortably longer than _fill_timeout since memcached
+    #: may expire keys up to a second early.
+    _unlock_timeout = 5  # seconds
     _item_timeout = 86400  # one day in seconds
 
     def __init__(self, client, adapter, *, prefix="anom"):
@@ -70,30 +41,21 @@ class MemcacheAdapter(Adapter):
         self.adapter = adapter
         self.prefix = prefix
 
+        self.count = self.adapter.count
         self.query = self.adapter.query
 
-    @property
-    def _transactions(self):
-        "list[Transaction]: The current stack of Transactions."
-        transactions = getattr(self._state, "transactions", None)
-        if transactions is None:
-            transactions = self._state.transactions = []
-        return transactions
-
-    def delete_multi(self, keys):
-        if self.in_transaction:
-            self.current_transaction._push_keys(keys)
-            return self.adapter.delete_multi(keys)
-
-        with self._bust(keys):
-            return self.adapter.delete_multi(keys)
-
     def get_multi(self, keys):
         if self.in_transaction:
             return self.adapter.get_multi(keys)
 
+        # Map each key to every position it was requested at so that
+        # results can be reassembled in a single pass.
+        positions = defaultdict(list)
+        for index, anom_key in enumerate(keys):
+            positions[anom_key].append(index)
+
         # Get all the cached keys.
-        pairs = {self._convert_key_to_memcache(key): key for key in keys}
+        pairs = {self._convert_key_to_memcache(key): key for key in positions}
         with self.client_pool.reserve() as client:
             mapping = client.get_multi(pairs.keys())
 
@@ -108,62 +70,23 @@ class MemcacheAdapter(Adapter):
                 missing.append(anom_key)
                 continue
 
-            index = keys.index(anom_key)
-            found[index] = Msgpack._loads(data)
+            entity = Msgpack._loads(data)
+            for index in positions[anom_key]:
+                found[index] = entity
 
-        # Get and cache missing keys from Datastore.
-        ds_results = self.adapter.get_multi(missing)
-        for anom_key, entity in zip(missing, ds_results):
-            index = keys.index(anom_key)
-            found[index] = entity
-            if entity is None:
-                continue
-
-            key = self._convert_key_to_memcache(anom_key)
-            data = Msgpack._dumps(entity)
-            self._cache(key, data)
-
-        return found
-
-    def put_multi(self, requests):
-        # Partial keys' cache doesn't need to be cleared since they
-        # can't have been already set so we have to collect the full
-        # keys and pass them to the transaction.
-        full_keys = [request.key for request in requests if not request.key.is_partial]
-        if self.in_transaction:
-            self.current_transaction._push_keys(full_keys)
-            return self.adapter.put_multi(requests)
-
-        with self._bust(full_keys):
-            return self.adapter.put_multi(requests)
-
-    def transaction(self, propagation):
-        ds_transaction = self.adapter.transaction(propagation)
-
-        if propagation == Transaction.Propagation.Independent:
-            transaction = _MemcacheOuterTransaction(self, ds_transaction)
-            self._transactions.append(transaction)
-            return transaction
-
-        elif propagation == Transaction.Propagation.Nested:
-            if self._transactions:
-                transaction = _MemcacheInnerTransaction(self.current_transaction, ds_transaction)
-            else:
-                transaction = _MemcacheOuterTransaction(self, ds_transaction)
-
-            self._transactions.append(transaction)
-            return transaction
+        # Get missing keys from Datastore and cache them.
+        with self._fill(missing) as fill:
+            ds_results = self.adapter.get_multi(missing)
+            for anom_key, entity in zip(missing, ds_results):
+                if entity is None:
+                    continue
 
-        else:  # pragma: no cover
-            raise ValueError(f"Invalid propagation option {propagation!r}.")
+                for index in positions[anom_key]:
+                    found[index] = entity
 
-    @property
-    def in_transaction(self):
-        return bool(self._transactions)
+                fill[anom_key] = Msgpack._dumps(entity)
 
-    @property
-    def current_transaction(self):
-        return self._transactions[-1]
+        return found
 
     def _convert_key_to_memcache(self, anom_key):
         digest = md5(str(anom_key).encode("utf-8")).hexdigest()
@@ -185,34 +108,33 @@ class MemcacheAdapter(Adapter):
             yield
 
         finally:
-            # Finally, delete the keys from Memcache.
+            # Finally, keep the keys locked for a little while longer
+            # rather than deleting them.  Fills only ever add keys, so
+            # this stops fills that read data from before the write
+            # from caching it.
             with self.client_pool.reserve() as client:
-                client.delete_multi(memcache_keys)
+                client.set_multi(memcache_pairs, self._unlock_timeout)
 
-    def _cache(self, key, data):
-        current_lock = self._lock_value()
+    @contextmanager
+    def _fill(self, keys):
+        # Collect the data that should be cached for each key.
+        datas = {}
+        started_at = time.monotonic()
+        yield datas
+
+        # Fills that took longer than busts keep their keys locked
+        # for after writing could have read data from before a
+        # concurrent write so they are dropped.
+        if not datas or time.monotonic() - started_at > self._fill_timeout:
+            return
+
+        # Keys that already have a value are either locked by a bust
+        # or have been filled by someone else, so adding them leaves
+        # those values alone.  pylibmc can't gets/cas multiple keys at
+        # once so this takes the place of a per-key CAS check.
+        memcache_pairs = {self._convert_key_to_memcache(key): data for key, data in datas.items()}
         with self.client_pool.reserve() as client:
-            while True:
-                value, cid = client.gets(key)
-                # If there is a lock value in Memcache that is
-                # different from our own we have to bail.
-                if value and value.startswith(self._lock_prefix) and value != current_lock:
-                    return
-
-                # If there isn't a value at all, we have to add one
-                # and try again.
-                if cid is None:
-                    client.add(key, current_lock, self._lock_timeout)
-                    continue
-
-                try:
-                    return client.cas(key, data, cid, self._item_timeout)
-
-                # There is a small chance that between the `gets` and
-                # "now" the key will have been deleted by a concurrent
-                # process, so we account for that possibility here.
-                except pylibmc.NotFound:  # pragma: no cover
-                    return
+            client.add_multi(memcache_pairs, self._item_timeout)
 
     def _lock_value(self):
         random_value = str(uuid.uuid4()).encode("ascii")
@@ -0,0 +1,400 @@
+import base64
+import json
+import logging
+
+from datetime import datetime, timedelta, timezone
+from functools import total_ordering
+from itertools import chain, count
+from operator import itemgetter
+from threading import RLock
+
+from .. import Adapter, Key
+from ..adapter import QueryResponse
+from ..context import TransactionStack
+from ..transaction import Transaction, TransactionFailed
+
+_logger = logging.getLogger(__name__)
+
+#: The UNIX epoch.  Used when encoding datetimes inside cursors.
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class _InMemoryOuterTransaction(Transaction):
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.reads = {}
+        self.writes = {}
+
+    def begin(self):
+        _logger.debug("Beginning transaction...")
+
+    def commit(self):
+        _logger.debug("Committing transaction...")
+        self.adapter._commit(self)
+
+    def rollback(self):
+        _logger.debug("Rolling transaction back...")
+        self.reads.clear()
+        self.writes.clear()
+
+    def end(self):
+        _logger.debug("Ending transaction...")
+        self.adapter._transactions.remove(self)
+
+
+class _InMemoryInnerTransaction(Transaction):
+    def __init__(self, parent):
+        self.parent = parent
+
+    def begin(self):
+        _logger.debug("Beginning inner transaction...")
+
+    def commit(self):
+        _logger.debug("Committing inner transaction...")
+
+    def rollback(self):
+        _logger.debug("Rolling back inner transaction...")
+
+    def end(self):
+        _logger.debug("Ending inner transaction...")
+        self.adapter._transactions.remove(self)
+
+    def __getattr__(self, name):
+        return getattr(self.parent, name)
+
+
+class InMemoryAdapter(Adapter):
+    """An adapter that stores entities in process memory.  Useful for
+    tests and benchmarks that shouldn't depend on the Datastore
+    emulator.
+
+    Queries support filters, orders, ancestors, namespaces,
+    projections, offsets and cursors.  Transactions are optimistic:
+    committing a transaction fails if any of the entities it read
+    were modified after they were read.
+
+    Note:
+      Data is not shared between processes or adapter instances.
+    """
+
+    #: The current stack of Transactions.
+    _transactions = TransactionStack("anom.memory_transactions")
+
+    def __init__(self):
+        self._lock = RLock()
+        self._entities = {}
+        self._versions = {}
+        self._ids = count(1)
+
+    def delete_multi(self, keys):
+        if self.in_transaction:
+            writes = self.current_transaction.writes
+            for key in keys:
+                writes[key] = None
+
+            return
+
+        with self._lock:
+            for key in keys:
+                self._write(key, None)
+
+    def get_multi(self, keys):
+        with self._lock:
+            if self.in_transaction:
+                reads = self.current_transaction.reads
+                for key in keys:
+                    reads.setdefault(key, self._versions.get(key, 0))
+
+            results = []
+            for key in keys:
+                record = self._entities.get(key)
+                if record is None:
+                    results.append(None)
+                else:
+                    results.append(_copy_data(record[0]))
+
+            return results
+
+    def put_multi(self, requests):
+        keys, records = [], []
+        with self._lock:
+            for request in requests:
+                key = request.key
+                if key.is_partial:
+                    key = Key(key.kind, next(self._ids), parent=key.parent, namespace=key.namespace)
+
+                data = {name: _prepare_to_store_value(value) for name, value in request.properties}
+                keys.append(key)
+                records.append((data, frozenset(request.unindexed)))
+
+            if self.in_transaction:
+                self.current_transaction.writes.update(zip(keys, records))
+                return keys
+
+            for key, record in zip(keys, records):
+                self._write(key, record)
+
+        return keys
+
+    def count(self, query, options):
+        entities = self._select(query, options)
+        if options.limit is not None:
+            return min(len(entities), options.limit)
+        return len(entities)
+
+    def query(self, query, options):
+        entities = self._select(query, options)[:options.batch_size]
+        if entities:
+            cursor = _encode_cursor(entities[-1][1])
+        else:
+            cursor = options.cursor
+
+        results = []
+        for _, _, key, data in entities:
+            if options.keys_only:
+                data = None
+            elif query.projection:
+                data = {name: data[name] for name in query.projection}
+            else:
+                data = _copy_data(data)
+
+            results.append((key, data))
+
+        return QueryResponse(entities=results, cursor=cursor)
+
+    def transaction(self, propagation):
+        if propagation == Transaction.Propagation.Independent:
+            transaction = _InMemoryOuterTransaction(self)
+            self._transactions.append(transaction)
+            return transaction
+
+        elif propagation == Transaction.Propagation.Nested:
+            if self._transactions:
+                transaction = _InMemoryInnerTransaction(self.current_transaction)
+            else:
+                transaction = _InMemoryOuterTransaction(self)
+
+            self._transactions.append(transaction)
+            return transaction
+
+        else:  # pragma: no cover
+            raise ValueError(f"Invalid propagation option {propagation!r}.")
+
+    @property
+    def in_transaction(self):
+        return bool(self._transactions)
+
+    @property
+    def current_transaction(self):
+        return self._transactions[-1]
+
+    def _select(self, query, options):
+        cursor = _decode_cursor(options.cursor)
+        with self._lock:
+            entities = []
+            for key, (data, unindexed) in self._entities.items():
+                if _matches(query, key, data, unindexed):
+                    position = _position(key, data, query.orders)
+                    entities.append((_sortable(position, query.orders), position, key, data))
+
+        entities.sort(key=itemgetter(0))
+        if cursor is None:
+            return entities[options.offset or 0:]
+
+        cursor = _sortable(cursor, query.orders)
+        return [entity for entity in entities if entity[0] > cursor]
+
+    def _commit(self, transaction):
+        with self._lock:
+            for key, version in transaction.reads.items():
+                if self._versions.get(key, 0) != version:
+                    _logger.debug("Transaction failed due to contention on %r.", key)
+                    raise TransactionFailed(f"Entity {key!r} was modified concurrently.")
+
+            for key, record in transaction.writes.items():
+                self._write(key, record)
+
+    def _write(self, key, record):
+        if record is None:
+            self._entities.pop(key, None)
+        else:
+            self._entities[key] = record
+
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+
+#: The relative order of value types.  Values of different types are
+#: never equal to each other and they sort according to this order.
+_type_order = {
+    type(None): 0,
+    bool: 1,
+    int: 2,
+    float: 2,
+    datetime: 3,
+    bytes: 4,
+}
+
+
+def _value_order(value):
+    # Datastore indexes strings by their UTF-8 representation so
+    # encoded String properties can be compared against str values.
+    if isinstance(value, str):
+        return (4, value.encode("utf-8"))
+
+    elif isinstance(value, Key):
+        return (5, _key_order(value))
+
+    return (_type_order.get(type(value), 6), value)
+
+
+def _key_order(key):
+    return tuple(_value_order(part) for part in key.path)
+
+
+def _matches(query, key, data, unindexed):
+    if query.kind is not None and key.kind != query.kind:
+        return False
+
+    if (key.namespace or "") != (query.namespace or ""):
+        return False
+
+    if query.ancestor is not None:
+        ancestor_path = query.ancestor.path
+        if key.path[:len(ancestor_path)] != ancestor_path:
+            return False
+
+    # Entities that have no indexed value for a property are never
+    # returned by queries that filter, sort or project on it.
+    for name in chain(query.projection, _order_names(query.orders), (name for name, _, _ in query.filters)):
+        if name not in data or name in unindexed or data[name] == []:
+            return False
+
+    for name, op, value in query.filters:
+        values = data[name]
+        if not isinstance(values, list):
+            values = [values]
+
+        target = _value_order(value)
+        if not any(_compare(_value_order(v), op, target) for v in values):
+            return False
+
+    return True
+
+
+def _compare(value, op, target):
+    if op == "=":
+        return value == target
+
+    # Values can only be range-compared to values of the same type.
+    if value[0] != target[0]:
+        return False
+
+    if op == "<":
+        return value < target
+    elif op == "<=":
+        return value <= target
+    elif op == ">":
+        return value > target
+    elif op == ">=":
+        return value >= target
+    else:
+        raise ValueError(f"Invalid filter operator {op!r}.")
+
+
+def _order_names(orders):
+    return [order[1:] if order.startswith("-") else order for order in orders]
+
+
+def _position(key, data, orders):
+    position = []
+    for order in orders:
+        descending = order.startswith("-")
+        value = data[order[1:] if descending else order]
+        if isinstance(value, list):
+            values = [_value_order(v) for v in value]
+            position.append(max(values) if descending else min(values))
+        else:
+            position.append(_value_order(value))
+
+    # Entities are always ordered by key last.
+    position.append(_key_order(key))
+    return tuple(position)
+
+
+def _sortable(position, orders):
+    return tuple(
+        _Descending(value) if order.startswith("-") else value
+        for order, value in zip(orders, position)
+    ) + position[len(orders):]
+
+
+@total_ordering
+class _Descending:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def _prepare_to_store_value(value):
+    if isinstance(value, Key):
+        return value
+
+    elif isinstance(value, (tuple, list)):
+        return [_prepare_to_store_value(v) for v in value]
+    return value
+
+
+def _copy_data(data):
+    return {name: list(value) if isinstance(value, list) else value for name, value in data.items()}
+
+
+def _encode_cursor(position):
+    data = json.dumps(_dump_cursor_value(position), separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8"))
+
+
+def _decode_cursor(cursor):
+    if not cursor:
+        return None
+
+    if isinstance(cursor, str):
+        cursor = cursor.encode("ascii")
+
+    try:
+        return _load_cursor_value(json.loads(base64.urlsafe_b64decode(cursor)))
+    except (TypeError, ValueError, KeyError):
+        raise ValueError(f"Invalid cursor {cursor!r}.")
+
+
+def _dump_cursor_value(value):
+    if isinstance(value, tuple):
+        return {"t": [_dump_cursor_value(v) for v in value]}
+
+    elif isinstance(value, bytes):
+        return {"b": base64.b64encode(value).decode("ascii")}
+
+    elif isinstance(value, datetime):
+        delta = value - _epoch
+        return {"d": [delta.days, delta.seconds, delta.microseconds]}
+
+    return value
+
+
+def _load_cursor_value(value):
+    if not isinstance(value, dict):
+        return value
+
+    elif "t" in value:
+        return tuple(_load_cursor_value(v) for v in value["t"])
+
+    elif "b" in value:
+        return base64.b64decode(value["b"])
+
+    return _epoch + timedelta(*value["d"])
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import threading
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+
+from ..adapter import AsyncAdapter
+from ..transaction import AsyncTransaction, Transaction
+
+_logger = logging.getLogger(__name__)
+
+#: The stack of async transactions for the current task.
+_transactions = ContextVar("anom.async_transactions", default=())
+
+
+class _WorkerPool:
+    """A bounded pool of single-threaded executors.  Transactions
+    lease a worker for as long as they run and hand it back when they
+    end so that threads are reused rather than started per
+    transaction.  Once every worker is leased, new transactions wait
+    for one to be handed back.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._idle = []
+        self._waiters = deque()
+        self._started = 0
+
+    async def acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+
+            if self._started < self.max_workers:
+                self._started += 1
+                return ThreadPoolExecutor(max_workers=1)
+
+            # Waiters may belong to different event loops so they're
+            # handed their worker thread-safely by release.
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+        return await waiter
+
+    def release(self, worker):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter, worker)
+                    return
+
+            self._idle.append(worker)
+
+    def _hand_over(self, waiter, worker):
+        # The waiter may have been cancelled after release picked it.
+        if waiter.done():
+            self.release(worker)
+        else:
+            waiter.set_result(worker)
+
+
+class _ThreadedAsyncTransaction(AsyncTransaction):
+    def __init__(self, adapter, propagation):
+        self.adapter = adapter
+        self.propagation = propagation
+        self.executor = None
+        self.context = None
+        self.transaction = None
+        self._owns_executor = False
+        self._token = None
+
+    async def begin(self):
+        _logger.debug("Beginning async transaction...")
+        # Nested transactions join their parent's thread and context
+        # so that the wrapped adapter can see the transaction they're
+        # nested in.  Every other transaction leases its own.
+        parent = self.adapter.current_transaction
+        if parent is not None and self.propagation == Transaction.Propagation.Nested:
+            self.executor = parent.executor
+            self.context = parent.context
+        else:
+            self.executor = await self.adapter._workers.acquire()
+            self.context = copy_context()
+            self._owns_executor = True
+
+        self._token = _transactions.set(_transactions.get() + (self,))
+        self.transaction = await self.run(self.adapter.adapter.transaction, self.propagation)
+        await self.run(self.transaction.begin)
+
+    async def commit(self):
+        _logger.debug("Committing async transaction...")
+        await self.run(self.transaction.commit)
+
+    async def rollback(self):
+        _logger.debug("Rolling back async transaction...")
+        if self.transaction is not None:
+            await self.run(self.transaction.rollback)
+
+    async def end(self):
+        _logger.debug("Ending async transaction...")
+        try:
+            if self.transaction is not None:
+                await self.run(self.transaction.end)
+
+        finally:
+            if self._token is not None:
+                _transactions.reset(self._token)
+
+            if self._owns_executor:
+                self.adapter._workers.release(self.executor)
+
+    def run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, self.context.run, fn, *args)
+
+
+class ThreadedAsyncAdapter(AsyncAdapter):
+    """An async adapter that runs the operations of a regular
+    :class:`Adapter` on a thread pool.  The namespace of the calling
+    task is carried over to the thread each operation runs on.
+
+    Note:
+      Some of the libraries adapters are built on keep transaction
+      state per thread so all of the operations inside an async
+      transaction run on a single thread that is dedicated to that
+      transaction until it ends.  At most ``max_transactions``
+      transactions run at once and the rest wait for a thread to
+      free up, so independent transactions nested inside others can
+      deadlock if their parents hold every thread.
+
+    Parameters:
+      adapter(Adapter): The adapter to wrap.
+      executor(concurrent.futures.Executor, optional): The executor to
+        run operations on outside of transactions.  Defaults to the
+        event loop's default executor.
+      max_transactions(int, optional): The maximum number of threads
+        to run transactions on and, therefore, the maximum number of
+        transactions that may run at once.  Defaults to 32.
+    """
+
+    def __init__(self, adapter, *, executor=None, max_transactions=32):
+        self.adapter = adapter
+        self.executor = executor
+        self._workers = _WorkerPool(max_transactions)
+
+    async def count(self, query, options):
+        return await self._run(self.adapter.count, query, options)
+
+    async def delete_multi(self, keys):
+        return await self._run(self.adapter.delete_multi, keys)
+
+    async def get_multi(self, keys):
+        return await self._run(self.adapter.get_multi, keys)
+
+    async def put_multi(self, requests):
+        return await self._run(self.adapter.put_multi, requests)
+
+    async def query(self, query, options):
+        return await self._run(self.adapter.query, query, options)
+
+    def transaction(self, propagation):
+        return _ThreadedAsyncTransaction(self, propagation)
+
+    @property
+    def in_transaction(self):
+        return bool(_transactions.get())
+
+    @property
+    def current_transaction(self):
+        transactions = _transactions.get()
+        return transactions[-1] if transactions else None
+
+    def _run(self, fn, *args):
+        transaction = self.current_transaction
+        if transaction is not None:
+            return transaction.run(fn, *args)
+
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, copy_context().run, fn, *args)
@@ -0,0 +1,125 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from .properties import Bool, DateTime, Float, Integer
+
+#: The UNIX epoch.  DateTime columns hold microseconds since then.
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+#: One microsecond.
+_microsecond = timedelta(microseconds=1)
+
+#: The number of rows that are transposed into columns at a time.
+_transpose_size = 1000
+
+
+class _Column:
+    """Accumulates the values of a single property.  Values are stored
+    in a typed array when the property's type allows it and in a list
+    otherwise.  Typed columns fall back to lists as soon as they come
+    across a value that can't be stored in their array, such as None.
+    """
+
+    __slots__ = ("typecode", "dtype", "to_array", "from_array", "values")
+
+    def __init__(self, typecode=None, dtype=object, to_array=None, from_array=None):
+        self.typecode = typecode
+        self.dtype = dtype
+        self.to_array = to_array
+        self.from_array = from_array
+        self.values = array(typecode) if typecode else []
+
+    def extend(self, values):
+        if self.typecode is None:
+            self.values.extend(values)
+            return
+
+        size = len(self.values)
+        try:
+            self.values.extend(values if self.to_array is None else map(self.to_array, values))
+        except (AttributeError, OverflowError, TypeError):
+            del self.values[size:]
+            self.values = self._to_list() + list(values)
+            self.typecode, self.dtype = None, object
+
+    def finish(self, numpy):
+        if numpy is None:
+            return self.values
+
+        elif self.typecode is None:
+            column = numpy.empty(len(self.values), dtype=object)
+            column[:] = self.values
+            return column
+
+        # Typed columns share their array's memory.
+        return numpy.frombuffer(self.values, dtype=self.dtype)
+
+    def _to_list(self):
+        if self.from_array is None:
+            return self.values.tolist()
+        return [self.from_array(value) for value in self.values]
+
+
+def _datetime_to_micros(value):
+    return (value - _epoch) // _microsecond
+
+
+def _micros_to_datetime(value):
+    return _epoch + value * _microsecond
+
+
+def _make_column(prop):
+    if prop is None or prop.repeated:
+        return _Column()
+
+    elif isinstance(prop, Bool):
+        return _Column("b", "bool", from_array=bool)
+
+    elif isinstance(prop, Integer):
+        return _Column("q", "int64")
+
+    elif isinstance(prop, Float):
+        return _Column("d", "float64")
+
+    elif isinstance(prop, DateTime):
+        return _Column("q", "datetime64[us]", _datetime_to_micros, _micros_to_datetime)
+
+    return _Column()
+
+
+def iter_columns(rows, names, props, chunk_size=None, numpy=None):
+    """Gather rows of values into chunks of columns.
+
+    Parameters:
+      rows(iterator[tuple]): The rows to gather.
+      names(tuple[str]): The name of each column.
+      props(tuple[Property or None]): The property each column's
+        values belong to, if any.  This determines the column's type.
+      chunk_size(int, optional): The maximum number of rows per chunk.
+        All the rows are gathered into a single chunk if this is
+        ``None``.
+      numpy(module, optional): When provided, columns are converted
+        to NumPy arrays using this module.
+
+    Returns:
+      iterator[dict]: Chunks of columns, keyed by name.
+    """
+    while True:
+        columns, count = [_make_column(prop) for prop in props], 0
+        while chunk_size is None or count < chunk_size:
+            size = _transpose_size if chunk_size is None else min(_transpose_size, chunk_size - count)
+            batch = list(islice(rows, size))
+            if not batch:
+                break
+
+            for column, values in zip(columns, zip(*batch)):
+                column.extend(values)
+
+            count += len(batch)
+
+        if count or chunk_size is None:
+            yield {name: column.finish(numpy) for name, column in zip(names, columns)}
+
+        if chunk_size is None or count < chunk_size:
+            return
@@ -0,0 +1,447 @@
+import codecs
+import lzma
+import zlib
+
+from threading import Lock, local
+
+#: The bytes that values compressed by codecs other than zlib start
+#: with.  0xff never appears in UTF-8 text.  The magic is followed by
+#: the id of the codec that compressed the value.
+_magic = b"\xff\xac"
+_header_size = len(_magic) + 1
+
+#: The number of bytes that are decompressed at a time when values
+#: are decompressed in chunks.
+_chunk_size = 64 * 1024
+
+
+class Codec:
+    """Base class for the compression libraries that
+    :class:`Compressable<anom.properties.Compressable>` properties
+    use to compress values.
+    """
+
+    #: The name that this codec is registered under.
+    name = None
+
+    #: The id that's stored alongside values compressed by this codec.
+    #: Ids 0 through 31 are reserved for built-in codecs.
+    id = None
+
+    #: The compression levels that this codec supports.
+    levels = range(0)
+
+    #: The level that's used when properties don't specify one.
+    default_level = None
+
+    def compress(self, data, level):  # pragma: no cover
+        """Compress some data.
+
+        Parameters:
+          data(bytes): The data to compress.
+          level(int): The compression level to use.
+
+        Returns:
+          bytes: The compressed data.
+        """
+        raise NotImplementedError
+
+    def decompress(self, data):  # pragma: no cover
+        """Decompress some data.
+
+        Parameters:
+          data(bytes-like): The compressed data.
+
+        Returns:
+          bytes: The decompressed data.
+        """
+        raise NotImplementedError
+
+    def iter_decompress(self, data):
+        """Decompress some data a chunk at a time.  Codecs that can
+        decompress data incrementally should override this so that
+        large values never have to be held in memory all at once.
+
+        Parameters:
+          data(bytes-like): The compressed data.
+
+        Returns:
+          iterator[bytes]: Chunks of decompressed data.
+        """
+        yield self.decompress(data)
+
+
+class RawCodec(Codec):
+    """A codec that stores values as-is.  Used to mark small values
+    that could otherwise be mistaken for compressed ones.
+    """
+
+    name = "raw"
+    id = 0
+    levels = range(1)
+    default_level = 0
+
+    def compress(self, data, level):
+        return data
+
+    def decompress(self, data):
+        return bytes(data)
+
+
+class ZlibCodec(Codec):
+    """A codec that uses :mod:`zlib`.  zlib streams describe
+    themselves so values compressed with this codec are stored
+    without a header, the same way older versions of anom stored
+    them.
+    """
+
+    name = "zlib"
+    id = 1
+    levels = range(10)
+    default_level = -1
+
+    def compress(self, data, level):
+        return zlib.compress(data, level)
+
+    def decompress(self, data):
+        return zlib.decompress(data)
+
+    def iter_decompress(self, data):
+        decompressor = zlib.decompressobj()
+        while data:
+            chunk = decompressor.decompress(data, _chunk_size)
+            data = decompressor.unconsumed_tail
+            if chunk:
+                yield chunk
+
+        chunk = decompressor.flush()
+        if not decompressor.eof:
+            raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+
+        if chunk:
+            yield chunk
+
+
+class LzmaCodec(Codec):
+    """A codec that uses :mod:`lzma`.  Slower than zlib, but values
+    compressed with it are usually smaller.  Values are stored in the
+    legacy ``.lzma`` format since its headers are much smaller than
+    those of the ``.xz`` format.
+    """
+
+    name = "lzma"
+    id = 2
+    levels = range(10)
+    default_level = lzma.PRESET_DEFAULT
+
+    def compress(self, data, level):
+        return lzma.compress(data, format=lzma.FORMAT_ALONE, preset=level)
+
+    def decompress(self, data):
+        return lzma.decompress(data, format=lzma.FORMAT_ALONE)
+
+    def iter_decompress(self, data):
+        decompressor = lzma.LZMADecompressor(format=lzma.FORMAT_ALONE)
+        chunk = decompressor.decompress(data, _chunk_size)
+        while True:
+            if chunk:
+                yield chunk
+
+            if decompressor.eof:
+                return
+
+            elif decompressor.needs_input:
+                raise lzma.LZMAError("Compressed data ended before the end-of-stream marker was reached")
+
+            chunk = decompressor.decompress(b"", _chunk_size)
+
+
+class Lz4Codec(Codec):
+    """A codec that uses lz4_.  Much faster than zlib, especially
+    when decompressing, at the cost of larger values.
+
+    .. _lz4: https://github.com/python-lz4/python-lz4
+    """
+
+    name = "lz4"
+    id = 3
+    levels = range(17)
+    default_level = 0
+
+    def __init__(self):
+        import lz4.frame
+
+        self.lz4 = lz4.frame
+
+    def compress(self, data, level):
+        return self.lz4.compress(data, compression_level=level)
+
+    def decompress(self, data):
+        return self.lz4.decompress(data)
+
+    def iter_decompress(self, data):
+        decompressor = self.lz4.LZ4FrameDecompressor()
+        chunk = decompressor.decompress(data, _chunk_size)
+        while True:
+            if chunk:
+                yield chunk
+
+            if decompressor.eof:
+                return
+
+            elif decompressor.needs_input:
+                raise RuntimeError("LZ4 frame ended before the end of its data was reached.")
+
+            chunk = decompressor.decompress(b"", _chunk_size)
+
+
+class ZstdCodec(Codec):
+    """A codec that uses zstandard_.  Compresses about as well as
+    zlib, much faster.  Compression contexts are reused by each
+    thread since setting them up is expensive compared to
+    compressing small values.  Values are always decompressed in one
+    go since zstd frames record their decompressed size, which lets
+    the output be allocated up front.
+
+    .. _zstandard: https://github.com/indygreg/python-zstandard
+    """
+
+    name = "zstd"
+    id = 4
+    levels = range(1, 23)
+    default_level = 3
+
+    def __init__(self):
+        import zstandard
+
+        self.zstandard = zstandard
+        self.contexts = local()
+
+    def compress(self, data, level):
+        try:
+            compressors = self.contexts.compressors
+        except AttributeError:
+            compressors = self.contexts.compressors = {}
+
+        compressor = compressors.get(level)
+        if compressor is None:
+            compressor = compressors[level] = self.zstandard.ZstdCompressor(level=level)
+
+        return compressor.compress(data)
+
+    def decompress(self, data):
+        try:
+            decompressor = self.contexts.decompressor
+        except AttributeError:
+            decompressor = self.contexts.decompressor = self.zstandard.ZstdDecompressor()
+
+        return decompressor.decompress(data)
+
+
+#: The registered codecs, by name and by id.
+_codecs = {}
+_codecs_by_id = {}
+_codecs_lock = Lock()
+
+#: The names of the built-in codecs whose libraries aren't installed,
+#: by id.
+_missing_codecs = {}
+
+
+def register_codec(codec):
+    """Register a compression codec so that properties may refer to
+    it by name.  Registering a codec under an existing name or id
+    replaces the old codec.
+
+    Parameters:
+      codec(Codec): The codec to register.
+
+    Raises:
+      ValueError: If the codec's id doesn't fit in a byte.
+
+    Returns:
+      Codec: The codec.
+    """
+    if not (0 <= codec.id <= 255):
+        raise ValueError("Codec ids must be integers between 0 and 255.")
+
+    with _codecs_lock:
+        _codecs[codec.name] = codec
+        _codecs_by_id[codec.id] = codec
+
+    return codec
+
+
+def get_codec(name):
+    """Get a registered compression codec.
+
+    Parameters:
+      name(str): The name of the codec.
+
+    Raises:
+      ValueError: If no codec is registered under the given name.
+
+    Returns:
+      Codec: The codec.
+    """
+    try:
+        return _codecs[name]
+    except KeyError:
+        raise ValueError(f"Compression codec {name!r} is not registered.")
+
+
+def _looks_like_zlib(data):
+    # zlib streams start with a two byte header whose first byte
+    # describes the deflate method and whose value is a multiple of 31.
+    return len(data) >= 2 and data[0] & 0x8f == 0x08 and (data[0] << 8 | data[1]) % 31 == 0
+
+
+def compress(data, codec, level=-1, min_size=0):
+    """Compress some data so that it can later be decompressed with
+    :func:`decompress`.
+
+    Parameters:
+      data(bytes-like): The data to compress.
+      codec(Codec): The codec to compress the data with.
+      level(int, optional): The compression level to use.  ``-1``
+        stands for the codec's default level.
+      min_size(int, optional): Data that's smaller than this many
+        bytes is stored uncompressed.
+
+    Returns:
+      bytes: The compressed data.
+    """
+    if len(data) < min_size:
+        # Small values are stored as they are unless they could be
+        # mistaken for compressed values.
+        if data[:len(_magic)] != _magic and not _looks_like_zlib(data):
+            return bytes(data)
+
+        codec = _codecs_by_id[RawCodec.id]
+
+    if level == -1:
+        level = codec.default_level
+
+    compressed_data = codec.compress(data, level)
+    if codec.id == ZlibCodec.id:
+        return compressed_data
+    return b"".join((_magic, bytes((codec.id,)), compressed_data))
+
+
+def _detect_codec(data):
+    # Returns the codec that compressed some data, if any, along with
+    # a view of the compressed data that skips the header.  Values
+    # that are too short to have a header or whose header refers to
+    # an unknown codec were never compressed.
+    if len(data) >= _header_size and data[:len(_magic)] == _magic:
+        codec_id = data[len(_magic)]
+        codec = _codecs_by_id.get(codec_id)
+        if codec is not None:
+            return codec, memoryview(data)[_header_size:]
+
+        elif codec_id in _missing_codecs:
+            raise ValueError(f"Data was compressed with codec {_missing_codecs[codec_id]!r}, which isn't installed.")
+
+    elif _looks_like_zlib(data):
+        return _codecs_by_id[ZlibCodec.id], data
+
+    return None, data
+
+
+def decompress(data):
+    """Decompress data that was compressed with :func:`compress`,
+    zlib data written by older versions of anom or data that was
+    never compressed.
+
+    Parameters:
+      data(bytes-like): The data to decompress.
+
+    Raises:
+      ValueError: If the data was compressed with a codec that isn't
+        registered.
+
+    Returns:
+      bytes: The decompressed data.
+    """
+    codec, payload = _detect_codec(data)
+    if codec is None:
+        return _to_bytes(data)
+
+    elif payload is not data:
+        return codec.decompress(payload)
+
+    try:
+        return codec.decompress(payload)
+    except zlib.error:
+        if not _is_uncompressed(payload):
+            raise
+
+        return _to_bytes(data)
+
+
+def _is_uncompressed(data):
+    # Values that were stored before their property was made
+    # compressed may look like zlib streams by accident.  Those fail
+    # to decompress before their first byte is produced, unlike zlib
+    # streams that are truncated or corrupt.
+    try:
+        return not zlib.decompressobj().decompress(data, 1)
+    except zlib.error:
+        return True
+
+
+def _to_bytes(data):
+    # Uncompressed data is returned as-is unless it's some other kind
+    # of buffer, in which case it's copied so callers always get bytes.
+    if isinstance(data, bytes):
+        return data
+    return bytes(data)
+
+
+def decompress_text(data, encoding="utf-8"):
+    """Decompress data like :func:`decompress` does and decode it to
+    text.  Data is decoded as it's decompressed so large values are
+    never held in memory as both bytes and text.
+
+    Parameters:
+      data(bytes-like): The data to decompress.
+      encoding(str, optional): The encoding of the decompressed data.
+        Defaults to ``utf-8``.
+
+    Raises:
+      ValueError: If the data was compressed with a codec that isn't
+        registered.
+
+    Returns:
+      str: The decompressed text.
+    """
+    codec, payload = _detect_codec(data)
+    if codec is None:
+        return str(data, encoding)
+
+    # Strings that nothing else refers to are resized in place when
+    # they're appended to, so building the text this way holds about
+    # one copy of it in memory, unlike joining the decoded chunks.
+    decoder, text = codecs.getincrementaldecoder(encoding)(), ""
+    try:
+        for chunk in codec.iter_decompress(payload):
+            text += decoder.decode(chunk)
+
+    except zlib.error:
+        if payload is not data or not _is_uncompressed(payload):
+            raise
+
+        return str(data, encoding)
+
+    text += decoder.decode(b"", True)
+    return text
+
+
+for codec in (RawCodec(), ZlibCodec(), LzmaCodec()):
+    register_codec(codec)
+
+for factory in (Lz4Codec, ZstdCodec):
+    try:
+        register_codec(factory())
+    except ImportError:
+        _missing_codecs[factory.id] = factory.name
@@ -0,0 +1,180 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import wraps
+
+#: The identity map for the current context.
+_identity_map = ContextVar("anom.identity_map", default=None)
+
+
+class TransactionStack:
+    """A stack of :class:`Transactions<Transaction>` that is local to
+    the current context.  Adapters use this to keep track of the
+    transactions that are active in each thread or asyncio task.
+
+    Stacks are immutable under the hood so functions that run inside
+    of a copy of the current context see the transactions that were
+    active when the copy was made, but transactions they start aren't
+    visible to the caller.
+
+    Parameters:
+      name(str): The name of the underlying context variable.
+    """
+
+    def __init__(self, name):
+        self._transactions = ContextVar(name, default=())
+
+    def append(self, transaction):
+        "Push a transaction onto the stack."
+        self._transactions.set(self._transactions.get() + (transaction,))
+
+    def remove(self, transaction):
+        "Remove a transaction from the stack."
+        self._transactions.set(tuple(t for t in self._transactions.get() if t is not transaction))
+
+    def __bool__(self):
+        return bool(self._transactions.get())
+
+    def __len__(self):
+        return len(self._transactions.get())
+
+    def __getitem__(self, index):
+        return self._transactions.get()[index]
+
+
+def bind_context(fn):
+    """Bind a function to a copy of the current context.  The current
+    namespace and any active transactions carry over to wherever the
+    returned function is called, e.g. inside an executor's worker
+    threads.
+
+    Example:
+      >>> with namespace("foo"):
+      ...   fn = bind_context(get_namespace)
+      >>> assert executor.submit(fn).result() == "foo"
+
+    Parameters:
+      fn(callable): The function to bind.
+
+    Returns:
+      callable: The bound function.
+    """
+    context = copy_context()
+
+    @wraps(fn)
+    def inner(*args, **kwargs):
+        # A context can only be entered by one thread at a time so
+        # each call runs in a copy of the bound context.
+        return context.copy().run(fn, *args, **kwargs)
+    return inner
+
+
+def submit_with_context(executor, fn, *args, **kwargs):
+    """Submit a function to an executor so that it runs with a copy
+    of the current context.
+
+    Parameters:
+      executor(concurrent.futures.Executor): The executor to submit
+        the function to.
+      fn(callable): The function to run.
+      \\*args: Positional arguments to pass to the function.
+      \\**kwargs: Keyword arguments to pass to the function.
+
+    Returns:
+      concurrent.futures.Future: The future for the function's result.
+    """
+    return executor.submit(copy_context().run, fn, *args, **kwargs)
+
+
+class IdentityMap:
+    """A cache of the entities that were loaded, stored or deleted
+    within an :func:`identity_map` block.  Repeated lookups of the
+    same keys are served from this map instead of the adapter and
+    return the same Model instances.
+
+    Note:
+      Lookups inside transactions always go to the adapter.  Entities
+      that are stored or deleted inside transactions are evicted from
+      the map.
+
+    Attributes:
+      hits(int): The number of keys that were served from the map.
+      misses(int): The number of keys that had to be looked up using
+        the adapter.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._entities = {}
+
+    def clear(self):
+        "Remove all the entities from the map and reset its counters."
+        self.hits = self.misses = 0
+        self._entities.clear()
+
+    def evict(self, keys):
+        """Remove a set of entities from the map.
+
+        Parameters:
+          keys(iter[anom.Key]): The keys of the entities to remove.
+        """
+        for key in keys:
+            self._entities.pop(key, None)
+
+    def update(self, entities):
+        """Add a set of entities to the map.
+
+        Parameters:
+          entities(iter[tuple[anom.Key, Model]]): Pairs of keys and
+            entities.  Entities that don't exist are ``None``.
+        """
+        self._entities.update(entities)
+
+    def _get_missing(self, keys):
+        missing = {}
+        for key in keys:
+            if key in self._entities:
+                self.hits += 1
+            else:
+                self.misses += 1
+                missing[key] = None
+
+        return list(missing)
+
+    def _get_multi(self, keys):
+        return [self._entities[key] for key in keys]
+
+    def __contains__(self, key):
+        return key in self._entities
+
+    def __len__(self):
+        return len(self._entities)
+
+
+def get_identity_map():
+    """IdentityMap: The identity map for the current thread or task
+    or ``None`` if there isn't one.
+    """
+    return _identity_map.get()
+
+
+@contextmanager
+def identity_map():
+    """Context manager that caches entities that are looked up by key
+    in a new :class:`IdentityMap` until the block exits.  Use it to
+    scope an identity map to a single web request.
+
+    Example:
+      >>> with identity_map() as entities:
+      ...   user = User.get(user_id)
+      ...   assert User.get(user_id) is user
+      ...   assert entities.hits == 1
+
+    Returns:
+      IdentityMap: The new identity map.
+    """
+    token = _identity_map.set(IdentityMap())
+    try:
+        yield _identity_map.get()
+    finally:
+        _identity_map.reset(token)
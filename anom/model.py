@@ -1,8 +1,9 @@
-from collections import namedtuple
+from copy import copy
 from threading import RLock
 from weakref import WeakValueDictionary
 
-from .adapter import PutRequest, get_adapter
+from .adapter import PutRequest, get_adapter, get_async_adapter
+from .context import get_identity_map
 from .namespaces import get_namespace
 from .query import PropertyFilter, Query
 
@@ -30,10 +31,21 @@ class KeyLike:
     another).
     """
 
+    __slots__ = ()
 
-class Key(KeyLike, namedtuple("Key", ("kind", "id_or_name", "parent", "namespace"))):
+
+#: Interned keys.  See :meth:`Key.intern`.
+_interned_keys = WeakValueDictionary()
+
+
+class Key(KeyLike):
     """A Datastore key.
 
+    Keys are immutable.  Their paths and hashes are computed once,
+    when they are created, so hashing and comparing keys doesn't
+    depend on how deep their ancestry is.  Keys can be unpacked like
+    ``(kind, id_or_name, parent, namespace)`` tuples.
+
     Parameters:
       kind(str or model): The Datastore kind this key represents.
       id_or_name(int or str): The id or name of this key.
@@ -46,8 +58,12 @@ class Key(KeyLike, namedtuple("Key", ("kind", "id_or_name", "parent", "namespace
         name.  This is ``None`` for partial keys.
       parent(anom.Key or None): This key's ancestor.
       namespace(str or None): This key's namespace.
+      path(tuple): This key's full path, including its ancestors'.
+      is_partial(bool): Whether or not this key is missing an id.
     """
 
+    __slots__ = ("kind", "id_or_name", "parent", "namespace", "path", "is_partial", "_hash", "__weakref__")
+
     def __new__(cls, kind, id_or_name=None, parent=None, namespace=None):
         if isinstance(kind, model):
             kind = kind._kind
@@ -64,7 +80,29 @@ class Key(KeyLike, namedtuple("Key", ("kind", "id_or_name", "parent", "namespace
         elif namespace is None:
             namespace = get_namespace()
 
-        return super().__new__(cls, kind, id_or_name, parent, namespace)
+        return cls._make(kind, id_or_name, parent, namespace)
+
+    @classmethod
+    def _make(cls, kind, id_or_name, parent, namespace):
+        # Builds a key without validating its components.  Adapters
+        # use this to build keys out of paths that come from the
+        # backend, which are known to be valid.
+        path = parent.path if parent else ()
+        if id_or_name:
+            path += (kind, id_or_name)
+        else:
+            path += (kind,)
+
+        self = object.__new__(cls)
+        _set = object.__setattr__
+        _set(self, "kind", kind)
+        _set(self, "id_or_name", id_or_name)
+        _set(self, "parent", parent)
+        _set(self, "namespace", namespace)
+        _set(self, "path", path)
+        _set(self, "is_partial", len(path) % 2 != 0)
+        _set(self, "_hash", hash((path, namespace)))
+        return self
 
     @classmethod
     def from_path(cls, *path, namespace=None):
@@ -84,22 +122,15 @@ class Key(KeyLike, namedtuple("Key", ("kind", "id_or_name", "parent", "namespace
 
         return parent
 
-    @property
-    def path(self):
-        "tuple: The full Datastore path represented by this key."
-        prefix = ()
-        if self.parent:
-            prefix = self.parent.path
-
-        if self.id_or_name:
-            return prefix + (self.kind, self.id_or_name)
+    def intern(self):
+        """Get the canonical instance of this key.  Interned keys that
+        are equal to one another are the same object, so they compare
+        by identity.  Keys are interned for as long as they're in use.
 
-        return prefix + (self.kind,)
-
-    @property
-    def is_partial(self):
-        "bool: ``True`` if this key doesn't have an id yet."
-        return len(self.path) % 2 != 0
+        Returns:
+          anom.Key: The interned key.
+        """
+        return _interned_keys.setdefault(self, self)
 
     @property
     def int_id(self):
@@ -142,28 +173,80 @@ class Key(KeyLike, namedtuple("Key", ("kind", "id_or_name", "parent", "namespace
         """
         return get_multi([self])[0]
 
+    async def adelete(self):
+        """Delete the entity represented by this Key from Datastore
+        using the current async adapter.
+        """
+        return await adelete_multi([self])
+
+    async def aget(self):
+        """Get the entity represented by this Key from Datastore using
+        the current async adapter.
+
+        Returns:
+          Model: The entity or ``None`` if it does not exist.
+        """
+        return (await aget_multi([self]))[0]
+
     def __repr__(self):
         return f"Key({self.kind!r}, {self.id_or_name!r}, parent={self.parent!r}, namespace={self.namespace!r})"
 
     def __hash__(self):
-        return hash(tuple(self))
+        return self._hash
 
     def __eq__(self, other):
-        if not isinstance(other, KeyLike):
-            return False
-
         if self is other:
             return True
 
-        if other.parent != self.parent or \
-           other.namespace != self.namespace:
+        if isinstance(other, Key):
+            return self._hash == other._hash and self.path == other.path and self.namespace == other.namespace
+
+        if not isinstance(other, KeyLike):
             return False
 
-        return self.path == other.path
+        return other.namespace == self.namespace and other.path == self.path
 
     def __ne__(self, other):
         return not (self == other)
 
+    def __lt__(self, other):
+        if not isinstance(other, Key):
+            return NotImplemented
+        return tuple(self) < tuple(other)
+
+    def __le__(self, other):
+        if not isinstance(other, Key):
+            return NotImplemented
+        return tuple(self) <= tuple(other)
+
+    def __gt__(self, other):
+        if not isinstance(other, Key):
+            return NotImplemented
+        return tuple(self) > tuple(other)
+
+    def __ge__(self, other):
+        if not isinstance(other, Key):
+            return NotImplemented
+        return tuple(self) >= tuple(other)
+
+    def __iter__(self):
+        return iter((self.kind, self.id_or_name, self.parent, self.namespace))
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        return (self.kind, self.id_or_name, self.parent, self.namespace)[index]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Keys are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Keys are immutable.")
+
+    def __reduce__(self):
+        return type(self), tuple(self)
+
 
 class Property:
     """Base class for Datastore model properties.
@@ -194,16 +277,24 @@ class Property:
       repeated(bool, optional): Whether or not this property is
         repeated.  Defaults to ``False``.  Optional repeated
         properties default to an empty list.
+      lazy(bool, optional): Whether or not this property's values are
+        decoded the first time they're accessed rather than when
+        entities are loaded.  Defaults to the setting of the model
+        the property belongs to.
     """
 
     #: The types of values that may be assigned to this property.
     _types = ()
 
-    def __init__(self, *, name=None, default=None, indexed=False, indexed_if=None, optional=False, repeated=False):
+    def __init__(
+            self, *, name=None, default=None, indexed=False, indexed_if=None, optional=False, repeated=False,
+            lazy=None,
+    ):
         self.indexed = indexed or bool(indexed_if)
         self.indexed_if = indexed_if
         self.optional = optional
         self.repeated = repeated
+        self.lazy = lazy
 
         self.default = self.validate(default) if default is not None else None
 
@@ -265,6 +356,20 @@ class Property:
         """
         return value
 
+    def _get_loader(self):
+        """Get a function that does the same work as
+        :meth:`prepare_to_load` for this property's configuration,
+        without going through the chain of mixins.  Properties that
+        override :meth:`prepare_to_load` must override this as well
+        for their loader to be used.
+
+        Returns:
+          callable: A function that takes an entity and a value, or
+          ``None`` if values can be loaded as-is or ``Skip`` if values
+          shouldn't be loaded at all.
+        """
+        return None
+
     def prepare_to_store(self, entity, value):
         """Prepare `value` for storage.  Called by the Model for each
         Property, value pair it contains before handing the data off
@@ -285,6 +390,23 @@ class Property:
             raise RuntimeError(f"Property {self.name_on_model} requires a value.")
         return value
 
+    def _get_storer(self):
+        """Get a function that does the same work as
+        :meth:`prepare_to_store` for this property's configuration,
+        without going through the chain of mixins.  Properties that
+        override :meth:`prepare_to_store` must override this as well
+        for their storer to be used.
+
+        Note:
+          Storers don't check whether required properties have a
+          value.  Models do that after calling them.
+
+        Returns:
+          callable: A function that takes an entity and a value, or
+          ``None`` if values can be stored as-is.
+        """
+        return None
+
     def __set_name__(self, ob, name):
         self._name_on_entity = self.name_on_entity or name
         self._name_on_model = name
@@ -294,6 +416,9 @@ class Property:
             return self
 
         value = ob._data.get(self.name_on_model, NotFound)
+        if value is NotFound and ob._lazy_data:
+            value = _load_lazy_value(ob, self.name_on_model)
+
         if value is NotFound:
             if self.default is not None:
                 return self.default
@@ -308,8 +433,14 @@ class Property:
 
     def __set__(self, ob, value):
         ob._data[self.name_on_model] = self.validate(value)
+        if ob._lazy_data:
+            ob._lazy_data.pop(self.name_on_model, None)
 
     def __delete__(self, ob):
+        if ob._lazy_data and ob._lazy_data.pop(self.name_on_model, None) is not None:
+            ob._data.pop(self.name_on_model, None)
+            return
+
         del ob._data[self.name_on_model]
 
     def _build_filter(self, op, value):
@@ -349,12 +480,42 @@ class EmbedLike(Property):
         """
         raise NotImplementedError
 
+    def _prepare_to_load_embedded(self, entity, data, embedded):
+        """Prepare this property's value for loading.  ``embedded``
+        maps the first segment of each dotted name in ``data`` to the
+        rest of that name and its value.  Subclasses that can make use
+        of it should override this.
+        """
+        return self.prepare_to_load(entity, data)
+
+
+def _split_embedded(data):
+    # Splits flattened embedded values by the first segment of their
+    # name in a single pass so that each embed is handed its own
+    # values directly rather than having to look for them.
+    embedded = {}
+    for name, value in data.items():
+        prefix, dot, rest = name.partition(".")
+        if dot:
+            values = embedded.get(prefix)
+            if values is None:
+                values = embedded[prefix] = {}
+
+            values[rest] = value
+
+    return embedded
+
 
 class _adapter:
     def __get__(self, ob, obtype):
         return get_adapter()
 
 
+class _async_adapter:
+    def __get__(self, ob, obtype):
+        return get_async_adapter()
+
+
 class model(type):
     """Metaclass of Model classes.
 
@@ -362,16 +523,42 @@ class model(type):
       poly(bool, optional): Determines if the model should be
         polymorphic or not.  Subclasses of polymorphic models are all
         stored under the same kind.
+      lazy(bool, optional): Determines if the model's properties
+        should be decoded the first time they're accessed rather than
+        when entities are loaded.  Individual properties can override
+        this.  Defaults to the setting of the model's bases.
 
     Attributes:
       _adapter(Adapter): A computed property that returns the adapter
         for this model class.
+      _async_adapter(AsyncAdapter): A computed property that returns
+        the async adapter for this model class.
       _is_child(bool): Whether or not this is a child model in a
         polymorphic hierarchy.
       _is_root(bool): Whether or not this is the root model in a
         polymorphic hierarchy.
       _kind(str): The underlying Datastore kind of this model.
       _kinds(list[str]): The list of kinds in this model's hierarchy.
+      _loader_plan(list[tuple]): The steps that are used to load
+        each non-embedded property's value into an instance.
+      _embed_plan(list[tuple]): The embedded properties of this
+        model class.
+      _lazy(bool): Whether or not this model's properties are lazy
+        by default.
+      _lazy_plan(list[tuple]): The steps that are used to load each
+        lazy property's value the first time it's accessed.
+      _loads_in_place(bool): Whether or not data that is handed over
+        to ``_load`` can be used as an instance's data as-is.
+      _projection_plans(dict): A cache of the steps that are used to
+        load the results of projection queries, by projection.
+      _row_plans(dict): A cache of the column names and steps that
+        are used to load query results as rows, by projection.
+      _store_plan(list[tuple]): The steps that are used to prepare
+        each property's value for storage.
+      _unindexed_names(tuple[str]): The names of the properties that
+        are never indexed.
+      _indexed_if_plan(list[tuple]): The properties whose
+        ``indexed_if`` conditions have to be evaluated per entity.
       _properties(dict): A dict of all of the properties defined on
         this model.
     """
@@ -380,8 +567,9 @@ class model(type):
     #: on polymodel entities.
     _kinds_name = "^k"
 
-    def __new__(cls, classname, bases, attrs, poly=False, **kwargs):
+    def __new__(cls, classname, bases, attrs, poly=False, lazy=None, **kwargs):
         attrs["_adapter"] = _adapter()
+        attrs["_async_adapter"] = _async_adapter()
         attrs["_is_child"] = is_child = False
         attrs["_is_root"] = poly
         attrs["_kind"] = kind = attrs.pop("_kind", classname)
@@ -412,7 +600,17 @@ class model(type):
                 if name not in properties:
                     properties[name] = prop
 
+            if lazy is None:
+                lazy = base._lazy
+
+        attrs["_lazy"] = lazy = bool(lazy)
         clazz = type.__new__(cls, classname, bases, attrs)
+        clazz._loader_plan, clazz._lazy_plan, clazz._embed_plan = _compile_loader_plan(properties, lazy)
+        clazz._loads_in_place = _can_load_in_place(properties, clazz)
+        clazz._projection_plans = {}
+        clazz._row_plans = {}
+        clazz._store_plan = _compile_store_plan(properties)
+        clazz._unindexed_names, clazz._indexed_if_plan = _compile_index_plan(properties)
 
         # Ensure that a single model maps to a single kind at runtime.
         with _known_models_lock:
@@ -429,6 +627,175 @@ class model(type):
         return self._is_root or self._is_child
 
 
+def _compile_loader_plan(properties, lazy):
+    loader_plan, lazy_plan, embed_plan = [], [], []
+    for name, prop in properties.items():
+        if isinstance(prop, EmbedLike):
+            embed_plan.append((name, prop))
+            continue
+
+        loader = _compile_loader(prop)
+        if loader is Skip:
+            continue
+
+        # Only values that need decoding are worth deferring.  Lazy
+        # values are decoded by the default descriptor and conditions
+        # can't see them so properties with custom descriptors or
+        # indexed_if conditions are always loaded eagerly.
+        is_lazy = lazy if prop.lazy is None else prop.lazy
+        if is_lazy and loader is not None and type(prop).__get__ is Property.__get__ and not prop.indexed_if:
+            lazy_plan.append((name, prop.name_on_entity, loader))
+        else:
+            loader_plan.append((name, prop.name_on_entity, loader))
+
+    return loader_plan, lazy_plan, embed_plan
+
+
+def _can_load_in_place(properties, clazz):
+    # Loading in place overwrites each value with its loaded
+    # counterpart so it's only possible when every property is both
+    # read from and written to the same name.
+    plans = clazz._loader_plan + clazz._lazy_plan
+    if clazz._embed_plan or len(plans) != len(properties):
+        return False
+
+    return all(name == name_on_entity for name, name_on_entity, _ in plans)
+
+
+def _compile_projection_plan(clazz, projection):
+    # Projected values are few and small so lazy properties are
+    # loaded eagerly as part of projections.
+    names = set(projection)
+    loader_plan = [step for step in clazz._loader_plan + clazz._lazy_plan if step[1] in names]
+    embed_plan = [
+        (name, prop) for name, prop in clazz._embed_plan
+        if any(projected.startswith(f"{prop.name_on_entity}.") for projected in names)
+    ]
+
+    return loader_plan, embed_plan
+
+
+def _compile_row_plan(clazz, projection):
+    # Rows hold values for every property, in the order they were
+    # declared in, unless a projection is given.  Computed values
+    # and values that don't belong to a property are returned as-is.
+    properties = {prop.name_on_entity: (name, prop) for name, prop in clazz._properties.items()}
+    names, steps = ["key"], []
+    for name_on_entity in projection or properties:
+        name, prop = properties.get(name_on_entity, (name_on_entity, None))
+        if prop is None:
+            loader = None
+        elif isinstance(prop, EmbedLike):
+            name_on_entity, loader = None, prop._prepare_to_load_embedded
+        else:
+            loader = _compile_loader(prop)
+            if loader is Skip:
+                loader = None
+
+        names.append(name)
+        steps.append((name_on_entity, loader))
+
+    return tuple(names), steps
+
+
+def _load_lazy_value(ob, name):
+    # Values are cached on the instance before they're removed from
+    # the lazy data so concurrent readers never see them as missing.
+    item = ob._lazy_data.get(name)
+    if item is None:
+        return NotFound
+
+    loader, value = item
+    value = loader(ob, value)
+    if value is not Skip:
+        ob._data[name] = value
+
+    ob._lazy_data.pop(name, None)
+    return ob._data.get(name, NotFound)
+
+
+def _compile_store_plan(properties, prefix=None):
+    # Embeds compile the plans of the models they embed with their
+    # own name as the prefix so that dotted names are only built once.
+    store_plan = []
+    for name, prop in properties.items():
+        # Properties that use the default descriptor can be read
+        # straight from an entity's data.
+        fast = type(prop).__get__ is Property.__get__
+        if isinstance(prop, EmbedLike):
+            if prefix is not None:
+                prop = copy(prop)
+                prop._name_on_entity = f"{prefix}.{prop.name_on_entity}"
+
+            store_plan.append((name, None, prop.prepare_to_store, fast, False))
+            continue
+
+        # Properties that are stored via prepare_to_store are
+        # responsible for checking their own values.
+        storer = _compile_storer(prop)
+        required = not prop.optional and storer != prop.prepare_to_store
+
+        name_on_entity = prop.name_on_entity if prefix is None else f"{prefix}.{prop.name_on_entity}"
+        store_plan.append((name, name_on_entity, storer, fast, required))
+
+    return store_plan
+
+
+def _prepare_to_store(entity, store_plan):
+    data = entity._data
+    for name, name_on_entity, storer, fast, required in store_plan:
+        value = data.get(name, NotFound) if fast else NotFound
+        if value is NotFound:
+            value = getattr(entity, name)
+
+        if name_on_entity is None:
+            yield from storer(entity, value)
+            continue
+
+        if storer is not None:
+            value = storer(entity, value)
+
+        if value is None and required:
+            raise RuntimeError(f"Property {name} requires a value.")
+
+        yield name_on_entity, value
+
+
+def _compile_index_plan(properties):
+    unindexed_names, indexed_if_plan = [], []
+    for name, prop in properties.items():
+        if isinstance(prop, EmbedLike):
+            continue
+
+        elif not prop.indexed:
+            unindexed_names.append(prop.name_on_entity)
+
+        elif prop.indexed_if:
+            indexed_if_plan.append((name, prop))
+
+    return tuple(unindexed_names), indexed_if_plan
+
+
+def _compile_storer(prop):
+    # Like loaders, storers can only be used if every class that
+    # overrides prepare_to_store also provides a storer.
+    for clazz in type(prop).__mro__:
+        if "prepare_to_store" in vars(clazz) and "_get_storer" not in vars(clazz):
+            return prop.prepare_to_store
+
+    return prop._get_storer()
+
+
+def _compile_loader(prop):
+    # Properties whose classes override prepare_to_load without also
+    # providing a loader have to go through prepare_to_load.
+    for clazz in type(prop).__mro__:
+        if "prepare_to_load" in vars(clazz) and "_get_loader" not in vars(clazz):
+            return prop.prepare_to_load
+
+    return prop._get_loader()
+
+
 class Model(metaclass=model):
     """Base class for Datastore models.
 
@@ -442,6 +809,14 @@ class Model(metaclass=model):
       query.
     """
 
+    #: The raw values of lazy properties that haven't been accessed
+    #: yet, along with their loaders.
+    _lazy_data = None
+
+    #: The names of the properties that were loaded into this entity
+    #: if it is the result of a projection query.
+    _projection = None
+
     def __init__(self, *, key=None, **properties):
         self.key = key or Key(self._kind)
 
@@ -452,53 +827,170 @@ class Model(metaclass=model):
 
             setattr(self, name, value)
 
+    def __getstate__(self):
+        # The loaders of lazy values can't be pickled so any pending
+        # values are decoded first.
+        if self._lazy_data:
+            for name in list(self._lazy_data):
+                getattr(self, name)
+
+        return self.__dict__
+
     def __iter__(self):
-        for name, prop in self._properties.items():
-            value = getattr(self, name)
-            if isinstance(prop, EmbedLike):
-                yield from prop.prepare_to_store(self, value)
-            else:
-                yield prop.name_on_entity, prop.prepare_to_store(self, value)
+        yield from _prepare_to_store(self, self._store_plan)
 
         # Polymorphic models need to keep track of their bases.
         if type(self)._is_polymorphic:
             yield model._kinds_name, self._kinds
 
     @classmethod
-    def _load(cls, key, data):
+    def _load(cls, key, data, *, owned=False):
         # Polymorphic models need to instantiate leaf classes.
         if cls._is_polymorphic and model._kinds_name in data:
             name = data[model._kinds_name][0]
             cls = lookup_model_by_kind(name)
 
-        instance = cls()
+        if owned and cls._loads_in_place and cls.__init__ is Model.__init__:
+            return cls._load_in_place(key, data)
+
+        if cls.__init__ is Model.__init__:
+            instance = cls.__new__(cls)
+            instance._data = {}
+        else:
+            instance = cls()
+
+        instance.key = key
+
+        instance_data, get = instance._data, data.get
+        for name, name_on_entity, loader in cls._loader_plan:
+            if loader is None:
+                instance_data[name] = get(name_on_entity)
+            else:
+                value = loader(instance, get(name_on_entity))
+                if value is not Skip:
+                    instance_data[name] = value
+
+        if cls._lazy_plan:
+            instance._lazy_data = lazy_data = {}
+            for name, name_on_entity, loader in cls._lazy_plan:
+                instance_data.pop(name, None)
+                lazy_data[name] = (loader, get(name_on_entity))
+
+        if cls._embed_plan:
+            embedded = _split_embedded(data)
+            for name, prop in cls._embed_plan:
+                instance_data[name] = prop._prepare_to_load_embedded(instance, data, embedded)
+
+        return instance
+
+    @classmethod
+    def _load_in_place(cls, key, data):
+        # Data that nothing else holds on to, such as query results,
+        # becomes the instance's data rather than being copied.
+        instance = cls.__new__(cls)
+        instance._data = data
         instance.key = key
 
-        for name, prop in instance._properties.items():
-            if isinstance(prop, EmbedLike):
-                instance._data[name] = prop.prepare_to_load(instance, data)
+        for name, _, loader in cls._loader_plan:
+            if loader is None:
+                if name not in data:
+                    data[name] = None
+            else:
+                value = loader(instance, data.get(name))
+                if value is Skip:
+                    data.pop(name, None)
+                else:
+                    data[name] = value
+
+        if cls._lazy_plan:
+            instance._lazy_data = {name: (loader, data.pop(name, None)) for name, _, loader in cls._lazy_plan}
+
+        return instance
+
+    @classmethod
+    def _load_projection(cls, key, data, projection):
+        # Polymorphic models need to instantiate leaf classes.
+        if cls._is_polymorphic and model._kinds_name in data:
+            name = data[model._kinds_name][0]
+            cls = lookup_model_by_kind(name)
+
+        plan = cls._projection_plans.get(projection)
+        if plan is None:
+            plan = cls._projection_plans[projection] = _compile_projection_plan(cls, projection)
 
+        if cls.__init__ is Model.__init__:
+            instance = cls.__new__(cls)
+            instance._data = {}
+        else:
+            instance = cls()
+
+        instance.key = key
+        instance._projection = projection
+
+        loader_plan, embed_plan = plan
+        instance_data, get = instance._data, data.get
+        for name, name_on_entity, loader in loader_plan:
+            if loader is None:
+                instance_data[name] = get(name_on_entity)
             else:
-                value = prop.prepare_to_load(instance, data.get(name))
+                value = loader(instance, get(name_on_entity))
                 if value is not Skip:
-                    instance._data[name] = value
+                    instance_data[name] = value
+
+        if embed_plan:
+            embedded = _split_embedded(data)
+            for name, prop in embed_plan:
+                instance_data[name] = prop._prepare_to_load_embedded(instance, data, embedded)
 
         return instance
 
+    @classmethod
+    def _load_row(cls, key, data, projection=(), *, as_dict=False):
+        if data is None:
+            return {"key": key} if as_dict else (key,)
+
+        plan = cls._row_plans.get(projection)
+        if plan is None:
+            plan = cls._row_plans[projection] = _compile_row_plan(cls, projection)
+
+        names, steps = plan
+        row, get, embedded = [key], data.get, None
+        for name_on_entity, loader in steps:
+            if name_on_entity is None:
+                if embedded is None:
+                    embedded = _split_embedded(data)
+
+                value = loader(None, data, embedded)
+            elif loader is None:
+                value = get(name_on_entity)
+            else:
+                value = loader(None, get(name_on_entity))
+                if value is Skip:
+                    value = None
+
+            row.append(value)
+
+        if as_dict:
+            return dict(zip(names, row))
+        return tuple(row)
+
     @property
     def unindexed_properties(self):
         "tuple[str]: The names of all the unindexed properties on this entity."
-        properties = ()
-        for name, prop in self._properties.items():
-            if isinstance(prop, EmbedLike):
-                embedded_entity = getattr(self, name, None)
-                if embedded_entity:
-                    properties += prop.get_unindexed_properties(embedded_entity)
+        if not self._indexed_if_plan and not self._embed_plan:
+            return self._unindexed_names
+
+        properties = list(self._unindexed_names)
+        for name, prop in self._indexed_if_plan:
+            if not prop.indexed_if(self, prop, name):
+                properties.append(prop.name_on_entity)
 
-            elif not prop.indexed or prop.indexed_if and not prop.indexed_if(self, prop, name):
-                properties += (prop.name_on_entity,)
+        for name, prop in self._embed_plan:
+            embedded_entity = getattr(self, name, None)
+            if embedded_entity:
+                properties.extend(prop.get_unindexed_properties(embedded_entity))
 
-        return properties
+        return tuple(properties)
 
     @classmethod
     def pre_get_hook(cls, key):
@@ -530,6 +1022,21 @@ class Model(metaclass=model):
         """
         return Key(cls, id_or_name, parent=parent, namespace=namespace).get()
 
+    @classmethod
+    async def aget(cls, id_or_name, *, parent=None, namespace=None):
+        """Get an entity by id using the current async adapter.
+
+        Parameters:
+          id_or_name(int or str): The entity's id.
+          parent(anom.Key, optional): The entity's parent Key.
+          namespace(str, optional): The entity's namespace.
+
+        Returns:
+          Model: An entity or ``None`` if the entity doesn't exist in
+          Datastore.
+        """
+        return await Key(cls, id_or_name, parent=parent, namespace=namespace).aget()
+
     @classmethod
     def pre_delete_hook(cls, key):
         """A hook that runs before an entity is deleted.  Raising an
@@ -556,6 +1063,16 @@ class Model(metaclass=model):
         """
         return delete_multi([self.key])
 
+    async def adelete(self):
+        """Delete this entity from Datastore using the current async
+        adapter.
+
+        Raises:
+          RuntimeError: If this entity was never stored (i.e. if its
+            key is partial).
+        """
+        return await adelete_multi([self.key])
+
     def pre_put_hook(self):
         """A hook that runs before this entity is persisted.  Raising
         an exception here will prevent the entity from being persisted.
@@ -570,6 +1087,12 @@ class Model(metaclass=model):
         """
         return put_multi([self])[0]
 
+    async def aput(self):
+        """Persist this entity to Datastore using the current async
+        adapter.
+        """
+        return (await aput_multi([self]))[0]
+
     @classmethod
     def query(cls, **options):
         """Return a new query for this Model.
@@ -653,22 +1176,51 @@ def delete_multi(keys):
     if not keys:
         return
 
-    adapter = None
+    model = _prepare_to_delete(keys)
+    _evict(keys)
+    model._adapter.delete_multi(keys)
+    _finish_delete(keys)
+
+
+async def adelete_multi(keys):
+    """Delete a set of entities from Datastore by their respective
+    keys using the current async adapter.
+
+    See:
+      :func:`delete_multi`.
+
+    Parameters:
+      keys(list[anom.Key]): The list of keys whose entities to delete.
+    """
+    if not keys:
+        return
+
+    model = _prepare_to_delete(keys)
+    _evict(keys)
+    await model._async_adapter.delete_multi(keys)
+    _finish_delete(keys)
+
+
+def _prepare_to_delete(keys):
+    first_model = None
     for key in keys:
         if key.is_partial:
             raise RuntimeError(f"Key {key!r} is partial.")
 
         model = lookup_model_by_kind(key.kind)
-        if adapter is None:
-            adapter = model._adapter
+        if first_model is None:
+            first_model = model
 
         model.pre_delete_hook(key)
 
-    adapter.delete_multi(keys)
+    return first_model
+
+
+def _finish_delete(keys):
     for key in keys:
         # Micro-optimization to avoid calling get_model.  This is OK
         # to do here because we've already proved that a model for
-        # that kind exists in the previous block.
+        # that kind exists in _prepare_to_delete.
         model = _known_models[key.kind]
         model.post_delete_hook(key)
 
@@ -702,18 +1254,64 @@ def get_multi(keys):
     if not keys:
         return []
 
-    adapter = None
+    model = _prepare_to_get(keys)
+    adapter = model._adapter
+    identity_map = _get_identity_map(adapter)
+    if identity_map is None:
+        return _finish_get(keys, adapter.get_multi(keys))
+
+    missing = identity_map._get_missing(keys)
+    if missing:
+        identity_map.update(zip(missing, _finish_get(missing, adapter.get_multi(missing))))
+    return identity_map._get_multi(keys)
+
+
+async def aget_multi(keys):
+    """Get a set of entities from Datastore by their respective keys
+    using the current async adapter.
+
+    See:
+      :func:`get_multi`.
+
+    Parameters:
+      keys(list[anom.Key]): The list of keys whose entities to get.
+
+    Returns:
+      list[Model]: Entities that do not exist are going to be None
+      in the result list.
+    """
+    if not keys:
+        return []
+
+    model = _prepare_to_get(keys)
+    adapter = model._async_adapter
+    identity_map = _get_identity_map(adapter)
+    if identity_map is None:
+        return _finish_get(keys, await adapter.get_multi(keys))
+
+    missing = identity_map._get_missing(keys)
+    if missing:
+        identity_map.update(zip(missing, _finish_get(missing, await adapter.get_multi(missing))))
+    return identity_map._get_multi(keys)
+
+
+def _prepare_to_get(keys):
+    first_model = None
     for key in keys:
         if key.is_partial:
             raise RuntimeError(f"Key {key!r} is partial.")
 
         model = lookup_model_by_kind(key.kind)
-        if adapter is None:
-            adapter = model._adapter
+        if first_model is None:
+            first_model = model
 
         model.pre_get_hook(key)
 
-    entities_data, entities = adapter.get_multi(keys), []
+    return first_model
+
+
+def _finish_get(keys, entities_data):
+    entities = []
     for key, entity_data in zip(keys, entities_data):
         if entity_data is None:
             entities.append(None)
@@ -721,7 +1319,7 @@ def get_multi(keys):
 
         # Micro-optimization to avoid calling get_model.  This is OK
         # to do here because we've already proved that a model for
-        # that kind exists in the previous block.
+        # that kind exists in _prepare_to_get.
         model = _known_models[key.kind]
         entity = model._load(key, entity_data)
         entities.append(entity)
@@ -756,17 +1354,65 @@ def put_multi(entities):
     if not entities:
         return []
 
-    adapter, requests = None, []
+    adapter, requests = entities[0]._adapter, _prepare_to_put(entities)
+    return _finish_put(adapter, adapter.put_multi(requests), entities)
+
+
+async def aput_multi(entities):
+    """Persist a set of entities to Datastore using the current async
+    adapter.
+
+    See:
+      :func:`put_multi`.
+
+    Parameters:
+      entities(list[Model]): The list of entities to persist.
+
+    Returns:
+      list[Model]: The list of persisted entitites.
+    """
+    if not entities:
+        return []
+
+    adapter, requests = entities[0]._async_adapter, _prepare_to_put(entities)
+    return _finish_put(adapter, await adapter.put_multi(requests), entities)
+
+
+def _prepare_to_put(entities):
+    requests = []
     for entity in entities:
-        if adapter is None:
-            adapter = entity._adapter
+        if entity._projection is not None:
+            raise RuntimeError(f"Cannot store {classname(entity)} entities loaded from projection queries.")
 
         entity.pre_put_hook()
         requests.append(PutRequest(entity.key, entity.unindexed_properties, entity))
 
-    keys = adapter.put_multi(requests)
+    _evict(entity.key for entity in entities if not entity.key.is_partial)
+    return requests
+
+
+def _finish_put(adapter, keys, entities):
     for key, entity in zip(keys, entities):
         entity.key = key
         entity.post_put_hook()
 
+    identity_map = _get_identity_map(adapter)
+    if identity_map is not None:
+        identity_map.update((entity.key, entity) for entity in entities)
+
     return entities
+
+
+def _get_identity_map(adapter):
+    # Transactions bypass the identity map so that they always read
+    # the latest data and so that their writes don't leak into it
+    # before they're committed.
+    if adapter.in_transaction:
+        return None
+    return get_identity_map()
+
+
+def _evict(keys):
+    identity_map = get_identity_map()
+    if identity_map is not None:
+        identity_map.evict(keys)
@@ -1,8 +1,12 @@
 from contextlib import contextmanager
-from threading import local
+from contextvars import ContextVar
 
 _default_namespace = ""
-_namespace = local()
+
+#: The namespace for the current context.  Each thread starts out
+#: with an empty context and asyncio tasks inherit a copy of the
+#: context they were created in.
+_namespace = ContextVar("anom.namespace", default=None)
 
 
 def set_default_namespace(namespace=None):
@@ -20,43 +24,36 @@ def set_default_namespace(namespace=None):
 
 
 def get_namespace():
-    """str: The namespace for the current thread.
+    """str: The namespace for the current thread or task.
     """
-    try:
-        return _namespace.current
-    except AttributeError:
+    namespace = _namespace.get()
+    if namespace is None:
         return _default_namespace
+    return namespace
 
 
 def set_namespace(namespace=None):
-    """Set the current thread-local default namespace.  If namespace
-    is None, then the thread-local namespace value is removed, forcing
+    """Set the default namespace for the current thread or task.  If
+    namespace is None, then the local namespace value is removed, forcing
     `get_namespace()` to return the global default namespace on
     subsequent calls.
 
     Parameters:
-      namespace(str): namespace to set as the current thread-local
+      namespace(str): namespace to set as the current context-local
         default.
 
     Returns:
       None
     """
-    if namespace is None:
-        try:
-            del _namespace.current
-        except AttributeError:
-            pass
-
-    else:
-        _namespace.current = namespace
+    _namespace.set(namespace)
 
 
 @contextmanager
 def namespace(namespace):
-    """Context manager for stacking the current thread-local default
-    namespace.  Exiting the context sets the thread-local default
+    """Context manager for stacking the current context-local default
+    namespace.  Exiting the context sets the context-local default
     namespace back to the previously-set namespace.  If there is no
-    previous namespace, then the thread-local namespace is cleared.
+    previous namespace, then the context-local namespace is cleared.
 
     Example:
       >>> with namespace("foo"):
@@ -67,19 +64,14 @@ def namespace(namespace):
       >>> assert get_namespace() == ""
 
     Parameters:
-      namespace(str): namespace to set as the current thread-local
+      namespace(str): namespace to set as the current context-local
         default.
 
     Returns:
       None
     """
-    try:
-        current_namespace = _namespace.current
-    except AttributeError:
-        current_namespace = None
-
-    set_namespace(namespace)
+    token = _namespace.set(namespace)
     try:
         yield
     finally:
-        set_namespace(current_namespace)
+        _namespace.reset(token)
@@ -1,19 +1,18 @@
 import base64
-import json
 import msgpack
-import operator
-import zlib
 
 from collections import defaultdict
 from copy import copy
 from datetime import datetime
 from dateutil import tz
 from enum import IntEnum
-from functools import reduce
+from functools import partial
 from itertools import chain
+from threading import local
 
-from . import model
+from . import compression, model
 from .model import EmbedLike, Property, NotFound, Skip, classname
+from .serializers import get_json_backend
 
 
 #: The UNIX epoch.
@@ -40,37 +39,86 @@ class Blob:
 
 
 class Compressable(Blob):
-    """Mixin for Properties whose values can be gzipped before being
-    persisted.
+    """Mixin for Properties whose values can be compressed before
+    being persisted.  Values are stored along with the codec that
+    compressed them so changing a property's codec doesn't affect
+    values that were already stored.  Values that were stored before
+    a property was made compressed are loaded as they are.
 
     Parameters:
       compressed(bool): Whether or not values belonging to this
-        Property should be stored gzipped in Datastore.
+        Property should be stored compressed in Datastore.
       compression_level(int): The amount of compression to apply.
-        See :func:`zlib.compress` for details.
+        Each codec supports a different range of levels.  Defaults to
+        ``-1``, which stands for the codec's default level.
+      codec(str): The name of the compression codec to use.  One of
+        ``"zlib"``, ``"lzma"``, ``"lz4"`` or ``"zstd"``, when they are
+        installed.  Defaults to ``"zlib"``.  See
+        :func:`anom.compression.register_codec`.
+      min_size(int): Values that are smaller than this many bytes are
+        stored uncompressed.  Defaults to ``0``.
     """
 
-    def __init__(self, *, compressed=False, compression_level=-1, **options):
-        if not (-1 <= compression_level <= 9):
-            raise ValueError("compression_level must be an integer between -1 and 9.")
+    def __init__(self, *, compressed=False, compression_level=-1, codec="zlib", min_size=0, **options):
+        levels = compression.get_codec(codec).levels
+        if compression_level != -1 and compression_level not in levels:
+            raise ValueError(
+                f"compression_level must be -1 or an integer between "
+                f"{levels[0]} and {levels[-1]} for {codec!r}."
+            )
 
         super().__init__(**options)
 
         self.compressed = compressed
         self.compression_level = compression_level
+        self.codec = codec
+        self.min_size = min_size
 
     def prepare_to_load(self, entity, value):
         if value is not None and self.compressed:
-            value = zlib.decompress(value)
+            value = compression.decompress(value)
 
         return super().prepare_to_load(entity, value)
 
+    def _get_loader(self):
+        loader = super()._get_loader()
+        if not self.compressed:
+            return loader
+
+        decompress = compression.decompress
+        if loader is None:
+            return lambda entity, value: value if value is None else decompress(value)
+        return lambda entity, value: loader(entity, value if value is None else decompress(value))
+
     def prepare_to_store(self, entity, value):
         if value is not None and self.compressed:
-            value = zlib.compress(value, level=self.compression_level)
+            value = self._compress(value)
 
         return super().prepare_to_store(entity, value)
 
+    def _get_storer(self):
+        storer = super()._get_storer()
+        if not self.compressed:
+            return storer
+
+        compress = self._compress
+        if storer is None:
+            return lambda entity, value: value if value is None else compress(value)
+        return lambda entity, value: storer(entity, value if value is None else compress(value))
+
+    def _compress(self, value):
+        # Serializers may produce text rather than bytes.
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+
+        codec = compression.get_codec(self.codec)
+        return compression.compress(value, codec, self.compression_level, self.min_size)
+
+
+#: The types of values that Encodable properties decode.  Decoding
+#: works straight off of any buffer so none of them are copied first.
+_encoded_types = (list, bytes, bytearray, memoryview)
+
 
 class Encodable:
     """Mixin for string properties that have an encoding.
@@ -90,14 +138,32 @@ class Encodable:
 
         # BUG(gcloud): Projections seem to cause bytes to be
         # loaded as strings so this instance check is required.
-        if value is not None and isinstance(value, (list, bytes)):
+        if value is not None and isinstance(value, _encoded_types):
             if self.repeated:
-                value = [v.decode(self.encoding) for v in value]
+                value = [str(v, self.encoding) for v in value]
             else:
-                value = value.decode(self.encoding)
+                value = str(value, self.encoding)
 
         return value
 
+    def _get_loader(self):
+        loader, encoding = super()._get_loader(), self.encoding
+        if self.repeated:
+            def decode(value):
+                if isinstance(value, _encoded_types):
+                    return [str(v, encoding) for v in value]
+                return value
+
+        else:
+            def decode(value):
+                if isinstance(value, _encoded_types):
+                    return str(value, encoding)
+                return value
+
+        if loader is None:
+            return lambda entity, value: decode(value)
+        return lambda entity, value: decode(loader(entity, value))
+
     def prepare_to_store(self, entity, value):
         if value is not None:
             if self.repeated:
@@ -107,6 +173,20 @@ class Encodable:
 
         return super().prepare_to_store(entity, value)
 
+    def _get_storer(self):
+        storer, encoding = super()._get_storer(), self.encoding
+        if self.repeated:
+            def encode(value):
+                return value if value is None else [v.encode(encoding) for v in value]
+
+        else:
+            def encode(value):
+                return value if value is None else value.encode(encoding)
+
+        if storer is None:
+            return lambda entity, value: encode(value)
+        return lambda entity, value: storer(entity, encode(value))
+
 
 class Serializer(Compressable, Property):
     """Base class for properties that serialize data.
@@ -146,10 +226,23 @@ class Serializer(Compressable, Property):
         return instance
 
     def prepare_to_load(self, entity, value):
+        # Values have to be decompressed before they're deserialized.
+        value = super().prepare_to_load(entity, value)
         if value is not None:
             value = self._loads(value)
 
-        return super().prepare_to_load(entity, value)
+        return value
+
+    def _get_loader(self):
+        loader, loads = super()._get_loader(), self._loads
+        if loader is None:
+            return lambda entity, value: value if value is None else loads(value)
+
+        def load(entity, value):
+            value = loader(entity, value)
+            return value if value is None else loads(value)
+
+        return load
 
     def prepare_to_store(self, entity, value):
         if value is not None:
@@ -157,6 +250,12 @@ class Serializer(Compressable, Property):
 
         return super().prepare_to_store(entity, value)
 
+    def _get_storer(self):
+        storer, dumps = super()._get_storer(), self._dumps
+        if storer is None:
+            return lambda entity, value: value if value is None else dumps(value)
+        return lambda entity, value: storer(entity, value if value is None else dumps(value))
+
 
 class Bool(Property):
     """A Property for boolean values.
@@ -208,6 +307,9 @@ class Bytes(Compressable, Property):
         be compressed before being persisted.
       compression_level(int, optional): The amount of compression to
         apply when compressing values.
+      codec(str, optional): The compression codec to use.
+      min_size(int, optional): The minimum size of values that are
+        compressed.
     """
 
     _types = (bytes,)
@@ -276,6 +378,9 @@ class Computed(Property):
     def prepare_to_load(self, entity, value):
         return Skip
 
+    def _get_loader(self):
+        return Skip
+
 
 class DateTime(Property):
     """A Property for :class:`datetime.datetime` values.
@@ -324,6 +429,15 @@ class DateTime(Property):
 
         return super().prepare_to_load(entity, value)
 
+    def _get_loader(self):
+        loader, utc = super()._get_loader(), tz.tzutc()
+
+        def load(entity, value):
+            if isinstance(value, int):
+                value = datetime.fromtimestamp(value / 1000000, utc)
+            return value if loader is None else loader(entity, value)
+        return load
+
     def prepare_to_store(self, entity, value):
         if value is None and self.auto_now_add:
             value = entity._data[self.name_on_model] = self._current_value()
@@ -335,6 +449,20 @@ class DateTime(Property):
 
         return super().prepare_to_store(entity, value)
 
+    def _get_storer(self):
+        storer, name, utc = super()._get_storer(), self.name_on_model, tz.tzutc()
+        auto_now, auto_now_add, current_value = self.auto_now, self.auto_now_add, self._current_value
+
+        def store(entity, value):
+            if auto_now or value is None and auto_now_add:
+                value = current_value()
+
+            if value is not None:
+                value = entity._data[name] = value.astimezone(utc)
+
+            return value if storer is None else storer(entity, value)
+        return store
+
     def validate(self, value):
         value = super().validate(value)
         if value is not None and not value.tzinfo:
@@ -402,12 +530,31 @@ class Json(Serializer):
         be compressed before being persisted.
       compression_level(int, optional): The amount of compression to
         apply when compressing values.
+      codec(str, optional): The compression codec to use.
+      min_size(int, optional): The minimum size of values that are
+        compressed.
+      backend(str, optional): The name of the JSON backend to use.
+        Defaults to the default backend.  See
+        :func:`anom.serializers.set_default_json_backend`.
     """
 
     #: The name of the field that is used to store type information
     #: about non-standard JSON values.
     _type_field = "__anom_type"
 
+    def __init__(self, *, backend=None, **options):
+        if backend is not None:
+            get_json_backend(backend)
+
+        super().__init__(**options)
+
+        self.backend = backend
+        if backend is not None:
+            # Properties that use a specific backend bind it to their
+            # own dumps and loads.
+            self._dumps = partial(self._dumps, backend=backend)
+            self._loads = partial(self._loads, backend=backend)
+
     @classmethod
     def _serialize(cls, value):
         if isinstance(value, bytes):
@@ -419,6 +566,9 @@ class Json(Serializer):
         elif isinstance(value, model.Model):
             kind, value = "model", cls._entity_to_dict(value)
 
+        elif isinstance(value, model.Key):
+            return list(value)
+
         else:
             raise TypeError(f"Value of type {type(value)} cannot be serialized.")
 
@@ -444,12 +594,17 @@ class Json(Serializer):
             raise ValueError(f"Invalid kind {kind!r}.")
 
     @classmethod
-    def _dumps(cls, value):
-        return json.dumps(value, separators=(",", ":"), default=Json._serialize)
+    def _dumps(cls, value, backend=None):
+        return get_json_backend(backend).dumps(value, cls._serialize)
 
     @classmethod
-    def _loads(cls, data):
-        return json.loads(data, object_hook=Json._deserialize)
+    def _loads(cls, data, backend=None):
+        # Most documents don't contain any values of non-standard
+        # types so the hook can usually be skipped altogether.
+        type_field = cls._type_field if isinstance(data, str) else cls._type_field.encode("utf-8")
+        if type_field in data:
+            return get_json_backend(backend).loads(data, cls._deserialize)
+        return get_json_backend(backend).loads(data)
 
 
 class Key(Property):
@@ -522,12 +677,22 @@ class Msgpack(Serializer):
         be compressed before being persisted.
       compression_level(int, optional): The amount of compression to
         apply when compressing values.
+      codec(str, optional): The compression codec to use.
+      min_size(int, optional): The minimum size of values that are
+        compressed.
     """
 
     class Extensions(IntEnum):
         Model = 0
         DateTime = 1
 
+    #: A mapping from extension codes to extensions.  Looking codes
+    #: up here is much cheaper than calling Extensions.
+    _extensions = {int(kind): kind for kind in Extensions}
+
+    #: Packers that aren't currently in use, by thread and class.
+    _packers = local()
+
     @classmethod
     def _serialize(cls, value):
         if isinstance(value, model.Model):
@@ -536,6 +701,9 @@ class Msgpack(Serializer):
         elif isinstance(value, datetime):
             kind, value = cls.Extensions.DateTime, _seconds_since_epoch(value)
 
+        elif isinstance(value, model.Key):
+            return tuple(value)
+
         else:
             raise TypeError(f"Value of type {type(value)} cannot be serialized.")
 
@@ -543,9 +711,8 @@ class Msgpack(Serializer):
 
     @classmethod
     def _deserialize(cls, code, data):
-        try:
-            kind = cls.Extensions(code)
-        except ValueError:
+        kind = cls._extensions.get(code)
+        if kind is None:
             raise ValueError(f"Invalid extension code {code}.")
 
         value = cls._loads(data)
@@ -557,10 +724,30 @@ class Msgpack(Serializer):
 
     @classmethod
     def _dumps(cls, value):
-        return msgpack.packb(value, default=cls._serialize, use_bin_type=True)
+        # Extension values are packed while the values that contain
+        # them are still being packed so every level of nesting needs
+        # a packer of its own.  Packers that fail are discarded since
+        # they may be left holding partially packed data.
+        try:
+            packers = cls._packers.by_class
+        except AttributeError:
+            packers = cls._packers.by_class = {}
+
+        free_packers = packers.get(cls)
+        if free_packers is None:
+            free_packers = packers[cls] = []
+
+        packer = free_packers.pop() if free_packers else msgpack.Packer(default=cls._serialize, use_bin_type=True)
+        data = packer.pack(value)
+        free_packers.append(packer)
+        return data
 
     @classmethod
     def _loads(cls, data):
+        # Unlike packers, unpackers aren't pooled.  Feeding an unpacker
+        # copies the data into its own buffer, and one that fails is
+        # left holding leftover bytes, so unpackb is both faster and
+        # simpler for values that are unpacked in one go.
         return msgpack.unpackb(data, ext_hook=cls._deserialize, encoding="utf-8")
 
 
@@ -625,12 +812,30 @@ class Text(Encodable, Compressable, Property):
         be compressed before being persisted.
       compression_level(int, optional): The amount of compression to
         apply when compressing values.
+      codec(str, optional): The compression codec to use.
+      min_size(int, optional): The minimum size of values that are
+        compressed.
       encoding(str): The encoding to use when persisting this Property
         to Datastore.  Defaults to ``utf-8``.
     """
 
     _types = (str,)
 
+    def prepare_to_load(self, entity, value):
+        if value is None or not self.compressed or self.repeated:
+            return super().prepare_to_load(entity, value)
+
+        # Compressed text is decoded as it's decompressed rather than
+        # being decompressed into bytes first.
+        return compression.decompress_text(value, self.encoding)
+
+    def _get_loader(self):
+        if not self.compressed or self.repeated:
+            return super()._get_loader()
+
+        decompress_text, encoding = compression.decompress_text, self.encoding
+        return lambda entity, value: value if value is None else decompress_text(value, encoding)
+
 
 class Embed(EmbedLike):
     """A property for embedding entities inside other entities.
@@ -657,17 +862,32 @@ class Embed(EmbedLike):
         else:
             self.kind = kind
 
+        self._store_plans = {}
+        self._unindexed_names = {}
+
     def __copy__(self):
         prop = type(self)(kind=self.kind)
         for name in vars(self):
             setattr(prop, name, getattr(self, name))
 
+        # Copies may be renamed so they can't share cached names.
+        prop._store_plans = {}
+        prop._unindexed_names = {}
         return prop
 
     def get_unindexed_properties(self, entity):
         if isinstance(entity, list):
-            return tuple(set(chain.from_iterable(self.get_unindexed_properties(e) for e in entity)))
-        return tuple(f"{self.name_on_entity}.{name}" for name in entity.unindexed_properties)
+            names = {e.unindexed_properties for e in entity}
+            return tuple(set(chain.from_iterable(self._get_unindexed_names(n) for n in names)))
+        return self._get_unindexed_names(entity.unindexed_properties)
+
+    def _get_unindexed_names(self, names):
+        unindexed_names = self._unindexed_names.get(names)
+        if unindexed_names is None:
+            unindexed_names = tuple(f"{self.name_on_entity}.{name}" for name in names)
+            self._unindexed_names[names] = unindexed_names
+
+        return unindexed_names
 
     def validate(self, value):
         if self.optional and value is None:
@@ -686,25 +906,31 @@ class Embed(EmbedLike):
         embed_prefix = f"{self.name_on_entity}."
         embed_prefix_len = len(embed_prefix)
         data = {k[embed_prefix_len:]: v for k, v in data.items() if k.startswith(embed_prefix)}
+        return self._prepare_to_load_values(data)
+
+    def _prepare_to_load_embedded(self, entity, data, embedded):
+        # Names that contain dots aren't split up on their own.
+        if "." in self.name_on_entity:
+            return self.prepare_to_load(entity, data)
+        return self._prepare_to_load_values(embedded.get(self.name_on_entity, {}))
+
+    def _prepare_to_load_values(self, data):
         if self.repeated:
             return self._prepare_to_load_repeated_properties(data)
         return self._prepare_to_load_properties(data)
 
     def _prepare_to_load_repeated_properties(self, data):
-        datas = [{} for _ in range(len(next(iter(data.values()))))]
-        for key, values in data.items():
-            for i, value in enumerate(values):
-                datas[i][key] = value
-
-        return [self._prepare_to_load_properties(data) for data in datas]
+        names = tuple(data)
+        return [self._prepare_to_load_properties(dict(zip(names, values))) for values in zip(*data.values())]
 
     def _prepare_to_load_properties(self, data):
         if self.optional and not data:
             return None
 
+        # The data is always a fresh dict so instances may take it over.
         model_class = model.lookup_model_by_kind(self.kind)
         model_key = model.Key(self.kind)
-        return model_class._load(model_key, data)
+        return model_class._load(model_key, data, owned=True)
 
     def prepare_to_store(self, entity, value):
         if value is not None:
@@ -717,32 +943,70 @@ class Embed(EmbedLike):
         elif not self.optional:
             raise RuntimeError(f"Property {self.name_on_model} requires a value.")
 
+    def _get_store_plan(self, model_class):
+        # Plans are compiled per model class since embedded entities
+        # may be instances of subclasses of this property's kind.
+        store_plan = self._store_plans.get(model_class)
+        if store_plan is None:
+            store_plan = model._compile_store_plan(model_class._properties, self.name_on_entity)
+            self._store_plans[model_class] = store_plan
+
+        return store_plan
+
     def _prepare_to_store_repeated_properties(self, entities):
-        properties = defaultdict(list)
-        for entity in entities:
-            for name, value in self._prepare_to_store_properties(entity):
-                properties[name].append(value)
-
-        # Ensure all sublists are equal, otherwise rebuilding the
-        # entity is not going to be possible.
-        props_are_valid = reduce(operator.eq, (len(val) for val in properties.values()))
-        if not props_are_valid:  # pragma: no cover
-            raise ValueError(
-                "Repeated properties for {self.name_on_model} have different lengths. "
-                "You probably just found a bug in anom, please report it!"
-            )
+        if not entities:
+            return
+
+        model_class = type(entities[0])
+        if any(type(entity) is not model_class for entity in entities):
+            columns = defaultdict(list)
+            for entity in entities:
+                for name, value in self._prepare_to_store_properties(entity):
+                    columns[name].append(value)
+
+            yield from self._check_columns(columns, len(entities))
+            return
+
+        # Entities of the same class are stored a property at a time.
+        for name, name_on_entity, storer, fast, required in self._get_store_plan(model_class):
+            values = [entity._data.get(name, NotFound) for entity in entities] if fast else [NotFound] * len(entities)
+            if any(value is NotFound for value in values):
+                values = [
+                    getattr(entity, name) if value is NotFound else value
+                    for entity, value in zip(entities, values)
+                ]
+
+            if name_on_entity is None:
+                columns = defaultdict(list)
+                for entity, value in zip(entities, values):
+                    for nested_name, nested_value in storer(entity, value):
+                        columns[nested_name].append(nested_value)
+
+                yield from self._check_columns(columns, len(entities))
+                continue
+
+            if storer is not None:
+                values = [storer(entity, value) for entity, value in zip(entities, values)]
+
+            if required and any(value is None for value in values):
+                raise RuntimeError(f"Property {name} requires a value.")
+
+            yield name_on_entity, values
+
+    def _check_columns(self, columns, size):
+        # Ensure all columns are of equal length, otherwise rebuilding
+        # the entities is not going to be possible.
+        for name, values in columns.items():
+            if len(values) != size:
+                raise ValueError(
+                    f"Repeated properties for {self.name_on_model} have different lengths. "
+                    f"Every embedded entity must have a value for {name}."
+                )
 
-        for name, values in properties.items():
             yield name, values
 
     def _prepare_to_store_properties(self, entity):
-        for name, prop in entity._properties.items():
-            value = getattr(entity, name)
-            if isinstance(prop, EmbedLike):
-                for name, value in prop.prepare_to_store(entity, value):
-                    yield f"{self.name_on_entity}.{name}", value
-            else:
-                yield f"{self.name_on_entity}.{prop.name_on_entity}", prop.prepare_to_store(entity, value)
+        return model._prepare_to_store(entity, self._get_store_plan(type(entity)))
 
     def __getattr__(self, name):
         model_class = model.lookup_model_by_kind(self.kind)
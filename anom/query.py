@@ -1,5 +1,12 @@
-from collections import namedtuple
+import time
 
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from queue import Queue
+from threading import Event, Semaphore, Thread
+
+from .context import bind_context, submit_with_context
 from .namespaces import get_namespace
 
 
@@ -23,6 +30,17 @@ class QueryOptions(dict):
       offset(int, optional): The number of results to skip.
       cursor(str, optional): A url-safe cursor representing where in
         the result set the query should start.
+      prefetch(int, optional): The number of batches to fetch in the
+        background ahead of the batch that is being iterated over.  Up
+        to ``prefetch + 1`` batches are held in memory at a time.
+      as_rows(bool or type, optional): Whether or not results should
+        be returned as rows of values rather than as entities.  Rows
+        are tuples of each entity's key followed by its property
+        values.  Pass ``dict`` to get back dicts keyed by property
+        name instead.
+      columns(tuple[str], optional): The names of the properties to
+        include in each row.  Defaults to the query's projection or,
+        if there isn't one, to all of the model's properties.
     """
 
     def __init__(self, query, **options):
@@ -77,6 +95,21 @@ class QueryOptions(dict):
     def cursor(self, value):
         self["cursor"] = value
 
+    @property
+    def prefetch(self):
+        "int: The number of batches to fetch ahead of time."
+        return self.get("prefetch", 0)
+
+    @property
+    def as_rows(self):
+        "bool or type: Whether or not results should be rows and, if so, which type of row."
+        return self.get("as_rows", False)
+
+    @property
+    def columns(self):
+        "tuple[str]: The names of the properties to include in each row."
+        return self.get("columns", ())
+
 
 class Resultset:
     """An iterator for datastore query results.
@@ -109,41 +142,138 @@ class Resultset:
     def __next__(self):
         return next(self._entities)
 
-    def _get_batches(self):
-        from .adapter import get_adapter
+    def __aiter__(self):
+        return self._aget_entities()
 
-        remaining = self._options.limit
-        while True:
-            adapter = self._query.model._adapter if self._query.model else get_adapter()
-            entities, self._options.cursor = adapter.query(self._query, self._options)
-            if remaining is not None:
-                remaining -= len(entities)
-                if remaining < 0:
-                    entities = entities[:remaining]
+    def _load(self, key, data):
+        # Rows always hold the columns of the model being queried so
+        # that rows of polymorphic models line up with one another.
+        if self._options.as_rows:
+            model = self._query.model or key.get_model()
+            columns = self._options.columns or self._query.projection
+            return model._load_row(key, data, columns, as_dict=self._options.as_rows is dict)
 
-            if not entities:
+        # Projection queries produce partial entities that only load
+        # the projected properties.  Other query results aren't shared
+        # with anything else so entities take ownership of their data.
+        if self._query.projection:
+            return key.get_model()._load_projection(key, data, self._query.projection)
+        return key.get_model()._load(key, data, owned=True)
+
+    def _get_batches(self):
+        if self._options.prefetch:
+            batches = self._prefetch_batches(self._options.prefetch)
+        else:
+            batches = self._fetch_batches(self._options)
+
+        for entities, count, self._options.cursor in batches:
+            if not count:
                 break
 
             # If we received fewer entities than we asked for then we
             # can safely say that we've finished iterating.  We have
             # to do this before yielding, however.
-            if len(entities) < self._options.batch_size:
+            if count < self._options.batch_size:
                 self._complete = True
 
-            if self._options.keys_only:
+            if self._options.keys_only and not self._options.as_rows:
                 yield (key for key, _ in entities)
             else:
-                yield (key.get_model()._load(key, data) for key, data in entities)
+                yield (self._load(key, data) for key, data in entities)
+
+        self._complete = True
 
-            if remaining is not None and remaining <= 0:
+    def _fetch_batches(self, options):
+        from .adapter import get_adapter
+
+        remaining = options.limit
+        while True:
+            adapter = self._query.model._adapter if self._query.model else get_adapter()
+            entities, options.cursor = adapter.query(self._query, options)
+            entities, count, remaining = _take(entities, remaining)
+            yield entities, count, options.cursor
+            if not count or remaining is not None and remaining <= 0:
                 break
 
-        self._complete = True
+    def _prefetch_batches(self, prefetch):
+        # The worker fetches batches using its own copy of the options
+        # so that the cursor visible to the caller always points past
+        # the batch that is currently being iterated over.
+        options = QueryOptions(self._query, **self._options)
+        # Slots are freed as soon as batches are taken off the queue,
+        # so the worker keeps prefetch batches ahead of the one that's
+        # being iterated over, for prefetch + 1 batches in total.
+        batches, slots, closed = Queue(), Semaphore(prefetch), Event()
+
+        def fetch():
+            try:
+                fetched = self._fetch_batches(options)
+                while True:
+                    slots.acquire()
+                    if closed.is_set():
+                        return
+
+                    batch = next(fetched, None)
+                    if batch is None:
+                        return
+
+                    batches.put(batch)
+
+            except Exception as e:
+                batches.put(e)
+
+            finally:
+                batches.put(None)
+
+        Thread(target=bind_context(fetch), daemon=True).start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+
+                elif isinstance(batch, Exception):
+                    raise batch
+
+                slots.release()
+                yield batch
+
+        finally:
+            closed.set()
+            slots.release()
 
     def _get_entities(self):
         for batch in self._get_batches():
             yield from batch
 
+    async def _aget_entities(self):
+        # Async iteration fetches each batch using the async adapter
+        # when the previous one is exhausted.  The prefetch option
+        # only applies to regular iteration.
+        from .adapter import get_async_adapter
+
+        remaining = self._options.limit
+        while True:
+            adapter = self._query.model._async_adapter if self._query.model else get_async_adapter()
+            entities, self._options.cursor = await adapter.query(self._query, self._options)
+            entities, count, remaining = _take(entities, remaining)
+            if not count:
+                break
+
+            if count < self._options.batch_size:
+                self._complete = True
+
+            for key, data in entities:
+                if self._options.keys_only and not self._options.as_rows:
+                    yield key
+                else:
+                    yield self._load(key, data)
+
+            if self._complete or remaining is not None and remaining <= 0:
+                break
+
+        self._complete = True
+
 
 class Page:
     """An iterator that represents a single page of entities or keys.
@@ -379,32 +509,43 @@ class Query(namedtuple("Query", (
         """Counts the number of entities that match this query.
 
         Note:
-          Since Datastore doesn't provide a native way to count
-          entities by query, this method paginates through all the
-          entities' keys and counts them.
+          Counting is delegated to the adapter.  Adapters that can't
+          count entities natively page through all the entities' keys
+          and count them.
 
         Parameters:
+          page_size(int, optional): The number of keys to fetch per
+            page when counting entities by paginating.
           \**options(QueryOptions, optional)
 
         Returns:
           int: The number of entities.
         """
-        entities = 0
-        options = QueryOptions(self).replace(keys_only=True)
-        for page in self.paginate(page_size=page_size, **options):
-            entities += len(list(page))
-        return entities
+        query = self._prepare()
+        options = QueryOptions(query, **options).replace(batch_size=page_size, keys_only=True)
+        return self._get_adapter().count(query, options)
 
-    def delete(self, *, page_size=DEFAULT_BATCH_SIZE, **options):
+    def delete(self, *, page_size=DEFAULT_BATCH_SIZE, concurrency=1, progress=None, rate_limit=None, **options):
         """Deletes all the entities that match this query.
 
         Note:
           Since Datasotre doesn't provide a native way to delete
           entities by query, this method paginates through all the
           entities' keys and issues a single delete_multi call per
-          page.
+          page.  When ``concurrency`` is greater than one, up to that
+          many pages are deleted in the background while the next
+          pages' keys are being fetched.
 
         Parameters:
+          page_size(int, optional): The number of keys to fetch and
+            delete per page.
+          concurrency(int, optional): The maximum number of
+            delete_multi calls to keep in flight at a time.
+          progress(callable, optional): A function that is called
+            with the total number of deleted entities after each page
+            is deleted.
+          rate_limit(float, optional): The maximum number of entities
+            to delete per second.
           \**options(QueryOptions, optional)
 
         Returns:
@@ -412,15 +553,60 @@ class Query(namedtuple("Query", (
         """
         from .model import delete_multi
 
-        deleted = 0
-        options = QueryOptions(self).replace(keys_only=True)
-        for page in self.paginate(page_size=page_size, **options):
-            keys = list(page)
-            deleted += len(keys)
-            delete_multi(keys)
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer.")
+
+        deleted, in_flight = 0, deque()
+
+        def finish(n, future=None):
+            nonlocal deleted
+            if future is not None:
+                future.result()
+
+            deleted += n
+            if progress is not None:
+                progress(deleted)
+
+        pages = self.paginate(page_size=page_size, **QueryOptions(self, **options).replace(keys_only=True))
+        executor = None
+        if concurrency > 1:
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        try:
+            for keys in _iter_key_batches(pages, rate_limit):
+                if executor is None:
+                    delete_multi(keys)
+                    finish(len(keys))
+                    continue
+
+                in_flight.append((len(keys), submit_with_context(executor, delete_multi, keys)))
+                if len(in_flight) >= concurrency:
+                    finish(*in_flight.popleft())
+
+            while in_flight:
+                finish(*in_flight.popleft())
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         return deleted
 
+    async def aget(self, **options):
+        """Run this query using the current async adapter and get the
+        first result.
+
+        Parameters:
+          \**options(QueryOptions, optional)
+
+        Returns:
+          Model: An entity or None if there were no results.
+        """
+        sub_query = self.with_limit(1)
+        options = QueryOptions(sub_query).replace(batch_size=1)
+        async for result in sub_query.run(**options):
+            return result
+        return None
+
     def get(self, **options):
         """Run this query and get the first result.
 
@@ -447,6 +633,91 @@ class Query(namedtuple("Query", (
         """
         return Resultset(self._prepare(), QueryOptions(self, **options))
 
+    def iter_rows(self, *properties, as_dicts=False, **options):
+        """Run this query and return an iterator over rows of property
+        values rather than entities.  Rows are cheaper to produce than
+        entities so they're well-suited to exporting large amounts of
+        data.
+
+        Parameters:
+          \*properties(Property or str): The properties to include in
+            each row.  Defaults to the query's projection or, if there
+            isn't one, to all of the model's properties.
+          as_dicts(bool, optional): Whether to return rows as dicts
+            keyed by property name rather than as tuples.
+          \**options(QueryOptions, optional)
+
+        Returns:
+          Resultset: An iterator for this query's rows.
+        """
+        if properties:
+            options["columns"] = _prepare_projection(properties)
+
+        return self.run(as_rows=dict if as_dicts else tuple, **options)
+
+    def iter_columns(self, *properties, chunk_size=DEFAULT_BATCH_SIZE, as_numpy=False, **options):
+        """Run this query and gather the values of the given properties
+        into chunks of columns, without building an entity per result.
+        Integer, Float, Bool and DateTime values are gathered into
+        typed :mod:`array` columns, DateTime values as microseconds
+        since the UNIX epoch.  Other values are gathered into lists.
+
+        Note:
+          Typed columns fall back to lists if any of their values are
+          ``None``.
+
+        Parameters:
+          \*properties(Property or str): The properties to gather.
+            Defaults to the query's projection or, if there isn't one,
+            to all of the model's properties.
+          chunk_size(int, optional): The maximum number of results per
+            chunk.  When ``None``, all the results are gathered into a
+            single chunk.
+          as_numpy(bool, optional): Whether to return NumPy arrays
+            rather than arrays and lists.  Requires :mod:`numpy`.
+          \**options(QueryOptions, optional)
+
+        Raises:
+          TypeError: If no properties are given for a kindless query.
+
+        Returns:
+          iterator[dict]: Chunks of columns keyed by property name.
+          Each chunk includes a ``key`` column.
+        """
+        from .columns import iter_columns
+
+        numpy = None
+        if as_numpy:
+            try:
+                import numpy
+            except ImportError:  # pragma: no cover
+                raise RuntimeError("Install anom with `pip install anom[numpy]` to use NumPy columns.")
+
+        props = {prop.name_on_entity: prop for prop in self.model._properties.values()} if self.model else {}
+        columns = _prepare_projection(properties) or self.projection or tuple(props)
+        if not columns:
+            raise TypeError("Kindless queries can only gather columns for the properties they're given.")
+
+        column_props = tuple(props.get(name) for name in columns)
+        names = ("key",) + tuple(prop.name_on_model if prop else name for name, prop in zip(columns, column_props))
+        rows = self.run(as_rows=tuple, columns=columns, **options)
+        return iter_columns(rows, names, (None,) + column_props, chunk_size, numpy)
+
+    def fetch_columns(self, *properties, as_numpy=False, **options):
+        """Run this query and gather the values of the given properties
+        into columns.  See :meth:`iter_columns`.
+
+        Parameters:
+          \*properties(Property or str): The properties to gather.
+          as_numpy(bool, optional): Whether to return NumPy arrays
+            rather than arrays and lists.  Requires :mod:`numpy`.
+          \**options(QueryOptions, optional)
+
+        Returns:
+          dict: The columns keyed by property name.
+        """
+        return next(self.iter_columns(*properties, chunk_size=None, as_numpy=as_numpy, **options))
+
     def paginate(self, *, page_size, **options):
         """Run this query and return a page iterator.
 
@@ -459,6 +730,11 @@ class Query(namedtuple("Query", (
         """
         return Pages(self._prepare(), page_size, QueryOptions(self, **options))
 
+    def _get_adapter(self):
+        from .adapter import get_adapter
+
+        return self.model._adapter if self.model else get_adapter()
+
     def _prepare(self):
         # Polymorphic children need to be able to query for themselves
         # and their subclasses.
@@ -469,5 +745,36 @@ class Query(namedtuple("Query", (
         return self
 
 
+def _iter_key_batches(pages, rate_limit):
+    scheduled, started_at = 0, time.monotonic()
+    for page in pages:
+        keys = list(page)
+        if not keys:
+            continue
+
+        if rate_limit:
+            delay = started_at + scheduled / rate_limit - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        scheduled += len(keys)
+        yield keys
+
+
 def _prepare_projection(projection):
     return tuple(f if isinstance(f, str) else f.name_on_entity for f in projection)
+
+
+def _take(entities, remaining):
+    # Adapters may return lazily-converted entities so batches are
+    # truncated without slicing, and thus materializing, them.
+    count = len(entities)
+    if remaining is None:
+        return entities, count, None
+
+    remaining -= count
+    if remaining < 0:
+        count += remaining
+        entities = islice(entities, count)
+
+    return entities, count, remaining
@@ -0,0 +1,272 @@
+import json
+import re
+
+from math import isfinite
+from threading import Lock
+
+#: The names of the backends that are picked by default, in order of
+#: preference, when they are installed.
+_preferred_backends = ("orjson", "ujson", "simplejson", "json")
+
+
+class JsonBackend:
+    """Base class for the libraries that :class:`Json<anom.properties.Json>`
+    properties use to encode and decode values.
+
+    Backends must produce and accept the same documents as the
+    standard library's :mod:`json` module so that values written with
+    one backend can always be read back with any other.
+    """
+
+    #: The name that this backend is registered under.
+    name = None
+
+    def dumps(self, value, default):  # pragma: no cover
+        """Encode a value to a JSON string.
+
+        Parameters:
+          value: The value to encode.
+          default(callable): A function that is called with values
+            that can't otherwise be encoded.  It returns an encodable
+            replacement for the value or raises :class:`TypeError`.
+
+        Returns:
+          str: The encoded value.
+        """
+        raise NotImplementedError
+
+    def loads(self, data, object_hook=None):  # pragma: no cover
+        """Decode a JSON document.
+
+        Parameters:
+          data(str or bytes): The document to decode.
+          object_hook(callable, optional): A function that is called
+            with every decoded object, innermost objects first.  Its
+            return value replaces the object.
+
+        Raises:
+          ValueError: If the document is invalid.
+
+        Returns:
+          The decoded value.
+        """
+        raise NotImplementedError
+
+
+class StdlibJsonBackend(JsonBackend):
+    """A backend that uses the standard library's :mod:`json` module,
+    or any module with the same interface.
+
+    Parameters:
+      name(str, optional): The name of this backend.  Defaults to
+        ``"json"``.
+      module(module, optional): The module to use.  Defaults to
+        :mod:`json`.
+    """
+
+    def __init__(self, name="json", module=json):
+        self.name = name
+        self.module = module
+
+    def dumps(self, value, default):
+        return self.module.dumps(value, separators=(",", ":"), default=default)
+
+    def loads(self, data, object_hook=None):
+        if object_hook is None:
+            return self.module.loads(data)
+        return self.module.loads(data, object_hook=object_hook)
+
+
+class OrjsonBackend(JsonBackend):
+    """A backend that uses orjson_.  Values that orjson can't handle,
+    such as integers that don't fit in 64 bits or non-finite floats,
+    which it would encode as ``null``, and documents that it rejects,
+    such as ones that contain ``NaN``, fall back to the standard
+    library.  So do documents that need an object hook,
+    since the standard library calls hooks from C.
+
+    Non-ASCII characters are escaped and datetimes and dataclasses
+    are handed to ``default`` the same way the standard library does
+    it.  Unlike the standard library, orjson encodes :class:`uuid.UUID`
+    and :class:`enum.Enum` values on its own and writes floats in
+    exponent notation without padding their exponents (``1e16``
+    rather than ``1e+16``), which every backend reads back the same.
+
+    .. _orjson: https://github.com/ijl/orjson
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.orjson = orjson
+        self.options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, value, default):
+        try:
+            data = self.orjson.dumps(value, default=default, option=self.options)
+        except TypeError:
+            return _stdlib_backend.dumps(value, default)
+
+        # orjson encodes non-finite floats as null so documents that
+        # contain nulls have to be checked for them.
+        if b"null" in data and _has_non_finite_floats(value):
+            return _stdlib_backend.dumps(value, default)
+
+        # orjson writes non-ASCII characters as they are whereas the
+        # standard library escapes them.  Outside of strings, JSON
+        # documents are made up of ASCII characters only.
+        data = data.decode("utf-8")
+        if not data.isascii():
+            return _non_ascii_re.sub(_escape_non_ascii, data)
+        return data
+
+    def loads(self, data, object_hook=None):
+        if object_hook is not None:
+            return _stdlib_backend.loads(data, object_hook)
+
+        try:
+            return self.orjson.loads(data)
+        except ValueError:
+            return _stdlib_backend.loads(data)
+
+
+class UjsonBackend(JsonBackend):
+    """A backend that uses ujson_.  Values and documents that ujson
+    can't handle, as well as documents that need an object hook, fall
+    back to the standard library.
+
+    .. _ujson: https://github.com/ultrajson/ultrajson
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        # Versions of ujson that don't support default encode some
+        # values, like datetimes, differently from the standard library.
+        ujson.dumps(None, default=str)
+        self.ujson = ujson
+
+    def dumps(self, value, default):
+        try:
+            return self.ujson.dumps(value, default=default, escape_forward_slashes=False)
+        except (OverflowError, TypeError):
+            return _stdlib_backend.dumps(value, default)
+
+    def loads(self, data, object_hook=None):
+        if object_hook is not None:
+            return _stdlib_backend.loads(data, object_hook)
+
+        try:
+            return self.ujson.loads(data)
+        except ValueError:
+            return _stdlib_backend.loads(data)
+
+
+#: Matches runs of non-ASCII characters.
+_non_ascii_re = re.compile(r"[^\x00-\x7f]+")
+
+
+def _escape_non_ascii(match):
+    return json.encoder.encode_basestring_ascii(match.group())[1:-1]
+
+
+def _has_non_finite_floats(value):
+    if isinstance(value, float):
+        return not isfinite(value)
+
+    elif isinstance(value, dict):
+        return any(_has_non_finite_floats(item) for pair in value.items() for item in pair)
+
+    elif isinstance(value, (list, tuple)):
+        return any(_has_non_finite_floats(item) for item in value)
+
+    return False
+
+
+def _make_simplejson_backend():
+    import simplejson
+
+    return StdlibJsonBackend("simplejson", simplejson)
+
+
+#: The backend that others fall back to.
+_stdlib_backend = StdlibJsonBackend()
+
+#: The registered backends, by name.
+_backends = {}
+_backends_lock = Lock()
+
+#: The name of the backend that's used by default.
+_default_backend = None
+
+
+def register_json_backend(backend):
+    """Register a JSON backend so that properties may refer to it by
+    name.  Registering a backend under an existing name replaces the
+    old backend.
+
+    Parameters:
+      backend(JsonBackend): The backend to register.
+
+    Returns:
+      JsonBackend: The backend.
+    """
+    with _backends_lock:
+        _backends[backend.name] = backend
+
+    return backend
+
+
+def get_json_backend(name=None):
+    """Get a registered JSON backend.
+
+    Parameters:
+      name(str, optional): The name of the backend.  Defaults to the
+        default backend.
+
+    Raises:
+      ValueError: If no backend is registered under the given name.
+
+    Returns:
+      JsonBackend: The backend.
+    """
+    try:
+        return _backends[name or _default_backend]
+    except KeyError:
+        raise ValueError(f"JSON backend {name!r} is not registered.")
+
+
+def set_default_json_backend(name):
+    """Set the JSON backend that's used by properties that don't
+    specify one.  By default, this is the first of orjson, ujson,
+    simplejson and the standard library's json module that is
+    installed.
+
+    Parameters:
+      name(str): The name of a registered backend.
+
+    Raises:
+      ValueError: If no backend is registered under the given name.
+
+    Returns:
+      str: The name of the old default backend.
+    """
+    global _default_backend
+
+    get_json_backend(name)
+    old_backend, _default_backend = _default_backend, name
+    return old_backend
+
+
+register_json_backend(_stdlib_backend)
+for factory in (OrjsonBackend, UjsonBackend, _make_simplejson_backend):
+    try:
+        register_json_backend(factory())
+    except (ImportError, TypeError):
+        pass
+
+_default_backend = next(name for name in _preferred_backends if name in _backends)
@@ -2,8 +2,9 @@ import logging
 
 from enum import Enum, auto
 from functools import wraps
+from inspect import iscoroutinefunction
 
-from .adapter import get_adapter
+from .adapter import get_adapter, get_async_adapter
 
 _logger = logging.getLogger(__name__)
 
@@ -41,6 +42,27 @@ class Transaction:  # pragma: no cover
         raise NotImplementedError
 
 
+class AsyncTransaction:  # pragma: no cover
+    """Abstract base class for asyncio Datastore transactions.
+    """
+
+    async def begin(self):
+        "Start this transaction."
+        raise NotImplementedError
+
+    async def commit(self):
+        "Commit this Transaction to Datastore."
+        raise NotImplementedError
+
+    async def rollback(self):
+        "Roll this Transaction back."
+        raise NotImplementedError
+
+    async def end(self):
+        "Clean up this Transaction object."
+        raise NotImplementedError
+
+
 class TransactionError(Exception):
     """Base class for Transaction errors.
     """
@@ -83,9 +105,13 @@ def transactional(*, adapter=None, retries=3, propagation=Transaction.Propagatio
     """Decorates functions so that all of their operations (except for
     queries) run inside a Datastore transaction.
 
+    Coroutine functions are run inside an :class:`AsyncTransaction`
+    instead.
+
     Parameters:
-      adapter(Adapter, optional): The Adapter to use when running the
-        transaction.  Defaults to the current adapter.
+      adapter(Adapter or AsyncAdapter, optional): The Adapter to use
+        when running the transaction.  Defaults to the current adapter
+        or, for coroutine functions, the current async adapter.
       retries(int, optional): The number of times to retry the
         transaction if it couldn't be committed.
       propagation(Transaction.Propagation, optional): The propagation
@@ -100,6 +126,9 @@ def transactional(*, adapter=None, retries=3, propagation=Transaction.Propagatio
       callable: The decorated function.
     """
     def decorator(fn):
+        if iscoroutinefunction(fn):
+            return _async_transactional(fn, adapter, retries, propagation)
+
         @wraps(fn)
         def inner(*args, **kwargs):
             nonlocal adapter
@@ -129,3 +158,33 @@ def transactional(*, adapter=None, retries=3, propagation=Transaction.Propagatio
             raise RetriesExceeded(cause)
         return inner
     return decorator
+
+
+def _async_transactional(fn, adapter, retries, propagation):
+    @wraps(fn)
+    async def inner(*args, **kwargs):
+        async_adapter = adapter or get_async_adapter()
+        attempts, cause = 0, None
+        while attempts <= retries:
+            attempts += 1
+            transaction = async_adapter.transaction(propagation)
+
+            try:
+                await transaction.begin()
+                res = await fn(*args, **kwargs)
+                await transaction.commit()
+                return res
+
+            except TransactionFailed as e:
+                cause = e
+                continue
+
+            except Exception as e:
+                await transaction.rollback()
+                raise e
+
+            finally:
+                await transaction.end()
+
+        raise RetriesExceeded(cause)
+    return inner
@@ -0,0 +1,51 @@
+"""Measures the wall time of a large ``put_multi`` through
+:class:`ChunkingAdapter<anom.adapters.ChunkingAdapter>` against an
+in-memory adapter that simulates RPC latency proportional to the
+size of each call.
+
+Run with::
+
+  python -m benchmarks.chunking
+"""
+import time
+
+from anom import Model, props, put_multi, set_adapter
+from anom.adapters import ChunkingAdapter, InMemoryAdapter
+
+#: The simulated latency of a single RPC in seconds.
+_latency = 0.02
+
+#: The simulated latency added by every entity in an RPC in seconds.
+_latency_per_entity = 0.0001
+
+#: The number of entities to store.
+_entities = 10000
+
+
+class _SlowAdapter(InMemoryAdapter):
+    def put_multi(self, requests):
+        time.sleep(_latency + _latency_per_entity * len(requests))
+        return super().put_multi(requests)
+
+
+class BenchEntity(Model):
+    x = props.Integer()
+
+
+def _measure(adapter):
+    set_adapter(adapter)
+    start = time.perf_counter()
+    put_multi([BenchEntity(x=i) for i in range(_entities)])
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'adapter':>32} {'wall time (s)':>14}")
+    print(f"{'unchunked':>32} {_measure(_SlowAdapter()):>14.3f}")
+    for max_workers in (1, 4, 20):
+        with ChunkingAdapter(_SlowAdapter(), chunk_size=500, max_workers=max_workers) as adapter:
+            print(f"{f'chunked, {max_workers} workers':>32} {_measure(adapter):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
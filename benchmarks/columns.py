@@ -0,0 +1,50 @@
+"""Measures the memory retained by the results of a query over
+numeric entities when they are gathered as entities, as rows and as
+columns.
+
+Run with::
+
+  python -m benchmarks.columns
+"""
+import gc
+import tracemalloc
+
+from anom import Model, props, put_multi, set_adapter
+from anom.adapters import InMemoryAdapter
+
+#: The number of entities to query.
+_entities = 10000
+
+
+class BenchOrder(Model):
+    quantity = props.Integer()
+    total = props.Float()
+    paid = props.Bool()
+
+
+def _measure(fetch):
+    gc.collect()
+    tracemalloc.start()
+    results = fetch()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return retained
+
+
+def main():
+    set_adapter(InMemoryAdapter())
+    put_multi([BenchOrder(quantity=i, total=i / 2, paid=i % 2 == 0) for i in range(_entities)])
+
+    query = BenchOrder.query()
+    print(f"{'mode':>8} {'per result (bytes)':>19}")
+    for mode, fetch in (
+        ("entities", lambda: list(query.run(batch_size=_entities))),
+        ("rows", lambda: list(query.iter_rows(batch_size=_entities))),
+        ("columns", lambda: query.fetch_columns(batch_size=_entities)),
+    ):
+        print(f"{mode:>8} {_measure(fetch) / _entities:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measures the stored size of a large text value along with the cost
+of storing and loading it using each of the installed compression
+codecs, the peak memory used while loading it, and the stored size
+of small values with and without a minimum compression size.
+
+Run with::
+
+  python -m benchmarks.compression
+"""
+import timeit
+import tracemalloc
+
+from anom import props
+from anom.compression import _codecs
+
+#: The number of times each operation is run per measurement.
+_number = 20
+
+
+def _make_text():
+    return "".join(f"Line {i}: the quick brown fox jumps over the lazy dog {i % 7}.\n" for i in range(10000))
+
+
+def _measure(prop, value):
+    stored_value = prop.prepare_to_store(None, value)
+    best_store = min(timeit.repeat(lambda: prop.prepare_to_store(None, value), number=_number, repeat=5))
+    best_load = min(timeit.repeat(lambda: prop.prepare_to_load(None, stored_value), number=_number, repeat=5))
+    tracemalloc.start()
+    prop.prepare_to_load(None, stored_value)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(stored_value), best_store / _number * 1e3, best_load / _number * 1e3, peak / 1024
+
+
+def main():
+    text = _make_text()
+    print(f"{'codec':>6} {'bytes':>8} {'store (ms)':>11} {'load (ms)':>10} {'peak (KiB)':>11}")
+    size, store_ms, load_ms, peak_kib = _measure(props.Text(), text)
+    print(f"{'none':>6} {size:>8} {store_ms:>11.2f} {load_ms:>10.2f} {peak_kib:>11.0f}")
+    for name in sorted(_codecs):
+        if name == "raw":
+            continue
+
+        size, store_ms, load_ms, peak_kib = _measure(props.Text(compressed=True, codec=name), text)
+        print(f"{name:>6} {size:>8} {store_ms:>11.2f} {load_ms:>10.2f} {peak_kib:>11.0f}")
+
+    print()
+    print(f"{'min_size':>8} {'bytes':>6}")
+    small_values = [f"tag-{i}" for i in range(100)]
+    for min_size in (0, 64):
+        prop = props.Text(compressed=True, min_size=min_size)
+        size = sum(len(prop.prepare_to_store(None, value)) for value in small_values)
+        print(f"{min_size:>8} {size:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measures the per-entity cost of ``Model._load`` for models that
+embed other models, as the number of embedded properties grows while
+the total number of fields stays the same, along with the cost of
+preparing entities with many repeated embedded entities for storage.
+
+Run with::
+
+  python -m benchmarks.embed
+"""
+import timeit
+
+from anom import Key, Model, props
+from anom.adapter import PutRequest
+
+#: The total number of flattened fields on each benchmark entity.
+_fields = 200
+
+#: The number of entities to load per measurement.
+_entities = 1000
+
+#: The number of repeated embedded entities per stored entity.
+_line_items = 500
+
+
+class BenchLineItem(Model):
+    sku = props.String()
+    description = props.Text()
+    quantity = props.Integer()
+    price = props.Float()
+    discount = props.Float(optional=True)
+
+
+class BenchOrder(Model):
+    customer = props.String()
+    line_items = props.Embed(kind=BenchLineItem, repeated=True)
+
+
+def _make_model(embeds):
+    # Models are looked up by kind from a weak registry so the outer
+    # model holds on to its embedded models to keep them alive.
+    width = _fields // embeds
+    attrs, embedded_models = {}, []
+    for i in range(embeds):
+        embedded_model = type(f"BenchEmbedded{embeds}x{i}", (Model,), {f"i{j}": props.Integer() for j in range(width)})
+        embedded_models.append(embedded_model)
+        attrs[f"e{i}"] = props.Embed(kind=embedded_model)
+
+    attrs["_embedded_models"] = embedded_models
+    return type(f"BenchEmbedding{embeds}", (Model,), attrs)
+
+
+def _make_data(embeds):
+    width = _fields // embeds
+    return {f"e{i}.i{j}": j for i in range(embeds) for j in range(width)}
+
+
+def main():
+    print(f"{'embeds':>6} {'fields':>6} {'per entity (us)':>16}")
+    for embeds in (1, 5, 20, 50):
+        model_class, data = _make_model(embeds), _make_data(embeds)
+        keys = [Key(model_class, i) for i in range(1, _entities + 1)]
+
+        def load():
+            for key in keys:
+                model_class._load(key, data)
+
+        best = min(timeit.repeat(load, number=1, repeat=5))
+        print(f"{embeds:>6} {len(data):>6} {best / _entities * 1e6:>16.2f}")
+
+    order = BenchOrder(customer="Jim", line_items=[
+        BenchLineItem(sku=f"sku-{i}", description="A line item.", quantity=i, price=i / 2)
+        for i in range(_line_items)
+    ])
+
+    def store():
+        request = PutRequest(order.key, order.unindexed_properties, order)
+        dict(request.properties)
+
+    number = 100
+    best = min(timeit.repeat(store, number=number, repeat=5))
+    print()
+    print(f"{'line items':>10} {'per put (us)':>13}")
+    print(f"{_line_items:>10} {best / number * 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measures the cost of reassembling ``get_multi`` results in
+:class:`DatastoreAdapter<anom.adapters.DatastoreAdapter>` as the
+number of keys grows.  The Datastore client is replaced with an
+in-process fake that returns entities in random order so only the
+adapter's own work is measured.
+
+Run with::
+
+  python -m benchmarks.get_multi
+"""
+import random
+import timeit
+
+from anom import Key
+from anom.adapters import DatastoreAdapter
+from google.cloud import datastore
+
+#: The batch sizes to measure.
+_sizes = (10, 100, 1000, 10000)
+
+
+class _FakeClient:
+    def __init__(self, project="bench"):
+        self.project = project
+        self.entities = {}
+
+    def key(self, *path, namespace=None):
+        return datastore.Key(*path, project=self.project, namespace=namespace)
+
+    def get_multi(self, keys, missing=None, deferred=None):
+        found = [self.entities[key] for key in keys if key in self.entities]
+        random.shuffle(found)
+        return found
+
+
+def _make_adapter(keys):
+    adapter = DatastoreAdapter.__new__(DatastoreAdapter)
+    adapter.client = client = _FakeClient()
+    for key in keys:
+        entity = datastore.Entity(adapter._convert_key_to_datastore(key))
+        entity["x"] = key.id_or_name
+        client.entities[entity.key] = entity
+
+    return adapter
+
+
+def main():
+    print(f"{'keys':>8} {'total (ms)':>12} {'per key (us)':>14}")
+    for size in _sizes:
+        keys = [Key("Bench", i) for i in range(1, size + 1)]
+        adapter = _make_adapter(keys)
+        number = max(1, 10000 // size)
+        total = min(timeit.repeat(lambda: adapter.get_multi(keys), number=number, repeat=3)) / number
+        print(f"{size:>8} {total * 1000:>12.3f} {total / size * 1000000:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
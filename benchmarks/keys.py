@@ -0,0 +1,43 @@
+"""Measures the cost of hashing and comparing keys with increasingly
+deep ancestries, as happens whenever keys are used as dict keys by
+``get_multi`` and the caching adapters.
+
+Run with::
+
+  python -m benchmarks.keys
+"""
+import timeit
+
+from anom import Key
+
+#: The ancestry depths to measure.
+_depths = (1, 5, 25)
+
+#: The number of keys to hash and compare per measurement.
+_keys = 1000
+
+
+def _make_keys(depth):
+    return [Key.from_path(*["Parent", 1] * (depth - 1), "Child", i) for i in range(1, _keys + 1)]
+
+
+def main():
+    print(f"{'depth':>5} {'hash (us)':>10} {'eq (us)':>10}")
+    for depth in _depths:
+        keys, others = _make_keys(depth), _make_keys(depth)
+
+        def hash_keys():
+            for key in keys:
+                hash(key)
+
+        def compare_keys():
+            for key, other in zip(keys, others):
+                key == other
+
+        hash_best = min(timeit.repeat(hash_keys, number=1, repeat=5))
+        eq_best = min(timeit.repeat(compare_keys, number=1, repeat=5))
+        print(f"{depth:>5} {hash_best / _keys * 1e6:>10.3f} {eq_best / _keys * 1e6:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
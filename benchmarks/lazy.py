@@ -0,0 +1,54 @@
+"""Measures the per-entity cost of loading entities with a large
+compressed Text property and a large Json property when only their
+keys and a small property are read, with the large properties loaded
+eagerly and lazily.
+
+Run with::
+
+  python -m benchmarks.lazy
+"""
+import json
+import timeit
+
+from anom import Key, Model, props
+
+#: The number of entities to load per measurement.
+_entities = 1000
+
+
+def _make_model(name, lazy):
+    attrs = {
+        "title": props.String(),
+        "body": props.Text(compressed=True),
+        "meta": props.Json(),
+    }
+    return type(name, (Model,), attrs, lazy=lazy)
+
+
+def _make_data(model_class):
+    meta = {"items": [{"id": i, "name": f"item {i}", "tags": ["a", "b", "c"]} for i in range(100)]}
+    return {
+        "title": b"title",
+        "body": model_class.body.prepare_to_store(None, "lorem ipsum dolor sit amet " * 200),
+        "meta": json.dumps(meta),
+    }
+
+
+def main():
+    print(f"{'mode':>6} {'per entity (us)':>16}")
+    for mode, lazy in (("eager", False), ("lazy", True)):
+        model_class = _make_model(f"BenchLazy{mode.title()}Model", lazy)
+        data = _make_data(model_class)
+        keys = [Key(model_class, i) for i in range(1, _entities + 1)]
+
+        def load():
+            for key in keys:
+                entity = model_class._load(key, data)
+                entity.key, entity.title
+
+        best = min(timeit.repeat(load, number=1, repeat=5))
+        print(f"{mode:>6} {best / _entities * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
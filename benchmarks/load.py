@@ -0,0 +1,68 @@
+"""Measures the per-entity cost of ``Model._load`` for a wide model
+with a mix of property types, as it runs for every entity returned
+by queries and ``get_multi``, along with the cost of loading the
+same data as a row.
+
+Run with::
+
+  python -m benchmarks.load
+"""
+import timeit
+
+from datetime import datetime, timezone
+
+from anom import Key, Model, props
+
+#: The number of properties of each type on the benchmark model.
+_width = 10
+
+#: The number of entities to load per measurement.
+_entities = 1000
+
+
+def _make_model():
+    attrs = {}
+    for i in range(_width):
+        attrs[f"b{i}"] = props.Bool()
+        attrs[f"i{i}"] = props.Integer()
+        attrs[f"s{i}"] = props.String()
+        attrs[f"t{i}"] = props.Text()
+        attrs[f"d{i}"] = props.DateTime()
+        attrs[f"f{i}"] = props.Float()
+
+    return type("BenchWideModel", (Model,), attrs)
+
+
+def _make_data():
+    data = {}
+    for i in range(_width):
+        data[f"b{i}"] = True
+        data[f"i{i}"] = i
+        data[f"s{i}"] = f"string {i}".encode("utf-8")
+        data[f"t{i}"] = f"text {i}".encode("utf-8")
+        data[f"d{i}"] = datetime(2017, 1, 1, tzinfo=timezone.utc)
+        data[f"f{i}"] = i / 2
+
+    return data
+
+
+def main():
+    model_class, data = _make_model(), _make_data()
+    keys = [Key(model_class, i) for i in range(1, _entities + 1)]
+
+    def load():
+        for key in keys:
+            model_class._load(key, data)
+
+    def load_rows():
+        for key in keys:
+            model_class._load_row(key, data)
+
+    best = min(timeit.repeat(load, number=1, repeat=5))
+    best_rows = min(timeit.repeat(load_rows, number=1, repeat=5))
+    print(f"{'properties':>10} {'per entity (us)':>16} {'per row (us)':>13}")
+    print(f"{len(model_class._properties):>10} {best / _entities * 1e6:>16.2f} {best_rows / _entities * 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
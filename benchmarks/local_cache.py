@@ -0,0 +1,52 @@
+"""Measures the latency of reading a hot entity through
+:class:`LocalCacheAdapter<anom.adapters.LocalCacheAdapter>` against an
+in-memory adapter that simulates the latency of a Memcache hit.
+
+Run with::
+
+  python -m benchmarks.local_cache
+"""
+import time
+
+from anom import Model, props, set_adapter
+from anom.adapters import InMemoryAdapter, LocalCacheAdapter
+from anom.properties import Msgpack
+
+#: The simulated latency of a single Memcache round trip in seconds.
+_latency = 0.0005
+
+#: The number of reads to measure.
+_reads = 2000
+
+
+class _SlowAdapter(InMemoryAdapter):
+    def get_multi(self, keys):
+        # Simulate a round trip followed by decoding msgpack.
+        time.sleep(_latency)
+        return [None if data is None else Msgpack._loads(Msgpack._dumps(data)) for data in super().get_multi(keys)]
+
+
+class BenchConfig(Model):
+    name = props.String()
+    enabled = props.Bool()
+    rollout = props.Float()
+    tags = props.String(repeated=True)
+
+
+def _measure(adapter):
+    set_adapter(adapter)
+    key = BenchConfig(name="flag", enabled=True, rollout=0.5, tags=["a", "b", "c"]).put().key
+    start = time.perf_counter()
+    for _ in range(_reads):
+        key.get()
+    return (time.perf_counter() - start) / _reads * 1e6
+
+
+def main():
+    print(f"{'adapter':>16} {'per read (us)':>14}")
+    print(f"{'uncached':>16} {_measure(_SlowAdapter()):>14.1f}")
+    print(f"{'local cache':>16} {_measure(LocalCacheAdapter(_SlowAdapter())):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures the cost of dumping and loading a large document with
+each of the installed JSON backends, with and without values of
+non-standard types inside it, along with the cost of doing the same
+using msgpack.
+
+Run with::
+
+  python -m benchmarks.serializers
+"""
+import timeit
+
+from datetime import datetime, timezone
+
+from anom import props
+from anom.serializers import _backends
+
+#: The number of records in the benchmark document.
+_records = 1000
+
+#: The number of times each operation is run per measurement.
+_number = 20
+
+
+def _make_document(with_extensions):
+    document = {
+        f"record-{i}": {
+            "id": i,
+            "name": f"Record number {i}",
+            "score": i / 3,
+            "tags": ["a", "b", "c"],
+            "active": i % 2 == 0,
+        }
+        for i in range(_records)
+    }
+
+    if with_extensions:
+        for i, record in enumerate(document.values()):
+            record["updated_at"] = datetime(2017, 1, 1, i % 24, tzinfo=timezone.utc)
+
+    return document
+
+
+def _measure(dumps, loads, document):
+    data = dumps(document)
+    best_dumps = min(timeit.repeat(lambda: dumps(document), number=_number, repeat=5))
+    best_loads = min(timeit.repeat(lambda: loads(data), number=_number, repeat=5))
+    return best_dumps / _number * 1e3, best_loads / _number * 1e3
+
+
+def main():
+    print(f"{'backend':>10} {'extensions':>10} {'dumps (ms)':>11} {'loads (ms)':>11}")
+    for with_extensions in (False, True):
+        document = _make_document(with_extensions)
+        for name in sorted(_backends):
+            prop = props.Json(backend=name)
+            dumps_ms, loads_ms = _measure(prop._dumps, prop._loads, document)
+            print(f"{name:>10} {str(with_extensions):>10} {dumps_ms:>11.2f} {loads_ms:>11.2f}")
+
+        dumps_ms, loads_ms = _measure(props.Msgpack._dumps, props.Msgpack._loads, document)
+        print(f"{'msgpack':>10} {str(with_extensions):>10} {dumps_ms:>11.2f} {loads_ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Measures the per-entity cost of preparing a wide model for
+storage, i.e. of building the ``PutRequest`` that ``put_multi`` hands
+off to adapters.
+
+Run with::
+
+  python -m benchmarks.store
+"""
+import timeit
+
+from anom import Key
+from anom.adapter import PutRequest
+
+from .load import _make_data, _make_model
+
+#: The number of entities to prepare per measurement.
+_entities = 1000
+
+
+def main():
+    model_class, data = _make_model(), _make_data()
+    entities = [model_class._load(Key(model_class, i), data) for i in range(1, _entities + 1)]
+
+    def store():
+        for entity in entities:
+            request = PutRequest(entity.key, entity.unindexed_properties, entity)
+            dict(request.properties)
+
+    best = min(timeit.repeat(store, number=1, repeat=5))
+    print(f"{'properties':>10} {'per entity (us)':>16}")
+    print(f"{len(model_class._properties):>10} {best / _entities * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -63,6 +63,12 @@ def memcache_adapter(datastore_adapter, memcache_client):
         yield adapter
 
 
+@pytest.fixture
+def memory_adapter():
+    with push_adapter(adapters.InMemoryAdapter()) as adapter:
+        yield adapter
+
+
 @pytest.fixture(params=[None, "namespace"])
 def default_namespace(request):
     namespace = getattr(request, "param", None)
@@ -71,7 +77,7 @@ def default_namespace(request):
     set_namespace(None)
 
 
-@pytest.fixture(params=["datastore_adapter", "memcache_adapter"])
+@pytest.fixture(params=["datastore_adapter", "memcache_adapter", "memory_adapter"])
 def adapter(request, default_namespace):
     return request.getfixturevalue(request.param)
 
@@ -130,6 +130,20 @@ class ModelWithJsonProperty(Model):
     j = props.Json()
 
 
+class ModelWithCompressedJsonProperty(Model):
+    j = props.Json(compressed=True)
+
+
+class ModelWithLazyJsonProperty(Model):
+    j = props.Json(lazy=True)
+    x = props.Integer()
+
+
+class LazyModel(Model, lazy=True):
+    text = props.Text(compressed=True)
+    j = props.Json(lazy=False)
+
+
 class ModelWithCustomKind(Model):
     _kind = "CustomKind"
 
@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+import threading
+
+from anom import Transaction, aget_multi, aput_multi, get_async_adapter, namespace, transactional
+from anom.adapters import ThreadedAsyncAdapter
+
+from .models import BankAccount, Person
+
+
+def test_can_put_get_and_delete_entities_asynchronously(memory_adapter):
+    async def run():
+        # Given that I have stored an entity asynchronously
+        account = await BankAccount(balance=42).aput()
+
+        # When I get it back by id
+        # Then I should get back an equal entity
+        assert await BankAccount.aget(account.key.int_id) == account
+
+        # When I delete it by its key
+        await account.key.adelete()
+
+        # Then I should no longer be able to get it
+        assert await account.key.aget() is None
+
+    asyncio.run(run())
+
+
+def test_can_iterate_over_query_results_asynchronously(memory_adapter):
+    async def run():
+        # Given that I have some people
+        people = await aput_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(5)])
+
+        # When I iterate over a limited query in small batches
+        query = Person.query().order_by(+Person.email).with_limit(4)
+        results = [person async for person in query.run(batch_size=3)]
+
+        # Then I should get back the first few people in order
+        assert results == people[:4]
+
+        # And I should be able to get just the first one
+        assert await query.aget() == people[0]
+
+    asyncio.run(run())
+
+
+def test_async_transactions_commit_and_roll_back(memory_adapter):
+    @transactional()
+    async def transfer(source_key, target_key, amount):
+        source, target = await aget_multi([source_key, target_key])
+        source.balance -= amount
+        target.balance += amount
+        await aput_multi([source, target])
+        if source.balance < 0:
+            raise ValueError("Insufficient funds.")
+
+    async def run():
+        # Given that I have two bank accounts
+        source, target = await aput_multi([BankAccount(balance=10), BankAccount(balance=0)])
+
+        # When I transfer money between them
+        await transfer(source.key, target.key, 5)
+
+        # And I try to transfer more money than is left
+        with pytest.raises(ValueError):
+            await transfer(source.key, target.key, 10)
+
+        # Then only the first transfer should have been applied
+        assert [a.balance for a in await aget_multi([source.key, target.key])] == [5, 5]
+
+    asyncio.run(run())
+
+
+def test_async_transactions_are_scoped_to_tasks(memory_adapter):
+    adapter = get_async_adapter()
+
+    @transactional()
+    async def inner():
+        return adapter.current_transaction
+
+    @transactional()
+    async def outer():
+        # Nested transactions share their parent's thread
+        transaction = await inner()
+        assert transaction.executor is adapter.current_transaction.executor
+        return adapter.current_transaction
+
+    async def run():
+        # When I run many transactions concurrently
+        transactions = await asyncio.gather(*(outer() for _ in range(10)))
+
+        # Then each of them should have gotten its own transaction
+        assert len({id(transaction) for transaction in transactions}) == 10
+
+        # And none of them should have leaked out of their task
+        assert not adapter.in_transaction
+
+    asyncio.run(run())
+
+
+def test_async_independent_transactions_dont_join_their_parents(memory_adapter):
+    adapter = get_async_adapter()
+
+    @transactional(propagation=Transaction.Propagation.Independent)
+    async def independent():
+        return adapter.current_transaction.executor
+
+    @transactional()
+    async def outer():
+        return adapter.current_transaction.executor, await independent()
+
+    parent_executor, child_executor = asyncio.run(outer())
+    assert parent_executor is not child_executor
+
+
+def test_async_transactions_share_a_bounded_number_of_threads(memory_adapter):
+    # Given that I have an async adapter that runs at most 2 transactions at once
+    adapter = ThreadedAsyncAdapter(memory_adapter, max_transactions=2)
+    running, most_running, threads = 0, 0, set()
+
+    @transactional(adapter=adapter)
+    async def transfer():
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        threads.add(await adapter._run(threading.get_ident))
+        await adapter.put_multi([])
+        await asyncio.sleep(0)
+        running -= 1
+
+    async def run():
+        await asyncio.gather(*(transfer() for _ in range(20)))
+
+    # When I run many transactions concurrently
+    asyncio.run(run())
+
+    # Then at most 2 of them should have run at once
+    assert most_running == 2
+
+    # And they should all have run on the same 2 threads
+    assert len(threads) == 2
+
+    # When I run them again on a new event loop
+    asyncio.run(run())
+
+    # Then they should reuse those threads
+    assert len(threads) == 2
+
+
+def test_namespaces_flow_into_concurrent_tasks(memory_adapter):
+    async def put_in(ns):
+        with namespace(ns):
+            await asyncio.sleep(0)
+            return await BankAccount(balance=1).aput()
+
+    async def run():
+        return await asyncio.gather(*(put_in(f"ns-{i}") for i in range(5)))
+
+    accounts = asyncio.run(run())
+    assert [account.key.namespace for account in accounts] == [f"ns-{i}" for i in range(5)]
@@ -0,0 +1,87 @@
+import pytest
+
+from anom import Key, adapters, delete_multi, get_multi, put_multi, transactional
+
+from .conftest import push_adapter
+from .models import BankAccount
+
+
+class FailingAdapter(adapters.InMemoryAdapter):
+    def get_multi(self, keys):
+        if any(key.int_id == 5 for key in keys):
+            raise RuntimeError("failed")
+        return super().get_multi(keys)
+
+
+@pytest.fixture
+def chunking_adapter(memory_adapter):
+    with adapters.ChunkingAdapter(memory_adapter, chunk_size=3) as chunking_adapter:
+        with push_adapter(chunking_adapter) as adapter:
+            yield adapter
+
+
+def test_chunking_adapter_preserves_input_order(chunking_adapter):
+    # Given that I have more entities than fit in a single chunk
+    accounts = put_multi([BankAccount(key=Key(BankAccount, i), balance=i) for i in range(1, 11)])
+
+    # When I get them back in reverse order alongside a missing key
+    keys = [account.key for account in reversed(accounts)] + [Key(BankAccount, 42)]
+
+    # Then I should get them back in the order I requested them
+    assert get_multi(keys) == list(reversed(accounts)) + [None]
+
+    # When I delete all of them
+    delete_multi(keys)
+
+    # Then none of them should exist anymore
+    assert get_multi(keys) == [None] * len(keys)
+
+
+def test_chunking_adapter_runs_chunks_inside_transactions(chunking_adapter):
+    @transactional()
+    def store(fail=False):
+        accounts = put_multi([BankAccount(key=Key(BankAccount, i), balance=i) for i in range(1, 11)])
+        if fail:
+            raise RuntimeError("failed")
+        return accounts
+
+    # Given that I've stored some entities in a transaction that failed
+    with pytest.raises(RuntimeError):
+        store(fail=True)
+
+    # Then none of the chunks should have been applied
+    assert get_multi([Key(BankAccount, i) for i in range(1, 11)]) == [None] * 10
+
+    # When I store them in a transaction that succeeds
+    # Then all of the chunks should have been applied
+    accounts = store()
+    assert get_multi([account.key for account in accounts]) == accounts
+
+
+def test_chunking_adapter_reports_errors_per_chunk():
+    # Given that I have more entities than fit in a single chunk
+    with adapters.ChunkingAdapter(FailingAdapter(), chunk_size=3) as adapter, push_adapter(adapter):
+        accounts = put_multi([BankAccount(key=Key(BankAccount, i), balance=i) for i in range(1, 11)])
+
+        # When I get all the accounts and the second chunk fails
+        with pytest.raises(adapters.ChunkError) as e:
+            get_multi([account.key for account in accounts])
+
+    # Then I should get back the offset of the failed chunk
+    assert [offset for offset, _ in e.value.errors] == [3]
+
+    # And the results of all the other chunks
+    assert e.value.results[:3] != [None] * 3
+    assert e.value.results[3:6] == [None] * 3
+
+
+def test_chunking_adapters_shut_down_their_thread_pools_when_closed(memory_adapter):
+    # Given that I have a chunking adapter that has run some chunks
+    with adapters.ChunkingAdapter(memory_adapter, chunk_size=3) as adapter:
+        adapter.get_multi([Key(BankAccount, i) for i in range(1, 11)])
+        threads = set(adapter.executor._threads)
+        assert threads
+
+    # When it's closed
+    # Then its worker threads should have exited
+    assert not any(thread.is_alive() for thread in threads)
@@ -0,0 +1,273 @@
+import lzma
+import sys
+import tracemalloc
+import zlib
+
+import pytest
+
+from anom import props
+from anom.compression import Codec, _codecs, _codecs_by_id, _missing_codecs, register_codec
+from unittest.mock import patch
+
+from . import models
+
+codec_names = sorted(name for name in _codecs if name != "raw")
+
+
+@pytest.mark.parametrize("codec", codec_names)
+@pytest.mark.parametrize("value", ["", "a", "a" * 1000, "ünïcode " * 100])
+def test_codecs_can_compress_and_decompress_values(codec, value):
+    # Given that I have a compressed text property that uses some codec
+    prop = props.Text(compressed=True, codec=codec)
+
+    # When I store a value and load it back
+    loaded_value = prop.prepare_to_load(None, prop.prepare_to_store(None, value))
+
+    # Then I should get back the same value
+    assert loaded_value == value
+
+
+@pytest.mark.parametrize("codec", codec_names)
+def test_compressed_values_can_be_loaded_after_changing_codecs(codec):
+    # Given that I have some values compressed by every codec
+    value = "a" * 1000
+    stored_values = [props.Text(compressed=True, codec=name).prepare_to_store(None, value) for name in codec_names]
+
+    # When I load them using a property that uses some codec
+    # Then I should always get back the original value
+    prop = props.Text(compressed=True, codec=codec)
+    for stored_value in stored_values:
+        assert prop.prepare_to_load(None, stored_value) == value
+
+
+@pytest.mark.parametrize("stored_value,value", [
+    (zlib.compress(b"a" * 1000), "a" * 1000),
+    (b"plain text", "plain text"),
+    (b"x^ is not zlib data", "x^ is not zlib data"),
+])
+def test_compressed_properties_can_load_old_values(stored_value, value):
+    # Given that I have a value stored by an older version of anom or
+    # before its property was made compressed
+    # When I load that value using a compressed property
+    # Then I should get back the original value
+    assert props.Text(compressed=True, codec="lzma").prepare_to_load(None, stored_value) == value
+
+
+def test_compressed_properties_store_small_values_uncompressed():
+    # Given that I have a compressed property w/ a minimum size
+    prop = props.Text(compressed=True, min_size=100)
+
+    # When I store a small value
+    stored_value = prop.prepare_to_store(None, "a" * 99)
+
+    # Then it should be stored uncompressed
+    assert stored_value == b"a" * 99
+
+    # When I store a large value
+    stored_value = prop.prepare_to_store(None, "a" * 100)
+
+    # Then it should be stored compressed
+    assert len(stored_value) < 100
+
+
+@pytest.mark.parametrize("value", [b"\xff\xac\x01", b"x^", b"x\x9c"])
+def test_small_values_that_look_compressed_are_loaded_as_they_are(value):
+    # Given that I have a compressed property w/ a minimum size
+    prop = props.Bytes(compressed=True, min_size=100)
+
+    # When I store a small value that looks like it's compressed and load it back
+    loaded_value = prop.prepare_to_load(None, prop.prepare_to_store(None, value))
+
+    # Then I should get back the same value
+    assert loaded_value == value
+
+
+def test_compressed_properties_require_registered_codecs():
+    with pytest.raises(ValueError):
+        props.Text(compressed=True, codec="invalid")
+
+
+@pytest.mark.parametrize("codec,level", [("zlib", 10), ("zlib", -2), ("lzma", 10)])
+def test_compressed_properties_require_valid_levels(codec, level):
+    with pytest.raises(ValueError):
+        props.Text(compressed=True, codec=codec, compression_level=level)
+
+
+@pytest.mark.parametrize("stored_value", [b"\xff", b"\xff\xac", b"\xff\xac\xfe", b"\xff\xac\xfe data"])
+def test_compressed_properties_load_values_that_only_look_compressed_as_they_are(stored_value):
+    # Given that I have a value stored before its property was made
+    # compressed that's too short to have a header or whose header
+    # refers to an unknown codec
+    # When I load that value using a compressed property
+    # Then I should get back the original value
+    assert props.Bytes(compressed=True).prepare_to_load(None, stored_value) == stored_value
+
+
+def test_compressed_properties_fail_to_load_values_compressed_with_codecs_that_arent_installed():
+    # Given that a built-in codec's library isn't installed
+    with patch.dict(_missing_codecs, {250: "missing"}):
+        # When I load a value that was compressed with that codec
+        # Then a ValueError should be raised
+        with pytest.raises(ValueError):
+            props.Text(compressed=True).prepare_to_load(None, b"\xff\xac\xfa data")
+
+
+def test_codecs_can_be_registered():
+    # Given that I've registered a custom codec
+    class ReversingCodec(Codec):
+        name = "reversing"
+        id = 200
+        levels = range(1)
+        default_level = 0
+
+        def compress(self, data, level):
+            return bytes(data)[::-1]
+
+        def decompress(self, data):
+            return bytes(data)[::-1]
+
+    register_codec(ReversingCodec())
+    try:
+        # When I store a value with a property that uses that codec
+        prop = props.Text(compressed=True, codec="reversing")
+        stored_value = prop.prepare_to_store(None, "abc")
+
+        # Then it should be compressed with that codec
+        assert stored_value == b"\xff\xac\xc8cba"
+
+        # And I should be able to load it back
+        assert prop.prepare_to_load(None, stored_value) == "abc"
+
+    finally:
+        del _codecs["reversing"]
+        del _codecs_by_id[200]
+
+
+def test_codec_ids_must_fit_in_a_byte():
+    class InvalidCodec(Codec):
+        name = "invalid"
+        id = 256
+
+    with pytest.raises(ValueError):
+        register_codec(InvalidCodec())
+
+
+@pytest.mark.parametrize("prop", [props.Json(compressed=True), props.Msgpack(compressed=True, codec="lzma")])
+def test_serializers_can_be_compressed(prop):
+    # Given that I have a compressed serializer property
+    value = {"a": ["b" * 100]}
+
+    # When I store a value and load it back
+    loaded_value = prop.prepare_to_load(None, prop.prepare_to_store(None, value))
+
+    # Then I should get back the same value
+    assert loaded_value == value
+
+
+def test_entities_with_compressed_json_properties_can_be_stored(adapter):
+    # Given that I have an entity w/ a compressed Json property
+    entity = models.ModelWithCompressedJsonProperty(j={"a": ["b" * 100]}).put()
+
+    # When I get it back
+    # Then its property should have the value that was stored
+    assert entity.key.get().j == {"a": ["b" * 100]}
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_compressed_properties_can_load_any_bytes_like_value(wrap):
+    # Given that I have a compressed value
+    prop = props.Text(compressed=True)
+    stored_value = prop.prepare_to_store(None, "ünïcode " * 100)
+
+    # When I load it from some bytes-like object
+    # Then I should get back the original value
+    assert prop.prepare_to_load(None, wrap(stored_value)) == "ünïcode " * 100
+    assert props.Bytes(compressed=True).prepare_to_load(None, wrap(stored_value)) == ("ünïcode " * 100).encode()
+
+
+@pytest.mark.parametrize("codec", codec_names)
+def test_large_compressed_text_values_are_decoded_across_chunks(codec):
+    # Given that I have a compressed value much larger than a chunk w/
+    # multi-byte characters that straddle chunk boundaries
+    prop = props.Text(compressed=True, codec=codec)
+    value = "".join(f"{i}: ünïcode €\n" for i in range(20000))
+
+    # When I store it and load it back
+    loaded_value = prop.prepare_to_load(None, prop.prepare_to_store(None, value))
+
+    # Then I should get back the same value
+    assert loaded_value == value
+
+
+@pytest.mark.parametrize("value", [
+    "".join(f"Line {i}: the quick brown fox jumps over the lazy dog.\n" for i in range(20000)),
+    "".join(f"Line {i}: the quick brown fox jumps over the lazy dog €.\n" for i in range(20000)),
+])
+def test_large_compressed_text_values_are_loaded_using_about_one_copy_of_their_text(value):
+    # Given that I have a large compressed text value
+    prop = props.Text(compressed=True, codec="zlib")
+    stored_value = prop.prepare_to_store(None, value)
+
+    # When I load it while tracing memory allocations
+    tracemalloc.start()
+    try:
+        loaded_value = prop.prepare_to_load(None, stored_value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Then I should get back the same value
+    assert loaded_value == value
+
+    # And the peak amount of memory used should be close to the size of the text
+    assert peak < sys.getsizeof(value) * 1.25
+
+
+def test_truncated_compressed_text_values_fail_to_load():
+    # Given that I have a compressed value that's been truncated
+    prop = props.Text(compressed=True, codec="zlib")
+    stored_value = prop.prepare_to_store(None, "a" * 100000)
+
+    # When I load it
+    # Then a zlib error should be raised
+    with pytest.raises(zlib.error):
+        prop.prepare_to_load(None, stored_value[:-4])
+
+
+@pytest.mark.parametrize("prop,value", [
+    (props.Bytes(compressed=True, codec="lzma"), b"a" * 100000),
+    (props.Text(compressed=True, codec="lzma"), "a" * 100000),
+])
+def test_truncated_lzma_values_fail_to_load(prop, value):
+    # Given that I have an lzma value that's been truncated
+    stored_value = prop.prepare_to_store(None, value)[:-10]
+
+    # When I load it
+    # Then an lzma error should be raised
+    with pytest.raises(lzma.LZMAError):
+        prop.prepare_to_load(None, stored_value)
+
+
+@pytest.mark.parametrize("prop", [props.Bytes(compressed=True), props.Text(compressed=True)])
+@pytest.mark.parametrize("stored_value", [
+    zlib.compress(b"hello world" * 100)[:-5],
+    zlib.compress(b"hello world" * 100)[:20],
+    zlib.compress(b"hello world" * 100)[:-4] + b"\x00\x00\x00\x00",
+])
+def test_truncated_or_corrupt_zlib_values_fail_to_load(prop, stored_value):
+    # Given that I have a zlib value that's been truncated or corrupted
+    # When I load it using a compressed property
+    # Then a zlib error should be raised rather than it being loaded as it is
+    with pytest.raises(zlib.error):
+        prop.prepare_to_load(None, stored_value)
+
+
+@pytest.mark.parametrize("wrap", [bytearray, memoryview])
+@pytest.mark.parametrize("stored_value", [b"plain", b"\xff\xac\x00\xff\xac\x01", b"x^ is not zlib data"])
+def test_compressed_bytes_properties_always_load_bytes(wrap, stored_value):
+    # Given that I have a raw value stored in some bytes-like object
+    # When I load it using a compressed bytes property
+    loaded_value = props.Bytes(compressed=True).prepare_to_load(None, wrap(stored_value))
+
+    # Then I should get back bytes
+    assert type(loaded_value) is bytes
@@ -171,3 +171,111 @@ def test_embed_properties_can_generate_sort_orders():
     assert -SplitTest.variations.weight == "-variations.weight"
     assert +DeepA.child.child.child.x == "child.child.child.x"
     assert -DeepA.child.child.child.x == "-child.child.child.x"
+
+
+class Address(Model):
+    street = props.String()
+    point = props.Embed(kind=DeepD)
+
+
+class Contact(Model):
+    name = props.String()
+    home = props.Embed(kind=Address)
+    work = props.Embed(name="office", kind=Address)
+    others = props.Embed(kind=Address, repeated=True)
+
+
+def test_embedded_entities_are_loaded_from_their_own_values(adapter):
+    # Given that I have an entity w/ several embeds that share a model
+    contact = Contact(
+        name="Jim",
+        home=Address(street="Home St", point=DeepD(x=1)),
+        work=Address(street="Work St", point=DeepD(x=2)),
+        others=[
+            Address(street="Other St", point=DeepD(x=3)),
+            Address(street="Another St", point=DeepD(x=4)),
+        ],
+    )
+
+    # When I save that entity
+    contact.put()
+
+    # And load it back
+    loaded = contact.key.get()
+
+    # Then each embed should only be loaded from its own values
+    assert loaded == contact
+    assert loaded.home.point.x == 1
+    assert loaded.work.point.x == 2
+    assert [address.point.x for address in loaded.others] == [3, 4]
+
+
+def test_repeated_embedded_properties_without_values_load_as_empty_lists():
+    # Given that I have the data of a split test w/o any variations
+    data = {"name": b"A split test", "slug": b"a-split-test"}
+
+    # When I load that data
+    split_test = SplitTest._load(None, data)
+
+    # Then its variations should be empty
+    assert split_test.variations == []
+
+
+class LineItem(Model):
+    sku = props.String(indexed=True)
+    quantity = props.Integer()
+    price = props.Float()
+    note = props.Embed(kind=OptionalNested, optional=True)
+
+
+class Order(Model):
+    line_items = props.Embed(kind=LineItem, repeated=True)
+
+
+def test_can_embed_lists_of_entities_with_many_properties(adapter):
+    # Given that I have an order with many line items
+    order = Order(line_items=[
+        LineItem(sku=f"sku-{i}", quantity=i, price=i / 2, note=OptionalNested(x=i))
+        for i in range(50)
+    ])
+
+    # When I save that order
+    order.put()
+
+    # Then I should be able to retrieve that same data from datastore
+    assert order == order.key.get()
+
+    # And each property should be stored as a list of values
+    properties = dict(order)
+    assert properties["line_items.quantity"] == list(range(50))
+    assert properties["line_items.note.x"] == list(range(50))
+
+    # And only the sku should be indexed
+    assert sorted(order.unindexed_properties) == [
+        "line_items.note.x",
+        "line_items.price",
+        "line_items.quantity",
+    ]
+
+
+def test_repeated_embedded_entities_require_their_values():
+    # Given that I have an order with a line item that's missing a value
+    order = Order(line_items=[LineItem(sku="a", quantity=1, price=1.0), LineItem(sku="b", price=1.0)])
+
+    # When I try to store that order
+    # Then I should get back a runtime error
+    with pytest.raises(RuntimeError):
+        dict(order)
+
+
+def test_repeated_embedded_entities_must_have_the_same_properties():
+    # Given that I have an order where only some line items have notes
+    order = Order(line_items=[
+        LineItem(sku="a", quantity=1, price=1.0, note=OptionalNested(x=1)),
+        LineItem(sku="b", quantity=1, price=1.0),
+    ])
+
+    # When I try to store that order
+    # Then I should get back a value error
+    with pytest.raises(ValueError):
+        dict(order)
@@ -21,3 +21,9 @@ def test_delete_multi_can_be_called_with_empty_list(adapter):
 def test_get_and_multi_can_be_called_with_empty_list(adapter):
     for fn in (get_multi, put_multi):
         assert fn([]) == []
+
+
+def test_get_multi_returns_duplicate_keys_in_every_position(person):
+    other = Person(email="other@example.com", first_name="Other").put()
+    assert get_multi([person.key, other.key, person.key]) == [person, other, person]
+    other.delete()
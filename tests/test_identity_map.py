@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+from anom import Key, get_identity_map, get_multi, identity_map, put_multi, transactional
+
+from .models import BankAccount
+
+
+def test_identity_map_serves_repeated_lookups_from_memory(memory_adapter):
+    # Given that I have a stored entity
+    account = BankAccount(balance=42).put()
+
+    with identity_map() as entities:
+        # When I look it up twice within an identity map block
+        with patch.object(memory_adapter, "get_multi", wraps=memory_adapter.get_multi) as get_multi_mock:
+            first = account.key.get()
+            second = account.key.get()
+
+        # Then the adapter should only have been called once
+        assert get_multi_mock.call_count == 1
+
+        # And I should get back the same instance both times
+        assert first is second
+
+        # And the counters should reflect that
+        assert (entities.hits, entities.misses) == (1, 1)
+
+    # And the identity map should no longer be active outside the block
+    assert get_identity_map() is None
+
+
+def test_identity_map_caches_missing_entities(memory_adapter):
+    with identity_map() as entities:
+        # When I look up a missing entity twice
+        key = Key(BankAccount, 42)
+        assert get_multi([key, key]) == [None, None]
+        assert key.get() is None
+
+        # Then only the first lookup should have missed
+        assert (entities.hits, entities.misses) == (1, 2)
+
+
+def test_identity_map_is_updated_by_puts_and_deletes(memory_adapter):
+    with identity_map() as entities:
+        # Given that I've stored an entity
+        account = BankAccount(balance=42).put()
+
+        # When I get it
+        # Then it should be served from the map
+        assert account.key.get() is account
+        assert entities.hits == 1
+
+        # When I delete it
+        account.delete()
+
+        # Then it should have been evicted from the map
+        assert account.key not in entities
+        assert account.key.get() is None
+
+
+def test_identity_map_is_bypassed_inside_transactions(memory_adapter):
+    # Given that I have a stored entity
+    account = BankAccount(balance=42).put()
+
+    @transactional()
+    def update():
+        account = BankAccount.get(account_id)
+        account.balance += 1
+        return put_multi([account])[0]
+
+    with identity_map() as entities:
+        # And that entity is in the map
+        account_id = account.key.int_id
+        cached = account.key.get()
+
+        # When I update it inside a transaction
+        updated = update()
+
+        # Then the transaction should have bypassed the map
+        assert updated is not cached
+        assert (entities.hits, entities.misses) == (0, 1)
+
+        # And the entity should have been evicted
+        assert account.key.get().balance == 43
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from anom import Key, get_multi
@@ -136,3 +138,79 @@ def test_keys_are_hashable():
 ])
 def test_keys_build_up_parents_from_path(case, expected):
     assert case == expected
+
+
+def test_keys_are_immutable():
+    # Given that I have a key
+    key = Key("Person", 1)
+
+    # When I try to change its id
+    # Then an AttributeError should be raised
+    with pytest.raises(AttributeError):
+        key.id_or_name = 2
+
+
+def test_keys_can_be_unpacked():
+    # Given that I have a key with a parent
+    parent = Key("Organization", 1, namespace="a")
+    key = Key("Person", 2, parent=parent)
+
+    # When I unpack it
+    kind, id_or_name, key_parent, namespace = key
+
+    # Then I should get back its components
+    assert (kind, id_or_name, key_parent, namespace) == ("Person", 2, parent, "a")
+
+
+def test_deep_keys_with_equal_paths_are_equal():
+    # Given that I have two deep keys with the same path built up separately
+    first, second = Key.from_path(*["Person", 1] * 50), Key.from_path(*["Person", 1] * 50)
+
+    # Then they should be equal and have the same hash
+    assert first == second
+    assert hash(first) == hash(second)
+
+    # And they should differ from keys in other namespaces
+    assert first != Key.from_path(*["Person", 1] * 50, namespace="a")
+
+
+def test_interned_keys_are_identical():
+    # Given that I have two equal keys
+    first, second = Key("Person", 1), Key("Person", 1)
+
+    # When I intern them
+    # Then I should get back the same object
+    assert first.intern() is second.intern()
+
+
+def test_keys_can_be_pickled():
+    # Given that I have a key with a parent
+    key = Key("Person", 2, parent=Key("Organization", 1, namespace="a"))
+
+    # When I pickle and unpickle it
+    # Then I should get back an equal key
+    assert pickle.loads(pickle.dumps(key)) == key
+
+
+def test_datastore_adapter_round_trips_keys(datastore_adapter):
+    # Given that I have a key with a parent in a custom namespace
+    key = Key("Person", 2, parent=Key("Organization", "a", namespace="ns"))
+
+    # When I convert it to a Datastore key and back
+    converted = datastore_adapter._convert_key_from_datastore(datastore_adapter._convert_key_to_datastore(key))
+
+    # Then I should get back an equal key
+    assert converted == key
+    assert converted.namespace == "ns"
+
+
+def test_datastore_adapter_reuses_converted_parents(datastore_adapter):
+    # Given that I have two Datastore keys with the same parent
+    first = datastore_adapter.client.key("Organization", 1, "Person", 1)
+    second = datastore_adapter.client.key("Organization", 1, "Person", 2)
+
+    # When I convert them
+    # Then their parents should be the same object
+    first_key = datastore_adapter._convert_key_from_datastore(first)
+    second_key = datastore_adapter._convert_key_from_datastore(second)
+    assert first_key.parent is second_key.parent
@@ -0,0 +1,107 @@
+import pytest
+
+from anom import Key, adapters, get_multi, put_multi, transactional
+from unittest.mock import patch
+
+from .conftest import push_adapter
+from .models import BankAccount, ModelWithRepeatedIndexedInteger
+
+
+@pytest.fixture
+def local_cache_adapter(memory_adapter):
+    with push_adapter(adapters.LocalCacheAdapter(memory_adapter)) as adapter:
+        yield adapter
+
+
+def test_local_cache_adapter_serves_repeated_reads_from_memory(local_cache_adapter, memory_adapter):
+    # Given that I have a stored entity
+    account = BankAccount(balance=42).put()
+
+    # When I get it multiple times
+    with patch.object(memory_adapter, "get_multi", wraps=memory_adapter.get_multi) as get_multi_mock:
+        assert account.key.get() == account
+        assert account.key.get() == account
+
+    # Then the wrapped adapter should only have been called once
+    assert get_multi_mock.call_count == 1
+
+
+def test_local_cache_adapter_returns_copies_of_cached_data(local_cache_adapter):
+    # Given that I have a cached entity with a repeated property
+    entity = ModelWithRepeatedIndexedInteger(xs=[1, 2]).put()
+    entity.key.get().xs.append(3)
+
+    # When I get it again
+    # Then the cached data should remain unchanged
+    assert entity.key.get().xs == [1, 2]
+
+
+def test_local_cache_adapter_busts_the_cache_on_writes(local_cache_adapter):
+    # Given that I have a cached entity
+    account = BankAccount(balance=42).put()
+    account.key.get()
+
+    # When I update it
+    account.balance = 43
+    account.put()
+
+    # Then I should get back the new data
+    assert account.key.get().balance == 43
+
+    # When I delete it
+    account.delete()
+
+    # Then I should no longer be able to get it
+    assert account.key.get() is None
+
+
+def test_local_cache_adapter_busts_the_cache_on_commit(local_cache_adapter):
+    @transactional()
+    def update(key):
+        account = key.get()
+        account.balance += 1
+        return account.put()
+
+    # Given that I have a cached entity
+    account = BankAccount(balance=42).put()
+    account.key.get()
+
+    # When I update it inside a transaction
+    update(account.key)
+
+    # Then I should get back the new data
+    assert account.key.get().balance == 43
+
+
+def test_local_cache_adapter_expires_entities_by_kind(memory_adapter):
+    # Given that I have an adapter that caches BankAccounts for a second
+    adapter = adapters.LocalCacheAdapter(memory_adapter, ttls={BankAccount: 1})
+    with push_adapter(adapter):
+        account = BankAccount(balance=42).put()
+
+        with patch("anom.adapters.local_cache_adapter.time.monotonic", return_value=0):
+            account.key.get()
+
+        # When more than a second has passed
+        # Then the entity should be fetched from the wrapped adapter
+        with patch("anom.adapters.local_cache_adapter.time.monotonic", return_value=2), \
+                patch.object(memory_adapter, "get_multi", wraps=memory_adapter.get_multi) as get_multi_mock:
+            assert account.key.get() == account
+            assert get_multi_mock.call_count == 1
+
+
+def test_local_cache_adapter_evicts_least_recently_used_entities(memory_adapter):
+    # Given that I have an adapter with room for about three entities
+    accounts = [BankAccount(key=Key(BankAccount, i), balance=i) for i in range(1, 5)]
+    size = adapters.local_cache_adapter._estimate_size({"balance": 1})
+    adapter = adapters.LocalCacheAdapter(memory_adapter, max_size=size * 3)
+    with push_adapter(adapter):
+        put_multi(accounts)
+
+        # When I get four entities, using the first one again before the last
+        get_multi([account.key for account in accounts[:3]])
+        accounts[0].key.get()
+        accounts[3].key.get()
+
+        # Then the least recently used entity should have been evicted
+        assert list(adapter._entities) == [Key(BankAccount, 3), Key(BankAccount, 1), Key(BankAccount, 4)]
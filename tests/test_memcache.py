@@ -1,7 +1,9 @@
 import pytest
 
-from anom import get_multi
+from anom import Key, get_multi, put_multi
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest.mock import patch
 
 from . import models
 
@@ -15,6 +17,129 @@ def test_get_multi_retrieves_cached_and_non_cached_entities(memcache_adapter):
         assert get_multi([person_1.key, person_2.key]) == [person_1, person_2]
 
 
+class CountingPool:
+    def __init__(self, pool):
+        self.pool = pool
+        self.calls = []
+
+    @contextmanager
+    def reserve(self):
+        with self.pool.reserve() as client:
+            yield CountingClient(client, self.calls)
+
+
+class CountingClient:
+    def __init__(self, client, calls):
+        self.client = client
+        self.calls = calls
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def call(*args, **kwargs):
+            self.calls.append(name)
+            return method(*args, **kwargs)
+
+        return call
+
+
+def uncache(adapter, keys):
+    # Writes keep keys locked for a little while so this clears them
+    # in order to get a cold cache.
+    with adapter.client_pool.reserve() as client:
+        client.delete_multi([adapter._convert_key_to_memcache(key) for key in keys])
+
+
+def test_cold_get_multi_uses_a_constant_number_of_round_trips(memcache_adapter):
+    round_trips = []
+    for size in (1, 20):
+        people = put_multi([
+            models.Person(email=f"{i}@example.com", first_name=f"Person {i}") for i in range(size)
+        ])
+        uncache(memcache_adapter, [person.key for person in people])
+
+        client_pool = CountingPool(memcache_adapter.client_pool)
+        with patch.object(memcache_adapter, "client_pool", client_pool):
+            assert get_multi([person.key for person in people]) == people
+
+        round_trips.append(client_pool.calls)
+
+    assert round_trips[0] == round_trips[1] == ["get_multi", "add_multi"]
+
+    # And the entities should have been cached
+    client_pool = CountingPool(memcache_adapter.client_pool)
+    with patch.object(memcache_adapter, "client_pool", client_pool):
+        assert get_multi([person.key for person in people]) == people
+
+    assert client_pool.calls == ["get_multi"]
+
+
+def test_get_multi_does_not_cache_missing_entities(memcache_adapter):
+    # Given that I have a key w/o an entity
+    key = Key(models.Person, "missing@example.com")
+
+    # When I get it
+    assert get_multi([key]) == [None]
+
+    # Then nothing should have been cached for it
+    with memcache_adapter.client_pool.reserve() as client:
+        assert client.get(memcache_adapter._convert_key_to_memcache(key)) is None
+
+
+def test_get_multi_does_not_cache_anything_on_failure(memcache_adapter):
+    # Given that I have a stored entity that isn't cached
+    person = models.Person(email="someone@example.com", first_name="Person").put()
+    uncache(memcache_adapter, [person.key])
+
+    # When getting it from Datastore fails
+    with patch.object(memcache_adapter.adapter, "get_multi", side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            get_multi([person.key])
+
+    # Then nothing should have been cached for it
+    with memcache_adapter.client_pool.reserve() as client:
+        assert client.get(memcache_adapter._convert_key_to_memcache(person.key)) is None
+
+    # And I should be able to get it
+    assert get_multi([person.key]) == [person]
+
+
+def test_get_multi_does_not_cache_entities_that_are_written_while_filling(memcache_adapter):
+    # Given that I have a stored entity that isn't cached
+    person = models.Person(email="someone@example.com", first_name="Person").put()
+    uncache(memcache_adapter, [person.key])
+
+    # And it gets updated right after it's read from Datastore
+    get_from_datastore = memcache_adapter.adapter.get_multi
+
+    def get_then_update(keys):
+        entities = get_from_datastore(keys)
+        person.first_name = "Updated"
+        person.put()
+        return entities
+
+    # When I get it
+    with patch.object(memcache_adapter.adapter, "get_multi", side_effect=get_then_update):
+        assert get_multi([person.key])[0].first_name == "Person"
+
+    # Then the data from before the update shouldn't have been cached
+    assert person.key.get().first_name == "Updated"
+
+
+def test_get_multi_does_not_cache_entities_after_slow_fills(memcache_adapter):
+    # Given that I have a stored entity that isn't cached
+    person = models.Person(email="someone@example.com", first_name="Person").put()
+    uncache(memcache_adapter, [person.key])
+
+    # When I get it and reading it from Datastore takes too long
+    with patch("anom.adapters.memcache_adapter.time.monotonic", side_effect=[0, 10]):
+        assert get_multi([person.key]) == [person]
+
+    # Then nothing should have been cached for it
+    with memcache_adapter.client_pool.reserve() as client:
+        assert client.get(memcache_adapter._convert_key_to_memcache(person.key)) is None
+
+
 @pytest.mark.skip(reason="Flaky.")
 def test_delete_wins_under_contention(memcache_adapter):
     person = models.Person(email="someone@example.com", first_name="Person").put()
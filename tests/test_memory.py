@@ -0,0 +1,86 @@
+import pytest
+
+from anom import Transaction, get_multi, put_multi
+from anom.transaction import TransactionFailed
+
+from .models import BankAccount, ModelWithIndexedInteger, ModelWithInteger, ModelWithRepeatedIndexedInteger
+
+
+def test_memory_adapter_allocates_ids_for_partial_keys(memory_adapter):
+    # Given that I have two entities without ids
+    # When I store them
+    first, second = put_multi([BankAccount(balance=1), BankAccount(balance=2)])
+
+    # Then they should each be assigned a distinct id
+    assert not first.key.is_partial
+    assert first.key != second.key
+
+
+def test_memory_adapter_returns_copies_of_stored_data(memory_adapter):
+    # Given that I have a stored entity with a repeated property
+    entity = ModelWithRepeatedIndexedInteger(xs=[1, 2]).put()
+
+    # When I mutate a loaded copy of that entity
+    entity.key.get().xs.append(3)
+
+    # Then the stored data should remain unchanged
+    assert entity.key.get().xs == [1, 2]
+
+
+def test_memory_adapter_doesnt_return_unindexed_properties_in_filtered_queries(memory_adapter):
+    # Given that I have an entity with an unindexed property
+    ModelWithInteger(x=1).put()
+
+    # When I filter on that property
+    # Then I should get back no results
+    assert list(ModelWithInteger.query().where(("x", "=", 1)).run()) == []
+
+
+def test_memory_adapter_orders_repeated_properties_by_their_extremes(memory_adapter):
+    # Given that I have entities with repeated values
+    a = ModelWithRepeatedIndexedInteger(xs=[1, 10]).put()
+    b = ModelWithRepeatedIndexedInteger(xs=[5]).put()
+
+    # When I sort them ascending
+    # Then each entity should be ordered by its smallest value
+    assert list(ModelWithRepeatedIndexedInteger.query().order_by(+ModelWithRepeatedIndexedInteger.xs).run()) == [a, b]
+
+    # When I sort them descending
+    # Then each entity should be ordered by its largest value
+    assert list(ModelWithRepeatedIndexedInteger.query().order_by(-ModelWithRepeatedIndexedInteger.xs).run()) == [a, b]
+
+
+def test_memory_adapter_cursors_are_stable_across_deletes(memory_adapter):
+    # Given that I have a number of entities
+    entities = put_multi([ModelWithIndexedInteger(x=x) for x in range(10)])
+
+    # And I fetch the first page of results ordered by x
+    query = ModelWithIndexedInteger.query().order_by(-ModelWithIndexedInteger.x)
+    page_1 = query.paginate(page_size=3).fetch_next_page()
+    assert list(page_1) == entities[:-4:-1]
+
+    # When I delete the entities on that page
+    # Then the cursor should still point to the next page
+    memory_adapter.delete_multi([entity.key for entity in entities[-3:]])
+    page_2 = query.paginate(page_size=3, cursor=page_1.cursor).fetch_next_page()
+    assert list(page_2) == entities[-4:-7:-1]
+
+
+def test_memory_adapter_fails_transactions_that_read_stale_data(memory_adapter, executor):
+    # Given that I have a bank account
+    account = BankAccount(balance=10).put()
+
+    # And I read it inside a transaction
+    transaction = memory_adapter.transaction(Transaction.Propagation.Nested)
+    transaction.begin()
+    get_multi([account.key])
+
+    # When that account is modified by another thread
+    account.balance = 20
+    executor.submit(account.put).result()
+
+    # Then committing the transaction should fail
+    with pytest.raises(TransactionFailed):
+        transaction.commit()
+
+    transaction.end()
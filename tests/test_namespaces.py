@@ -160,3 +160,18 @@ def test_datastore_client_uses_the_default_namespace(adapter):
 
     # Then I shuold get nothing back
     assert users == [None, None]
+
+
+def test_namespaces_can_be_copied_into_executors(default_namespace, executor):
+    # Given that I have set the local namespace to "anomspace"
+    with anom.namespace("anomspace"):
+        # When I submit a function to an executor with the current context
+        # Then it should see the same namespace
+        assert anom.submit_with_context(executor, anom.get_namespace).result() == "anomspace"
+
+        # When I bind a function to the current context
+        get_namespace = anom.bind_context(anom.get_namespace)
+
+    # Then it should see the namespace even after it's been changed
+    assert executor.submit(get_namespace).result() == "anomspace"
+    assert anom.get_namespace() == default_namespace
@@ -1,5 +1,6 @@
 import inspect
 import json
+import pickle
 import msgpack
 import pytest
 
@@ -90,6 +91,13 @@ def test_jsons_dump_and_load_entities(person, mutant, human):
         assert loaded_entity == entity
 
 
+def test_jsons_dump_keys_as_lists():
+    key = Key("Person", 2, parent=Key("Organization", 1, namespace="a"))
+    assert props.Json().prepare_to_store(None, key) == json.dumps(
+        ["Person", 2, ["Organization", 1, None, "a"], "a"], separators=(",", ":")
+    )
+
+
 def test_jsons_fail_to_dump_invalid_data():
     with pytest.raises(TypeError):
         props.Json().prepare_to_store(None, object())
@@ -191,6 +199,97 @@ def test_named_properties_assign_values_to_the_appropriate_slots():
     assert dict(entity) == {models.ModelWithCustomPropertyName.x.name_on_entity: 42}
 
 
+def test_named_properties_are_loaded_from_the_appropriate_slots():
+    entity = models.ModelWithCustomPropertyName._load(Key(models.ModelWithCustomPropertyName, 1), {"y": 42})
+    assert entity.x == 42
+
+
+def test_lazy_properties_are_decoded_on_first_access():
+    # Given that I have an entity with a lazy Json property
+    entity = models.ModelWithLazyJsonProperty._load(
+        Key(models.ModelWithLazyJsonProperty, 1), {"j": '{"a":1}', "x": 1},
+    )
+
+    # Then its value shouldn't be decoded when the entity is loaded
+    assert "j" not in entity._data
+
+    # When I access it
+    # Then it should be decoded and cached on the entity
+    assert entity.j == {"a": 1}
+    assert entity._data["j"] is entity.j
+    assert not entity._lazy_data
+
+
+def test_models_can_make_all_of_their_properties_lazy():
+    # Given that I have an entity of a lazy model
+    text = props.Text(compressed=True).prepare_to_store(None, "hello")
+    entity = models.LazyModel._load(Key(models.LazyModel, 1), {"text": text, "j": '{"a":1}'})
+
+    # Then its properties should be lazy unless they opt out
+    assert "text" not in entity._data
+    assert entity._data["j"] == {"a": 1}
+    assert entity.text == "hello"
+
+
+def test_lazy_properties_can_be_assigned_before_they_are_accessed():
+    # Given that I have an entity with a lazy property that hasn't been accessed
+    entity = models.ModelWithLazyJsonProperty._load(
+        Key(models.ModelWithLazyJsonProperty, 1), {"j": '{"a":1}', "x": 1},
+    )
+
+    # When I assign to that property
+    entity.j = {"b": 2}
+
+    # Then the raw value should be discarded
+    assert entity.j == {"b": 2}
+    assert not entity._lazy_data
+
+
+def test_entities_with_lazy_properties_can_be_stored_and_pickled(memory_adapter):
+    # Given that I have a stored entity with a lazy property
+    entity = models.ModelWithLazyJsonProperty(j={"a": 1}, x=1).put()
+
+    # When I load it and store it again without accessing that property
+    loaded = entity.key.get()
+    loaded.x = 2
+    loaded.put()
+
+    # Then the property's value should be preserved
+    assert entity.key.get().j == {"a": 1}
+
+    # And the entity should be picklable
+    assert pickle.loads(pickle.dumps(entity.key.get())).j == {"a": 1}
+
+
+def test_properties_that_override_prepare_to_load_are_loaded_using_it():
+    class Doubled(props.Integer):
+        def prepare_to_load(self, entity, value):
+            return value * 2
+
+    class ModelWithDoubledInteger(Model):
+        x = Doubled()
+
+    entity = ModelWithDoubledInteger._load(Key(ModelWithDoubledInteger, 1), {"x": 21})
+    assert entity.x == 42
+
+
+def test_properties_that_override_prepare_to_store_are_stored_using_it():
+    class Halved(props.Integer):
+        def prepare_to_store(self, entity, value):
+            return None if value is None else value // 2
+
+    class ModelWithHalvedInteger(Model):
+        x = Halved()
+        y = props.Integer()
+
+    # Overridden properties are responsible for their own checks.
+    assert dict(ModelWithHalvedInteger(x=42, y=1)) == {"x": 21, "y": 1}
+    assert dict(ModelWithHalvedInteger(y=1)) == {"x": None, "y": 1}
+
+    with pytest.raises(RuntimeError):
+        dict(ModelWithHalvedInteger(x=42))
+
+
 def test_deleting_properties_unsets_them_on_their_models():
     entity = models.ModelWithInteger(x=42)
 
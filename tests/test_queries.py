@@ -1,9 +1,16 @@
 import pytest
+import time
 
-from anom import Query
-from anom.query import PropertyFilter
+from array import array
+from datetime import datetime, timedelta, timezone
 
-from .models import Person, temp_person
+from anom import Adapter, Query, put_multi
+from anom.adapter import QueryResponse
+from anom.query import PropertyFilter, QueryOptions
+from threading import Semaphore
+from unittest.mock import patch
+
+from .models import ModelWithOptionalIndexedInteger, Person, temp_person
 
 
 def test_queries_can_fail_to_get_single_items(adapter):
@@ -33,6 +40,110 @@ def test_queries_can_project_fields(people):
     assert one_person.last_name is None
 
 
+def test_projected_entities_only_load_projected_fields(people):
+    # Given that I've run a projection query
+    one_person = Person.query().select(Person.email).get()
+
+    # Then only the projected properties should be loaded
+    assert list(one_person._data) == ["email"]
+    assert one_person.email
+
+
+def test_projected_entities_cannot_be_stored(people):
+    # Given that I have an entity that was loaded from a projection query
+    one_person = Person.query().select(Person.email).get()
+
+    # When I try to store it
+    # Then a RuntimeError should be raised
+    with pytest.raises(RuntimeError):
+        one_person.put()
+
+
+def test_queries_can_return_rows(memory_adapter):
+    # Given that I have a person
+    person = Person(email="john@example.com", first_name="John").put()
+
+    # When I iterate over the rows of a query
+    rows = list(Person.query().iter_rows())
+
+    # Then I should get back tuples of its key and property values
+    assert rows == [(person.key, "john@example.com", "John", None, None, person.created_at)]
+
+    # When I iterate over them as dicts
+    # Then I should get back dicts keyed by property name
+    row = next(Person.query().iter_rows(as_dicts=True))
+    assert row["key"] == person.key
+    assert row["email"] == "john@example.com"
+
+
+def test_queries_can_return_projected_and_keys_only_rows(memory_adapter):
+    # Given that I have a person
+    person = Person(email="john@example.com", first_name="John").put()
+
+    # When I iterate over the rows of a projection query
+    # Then I should only get back the projected values
+    assert list(Person.query().select(Person.email).iter_rows()) == [(person.key, "john@example.com")]
+
+    # When I iterate over the rows of a keys-only query
+    # Then I should only get back keys
+    assert list(Person.query().iter_rows(keys_only=True, as_dicts=True)) == [{"key": person.key}]
+
+
+def test_queries_can_fetch_typed_columns(memory_adapter):
+    # Given that I have a few people
+    people = put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(3)])
+
+    # When I fetch some of their properties as columns
+    columns = Person.query().fetch_columns(Person.email, Person.created_at)
+
+    # Then I should get back a column per property along with their keys
+    assert columns["key"] == [person.key for person in people]
+    assert columns["email"] == [person.email for person in people]
+
+    # And DateTime values should be stored as microseconds in a typed array
+    assert isinstance(columns["created_at"], array)
+    assert columns["created_at"].tolist() == [
+        (person.created_at - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1)
+        for person in people
+    ]
+
+
+def test_typed_columns_fall_back_to_lists_when_values_are_missing(memory_adapter):
+    # Given that I have entities with and without a value for an optional property
+    put_multi([ModelWithOptionalIndexedInteger(x=1), ModelWithOptionalIndexedInteger(x=None)])
+
+    # When I fetch that property as a column
+    columns = ModelWithOptionalIndexedInteger.query().fetch_columns(ModelWithOptionalIndexedInteger.x)
+
+    # Then I should get back a list column containing all of the values
+    assert columns["x"] == [1, None]
+
+
+def test_queries_can_iterate_over_chunks_of_columns(memory_adapter):
+    # Given that I have a few people
+    put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(5)])
+
+    # When I iterate over chunks of their columns
+    chunks = list(Person.query().iter_columns(Person.email, chunk_size=2))
+
+    # Then each chunk should contain at most that many values
+    assert [len(chunk["email"]) for chunk in chunks] == [2, 2, 1]
+
+
+def test_queries_can_fetch_numpy_columns(memory_adapter):
+    numpy = pytest.importorskip("numpy")
+
+    # Given that I have a few people
+    put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(3)])
+
+    # When I fetch their columns as NumPy arrays
+    columns = Person.query().fetch_columns(Person.email, Person.created_at, as_numpy=True)
+
+    # Then I should get back NumPy arrays of the appropriate types
+    assert columns["email"].dtype == numpy.dtype(object)
+    assert columns["created_at"].dtype == numpy.dtype("datetime64[us]")
+
+
 def test_queries_can_be_filtered(people):
     all_people = Person.query().where(Person.email == "1@example.com").run()
     assert list(all_people) == people[0:1]
@@ -193,3 +304,161 @@ def test_can_count_entities_by_query(people):
     # When my query doesn't match any results
     # Then I should get back a count of 0
     assert 0 == Person.query().where(Person.email == "idontexist").count()
+
+
+def test_queries_can_prefetch_batches(people):
+    # When I run a query that prefetches batches in the background
+    # Then I should get back all the results in order
+    assert list(Person.query().run(batch_size=3, prefetch=2)) == people
+
+    # And limits should still be respected
+    assert list(Person.query().with_limit(5).run(batch_size=3, prefetch=2)) == people[:5]
+
+
+def test_prefetched_pages_have_the_same_cursors_as_regular_pages(people):
+    pages = Person.query().paginate(page_size=3)
+    prefetched_pages = Person.query().paginate(page_size=3, prefetch=2)
+    for page, prefetched_page in zip(pages, prefetched_pages):
+        assert list(prefetched_page) == list(page)
+        assert prefetched_page.cursor == page.cursor
+        assert prefetched_pages.has_more == pages.has_more
+
+    assert not prefetched_pages.has_more
+
+
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_prefetching_fetches_a_bounded_number_of_batches(memory_adapter, prefetch):
+    # Given that I have a few people
+    put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(5)])
+
+    # And I'm watching for the background worker to wait for a free slot
+    acquiring = Semaphore(0)
+
+    class WatchedSemaphore(Semaphore):
+        def acquire(self, *args, **kwargs):
+            acquiring.release()
+            return super().acquire(*args, **kwargs)
+
+    # When I run a query that prefetches some number of batches
+    with patch("anom.query.Semaphore", WatchedSemaphore):
+        with patch.object(memory_adapter, "query", wraps=memory_adapter.query) as query_mock:
+            resultset = Person.query().run(batch_size=1, prefetch=prefetch)
+            next(resultset)
+
+            # And the worker waits for a slot to fetch the batch after the ones it's allowed to
+            for _ in range(prefetch + 2):
+                assert acquiring.acquire(timeout=5)
+
+            # Then the current batch and prefetch batches ahead of it should have been fetched
+            assert query_mock.call_count == prefetch + 1
+
+
+def test_queries_stream_lazily_converted_results(memory_adapter):
+    # Given that I have a few people
+    put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(5)])
+
+    # And an adapter that converts query results as they are iterated over
+    converted, query = [], memory_adapter.query
+
+    class LazyEntities:
+        def __init__(self, entities):
+            self.entities = entities
+
+        def __len__(self):
+            return len(self.entities)
+
+        def __iter__(self):
+            for key, data in self.entities:
+                converted.append(key)
+                yield key, data
+
+    def lazy_query(*args):
+        entities, cursor = query(*args)
+        return QueryResponse(entities=LazyEntities(entities), cursor=cursor)
+
+    # When I run a limited query against it
+    with patch.object(memory_adapter, "query", wraps=lazy_query):
+        resultset = Person.query().with_limit(3).run(batch_size=2)
+        first = next(resultset)
+
+        # Then results should only be converted as they're consumed
+        assert converted == [first.key]
+
+        # And the limit should be respected
+        assert len([first] + list(resultset)) == 3
+        assert len(converted) == 3
+
+
+def test_entities_loaded_from_queries_take_ownership_of_their_data(memory_adapter):
+    # Given that I have a stored person
+    person = Person(email="john@example.com", first_name="John").put()
+
+    # When I load it from data that is handed over to it
+    data = {"email": "john@example.com", "first_name": "John"}
+    loaded = Person._load(person.key, data, owned=True)
+
+    # Then that data should become the entity's data
+    assert loaded._data is data
+    assert (loaded.email, loaded.first_name) == ("john@example.com", "John")
+
+
+def test_can_count_entities_by_query_with_offset_and_limit(people):
+    assert Person.query().with_offset(5).count() == len(people) - 5
+    assert Person.query().with_limit(5).count(page_size=3) == 5
+
+
+def test_adapters_can_count_entities_by_paginating(memory_adapter):
+    # Given that I have some number of people
+    put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(5)])
+
+    # When I count them using the default implementation
+    # Then I should get back that number of people
+    query, options = Person.query(), QueryOptions(Person.query(), batch_size=2)
+    assert Adapter.count(memory_adapter, query, options) == 5
+    assert Adapter.count(memory_adapter, query.with_limit(3), options) == 3
+
+
+def test_adapters_can_count_entities_across_short_pages():
+    # Given that I have an adapter that returns pages shorter than the batch size
+    pages = [[(f"key-{i}", {})] for i in range(3)] + [[]]
+
+    class ShortPagesAdapter(Adapter):
+        def query(self, query, options):
+            index = int(options.cursor or 0)
+            return QueryResponse(entities=pages[index], cursor=str(index + 1))
+
+    # When I count entities using the default implementation
+    # Then every page should be counted
+    query = Person.query()
+    assert Adapter.count(ShortPagesAdapter(), query, QueryOptions(query, batch_size=2)) == 3
+
+
+def test_can_delete_entities_by_query_concurrently(memory_adapter):
+    # Given that I have many people
+    put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(10)])
+
+    # When I delete them in batches of three with up to two batches in flight
+    progress = []
+    deleted = Person.query().delete(page_size=3, concurrency=2, progress=progress.append)
+
+    # Then I should get back the total number of deleted people
+    assert deleted == 10
+
+    # And progress should have been reported after every batch
+    assert progress == [3, 6, 9, 10]
+
+    # And there should be no people left
+    assert Person.query().count() == 0
+
+
+def test_can_rate_limit_deleting_entities_by_query(memory_adapter):
+    # Given that I have some people
+    put_multi([Person(email=f"{i}@example.com", first_name="Person") for i in range(4)])
+
+    # When I delete them at a rate of at most 20 per second in batches of two
+    started_at = time.monotonic()
+    deleted = Person.query().delete(page_size=2, rate_limit=20)
+
+    # Then the second batch should have been delayed
+    assert deleted == 4
+    assert time.monotonic() - started_at >= 0.1
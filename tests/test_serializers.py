@@ -0,0 +1,190 @@
+import math
+import msgpack
+import pytest
+
+from anom import Key, props
+from anom.serializers import (
+    StdlibJsonBackend, get_json_backend, register_json_backend, set_default_json_backend,
+)
+from anom.serializers import _backends
+from dataclasses import dataclass
+from datetime import datetime
+from dateutil.tz import tzutc
+
+backend_names = sorted(_backends)
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_can_dump_and_load_anom_values(backend):
+    # Given that I have a Json property that uses some backend
+    prop = props.Json(backend=backend)
+
+    # And a value with some non-standard values inside it
+    value = {
+        "blob": b"\x00\xff",
+        "when": datetime(2017, 1, 1, tzinfo=tzutc()),
+        "key": Key("Person", 1),
+        "nested": [{"x": 1.5, "y": None, "z": "é"}],
+    }
+
+    # When I dump that value and load it back
+    loaded_value = prop.prepare_to_load(None, prop.prepare_to_store(None, value))
+
+    # Then I should get back the same value
+    assert loaded_value == dict(value, key=list(value["key"]))
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_can_dump_and_load_entities(backend, person):
+    # Given that I have a Json property that uses some backend
+    prop = props.Json(backend=backend)
+
+    # When I dump an entity and load it back
+    loaded_person = prop.prepare_to_load(None, prop.prepare_to_store(None, person))
+
+    # Then I should get back the same entity
+    assert loaded_person == person
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_can_load_each_others_values(backend):
+    # Given that I have a value dumped by every backend
+    value = {"when": datetime(2017, 1, 1, tzinfo=tzutc()), "big": 2 ** 70, "text": "é/"}
+    dumped_values = [props.Json(backend=name).prepare_to_store(None, value) for name in backend_names]
+
+    # When I load each of those values using some backend
+    # Then I should always get back the original value
+    prop = props.Json(backend=backend)
+    for dumped_value in dumped_values:
+        assert prop.prepare_to_load(None, dumped_value) == value
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_can_dump_and_load_non_finite_floats(backend):
+    # Given that I have a Json property that uses some backend
+    prop = props.Json(backend=backend)
+
+    # When I dump a value containing non-finite floats and load it back
+    data = prop.prepare_to_store(None, {"nan": float("nan"), "inf": [float("inf"), float("-inf")]})
+    loaded_value = prop.prepare_to_load(None, data)
+
+    # Then they should have been written the way the standard library writes them
+    assert data == '{"nan":NaN,"inf":[Infinity,-Infinity]}'
+
+    # And I should get back the same values
+    assert math.isnan(loaded_value["nan"])
+    assert loaded_value["inf"] == [float("inf"), float("-inf")]
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_dump_the_same_documents(backend):
+    # Given that I have a value w/ non-ASCII text and values of non-standard types
+    value = {
+        "text": "é😀\u2028/",
+        "when": datetime(2017, 1, 1, tzinfo=tzutc()),
+        "key": Key("Person", 1),
+        "blob": b"\x00\xff",
+        "nested": [{"x": 1.5, "y": None, "z": True}],
+        "big": 2 ** 70,
+        "nan": float("nan"),
+    }
+
+    # When I dump it using some backend
+    # Then I should get back the same document as with the standard library
+    assert props.Json._dumps(value, backend=backend) == props.Json._dumps(value, backend="json")
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_hand_dataclasses_to_the_default_hook(backend):
+    # Given that I have a dataclass
+    @dataclass
+    class Point:
+        x: int
+
+    # When I dump it using some backend
+    # Then it should be rejected the same way the standard library rejects it
+    with pytest.raises(TypeError):
+        props.Json._dumps({"point": Point(1)}, backend=backend)
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_fail_to_dump_invalid_data(backend):
+    with pytest.raises(TypeError):
+        props.Json(backend=backend).prepare_to_store(None, {"x": object()})
+
+
+@pytest.mark.parametrize("backend", backend_names)
+def test_json_backends_fail_to_load_invalid_data(backend):
+    with pytest.raises(ValueError):
+        props.Json(backend=backend).prepare_to_load(None, "{")
+
+
+@pytest.mark.parametrize("backend", [None] + backend_names)
+def test_json_can_dump_and_load_values_at_the_class_level(backend):
+    # Given that I have a value with non-standard values inside it
+    value = {"when": datetime(2017, 1, 1, tzinfo=tzutc())}
+
+    # When I dump it and load it back without a property, like Msgpack can
+    loaded_value = props.Json._loads(props.Json._dumps(value, backend=backend), backend=backend)
+
+    # Then I should get back the same value
+    assert loaded_value == value
+
+
+def test_json_properties_require_registered_backends():
+    with pytest.raises(ValueError):
+        props.Json(backend="invalid")
+
+
+def test_json_backends_can_be_registered_and_made_the_default():
+    # Given that I've registered a custom backend
+    class CountingBackend(StdlibJsonBackend):
+        dumps_count = 0
+
+        def dumps(self, value, default):
+            self.dumps_count += 1
+            return super().dumps(value, default)
+
+    backend = register_json_backend(CountingBackend(name="counting"))
+    assert get_json_backend("counting") is backend
+
+    # When I make it the default
+    old_backend = set_default_json_backend("counting")
+    try:
+        # And dump a value using a Json property w/o a backend
+        props.Json().prepare_to_store(None, {"x": 1})
+
+    finally:
+        set_default_json_backend(old_backend)
+        _backends.pop("counting")
+
+    # Then that backend should have been used
+    assert backend.dumps_count == 1
+
+
+def test_json_default_backend_must_be_registered():
+    with pytest.raises(ValueError):
+        set_default_json_backend("invalid")
+
+
+def test_msgpacks_can_dump_values_after_failing_to_dump_others():
+    # Given that I've failed to dump a value
+    with pytest.raises(TypeError):
+        props.Msgpack._dumps({"x": [1, 2, object()]})
+
+    # When I dump another value
+    data = props.Msgpack._dumps({"y": 1})
+
+    # Then none of the failed value's data should be included
+    assert data == msgpack.packb({"y": 1}, use_bin_type=True)
+
+
+def test_msgpacks_can_dump_and_load_nested_extensions(person):
+    # Given that I have a value that contains an entity that contains datetimes
+    value = {"person": person, "when": datetime(2017, 1, 1, tzinfo=tzutc())}
+
+    # When I dump that value and load it back
+    loaded_value = props.Msgpack._loads(props.Msgpack._dumps(value))
+
+    # Then I should get back the same value
+    assert loaded_value == value
@@ -1,6 +1,7 @@
 import pytest
 
-from anom import Transaction, RetriesExceeded, get_multi, put_multi, transactional
+from anom import Transaction, RetriesExceeded, adapters, get_multi, put_multi, submit_with_context, transactional
+from anom.transaction import TransactionFailed
 from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
@@ -120,13 +121,18 @@ def test_transactions_can_be_independent(person):
     assert person.first_name == "Iohan"
 
 
-def test_transactions_can_run_out_of_retries(person):
+def test_transactions_can_run_out_of_retries(adapter, person):
     @transactional()
     def failing(person_key):
         pass
 
-    with patch("google.cloud.datastore.Transaction.commit") as commit_mock:
-        commit_mock.side_effect = RuntimeError
+    commit_target, commit_error = "google.cloud.datastore.Transaction.commit", RuntimeError
+    if isinstance(adapter, adapters.InMemoryAdapter):
+        commit_target = "anom.adapters.memory_adapter.InMemoryAdapter._commit"
+        commit_error = TransactionFailed("Failed to commit transaction.")
+
+    with patch(commit_target) as commit_mock:
+        commit_mock.side_effect = commit_error
 
         with pytest.raises(RetriesExceeded):
             failing(person.key)
@@ -151,3 +157,22 @@ def test_deferred_keys_behave_like_normal_keys(adapter):
     assert person_1.key == person_2.key
     assert person_1.key.path == person_2.key.path
     assert str(person_1.key) == str(person_2.key)
+
+
+def test_transactions_can_be_copied_into_executors(memory_adapter, executor):
+    @transactional()
+    def transfer(source_key, target_key, amount):
+        # Given that I load entities in a worker thread inside a transaction
+        source, target = submit_with_context(executor, get_multi, [source_key, target_key]).result()
+        source.balance -= amount
+        target.balance += amount
+
+        # When I store them in another worker thread
+        submit_with_context(executor, put_multi, [source, target]).result()
+
+        # Then the writes should be part of the transaction
+        assert [a.balance for a in executor.submit(get_multi, [source_key, target_key]).result()] == [10, 0]
+
+    source, target = put_multi([BankAccount(balance=10), BankAccount(balance=0)])
+    transfer(source.key, target.key, 5)
+    assert [a.balance for a in get_multi([source.key, target.key])] == [5, 5]